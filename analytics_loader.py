@@ -0,0 +1,39 @@
+import argparse
+import logging
+import signal
+from threading import Event
+
+from src.configs.config import Config
+from src.consumers.order.order_analytics_loader import OrderAnalyticsLoader
+from src.models.repositories.analytics.adapters.order_analytics_duckdb_adapter import (
+    OrderAnalyticsDuckDBAdapter,
+)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Load order events from Kafka into the columnar analytics store.",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Compact every month of the store and exit instead of consuming.",
+    )
+    args = parser.parse_args()
+
+    runtime_configs = Config.global_config()
+    logging.basicConfig(
+        level=runtime_configs.ENVIRONMENT.log_level,
+        format="{'time':'%(asctime)s', 'name': '%(name)s', \
+        'level': '%(levelname)s', 'message': '%(message)s'}",
+    )
+
+    if args.compact:
+        store = OrderAnalyticsDuckDBAdapter(runtime_configs.ORDER_ANALYTICS)
+        for month in store.months():
+            store.compact(month)
+    else:
+        stop_event = Event()
+        signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+        signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+        OrderAnalyticsLoader(runtime_configs.ORDER_ANALYTICS, runtime_configs.ORDER_INDEXER).run(stop_event)
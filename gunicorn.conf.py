@@ -0,0 +1,30 @@
+"""Gunicorn settings for serving the API from a preloaded app (make run-preload)."""
+
+import gc
+import importlib
+import os
+
+from src.configs.config import settings
+
+wsgi_app = "manage:app"
+worker_class = "uvicorn_worker.UvicornWorker"
+# The app is imported once in the master and inherited by every forked worker,
+# so a new worker skips the imports and only runs the lifespan.
+preload_app = True
+bind = f"{settings.FASTAPI.SERVE_HOST}:{settings.FASTAPI.SERVE_PORT}"
+workers = settings.FASTAPI.WORKERS_COUNT or os.cpu_count() or 1
+backlog = settings.FASTAPI.BACKLOG
+keepalive = settings.FASTAPI.TIMEOUT_KEEP_ALIVE
+graceful_timeout = settings.FASTAPI.TIMEOUT_GRACEFUL_SHUTDOWN or 30
+accesslog = "-" if settings.FASTAPI.ACCESS_LOG else None
+
+
+def on_starting(server):
+    for module in settings.STARTUP.PRELOAD_MODULES:
+        importlib.import_module(module)
+
+
+def pre_fork(server, worker):
+    # Keeps the preloaded objects out of the collector, whose reference-count
+    # writes would otherwise copy the shared pages into every worker.
+    gc.freeze()
@@ -0,0 +1,27 @@
+import argparse
+import logging
+
+from src.configs.config import Config
+from src.consumers.order.order_indexer import run_order_indexer
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Index order events from Kafka into Elasticsearch.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes. Defaults to ORDER_INDEXER__WORKERS_COUNT.",
+    )
+    args = parser.parse_args()
+
+    runtime_configs = Config.global_config()
+    logging.basicConfig(
+        level=runtime_configs.ENVIRONMENT.log_level,
+        format="{'time':'%(asctime)s', 'name': '%(name)s', \
+        'level': '%(levelname)s', 'message': '%(message)s'}",
+    )
+
+    run_order_indexer(workers_count=args.workers)
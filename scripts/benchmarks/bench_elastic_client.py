@@ -0,0 +1,86 @@
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from archipy.adapters.elasticsearch.adapters import AsyncElasticsearchAdapter
+
+from src.configs.config import settings
+from src.configs.elastic_client import TunedAsyncElasticsearchAdapter, close, warm_up
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def burst(adapter: AsyncElasticsearchAdapter, index: str, concurrency: int, requests: int) -> list[float]:
+    """
+    Sends requests with bounded concurrency and returns their latencies in milliseconds.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await adapter.client.search(index=index, size=10, query={"match_all": {}})
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return latencies
+
+
+async def run_trial(factory, warm: bool, args: argparse.Namespace) -> list[float]:
+    adapter = factory()
+    try:
+        if warm:
+            await warm_up(adapter)
+        return await burst(adapter, args.index, args.concurrency, args.requests)
+    finally:
+        await close(adapter)
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    variants = {
+        "default client, cold": (AsyncElasticsearchAdapter, False),
+        "tuned client, cold": (TunedAsyncElasticsearchAdapter, False),
+        "tuned client, warm": (TunedAsyncElasticsearchAdapter, True),
+    }
+    tuned = TunedAsyncElasticsearchAdapter()
+    print(
+        f"{args.trials} trials of the first {args.requests} searches at concurrency {args.concurrency} "
+        f"on {args.index}; tuned pool {tuned.connections_per_node} connections/node"
+    )
+    await close(tuned)
+
+    print(f"{'variant':<24} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, (factory, warm) in variants.items():
+        latencies = []
+        for _ in range(args.trials):
+            latencies.extend(await run_trial(factory, warm, args))
+        print(
+            f"{name:<24} {statistics.median(latencies):>9.1f} {percentile(latencies, 0.99):>9.1f} "
+            f"{max(latencies):>9.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare first-request latency of a cold and a pre-warmed Elasticsearch client.",
+    )
+    parser.add_argument("--index", default=settings.ORDER_INDEX_NAME)
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent searches, like a burst of API traffic.")
+    parser.add_argument("--requests", type=int, default=200, help="Searches per trial, starting on a new client.")
+    parser.add_argument("--trials", type=int, default=5)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
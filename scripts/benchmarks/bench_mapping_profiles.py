@@ -0,0 +1,145 @@
+import argparse
+import io
+import json
+import os
+import statistics
+import struct
+import sys
+import time
+
+from elasticsearch import Elasticsearch
+from elasticsearch.helpers import bulk
+from fastavro import parse_schema, schemaless_writer
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from scripts.locust.locust_file import generate_unified_order_payload
+from src.configs.config import settings
+from src.models.entities.order_index import (
+    MAPPING_PROFILES,
+    OrderIndex,
+    build_order_mapping,
+)
+from src.models.mappers.order_avro_decoder import (
+    ORDER_EVENTS_SCHEMA_PATH,
+    OrderAvroDecoder,
+)
+
+SCHEMA_ID = 1
+STATUSES = ["PROCESSING", "CONFIRMED", "DELIVERED", "COMPLETED"]
+
+
+def build_documents(count: int) -> list[dict]:
+    """
+    Generates orders and runs them through the ingest decoder, so they have the indexed ``{"order": ...}`` shape.
+    """
+    with open(ORDER_EVENTS_SCHEMA_PATH) as f:
+        raw_schema = json.load(f)
+    schema = parse_schema(raw_schema)
+    decoder = OrderAvroDecoder()
+    decoder.register_writer_schema(SCHEMA_ID, raw_schema)
+
+    header = struct.pack(">bI", 0, SCHEMA_ID)
+    documents = []
+    for index in range(count):
+        payload = generate_unified_order_payload(status=STATUSES[index % len(STATUSES)])
+        buffer = io.BytesIO()
+        buffer.write(header)
+        schemaless_writer(buffer, schema, payload)
+        documents.append(decoder.decode(buffer.getvalue()))
+    return documents
+
+
+def build_queries(profile: str, sample: dict) -> dict[str, dict]:
+    order = sample["order"]
+    queries = {
+        "national_id": {"term": {"order.party.nationalId.keyword": order["party"]["nationalId"]}},
+        "recent_by_status": {
+            "bool": {
+                "filter": [
+                    {"term": {"order.status.keyword": order["status"]}},
+                    {"range": {"order.createdAt": {"gte": "now-1d"}}},
+                ],
+            },
+        },
+    }
+    sku_mode = MAPPING_PROFILES[profile]["productOrderItems"]
+    sku_term = {"term": {"order.productOrderItems.sku": order["productOrderItems"][0]["sku"]}}
+    if sku_mode == "nested":
+        queries["item_sku"] = {"nested": {"path": "order.productOrderItems", "query": sku_term}}
+    elif sku_mode == "object":
+        queries["item_sku"] = sku_term
+    return queries
+
+
+def run_profile(client: Elasticsearch, profile: str, documents: list[dict], searches: int) -> dict:
+    index = f"orders-bench-{profile}"
+    client.indices.delete(index=index, ignore_unavailable=True)
+    client.indices.create(
+        index=index,
+        settings={
+            **OrderIndex.Index.settings,
+            "number_of_shards": 1,
+            "number_of_replicas": 0,
+            "refresh_interval": "-1",
+        },
+        mappings=build_order_mapping(profile),
+    )
+
+    actions = ({"_index": index, "_id": doc["order"]["orderId"], "_source": doc} for doc in documents)
+    started = time.perf_counter()
+    indexed, errors = bulk(client, actions, chunk_size=1000, raise_on_error=False)
+    client.indices.refresh(index=index)
+    indexing_seconds = time.perf_counter() - started
+    if errors:
+        print(f"  {profile}: {len(errors)} indexing errors, e.g. {errors[0]}")
+
+    client.indices.forcemerge(index=index, max_num_segments=1)
+    stats = client.indices.stats(index=index, metric="store,docs")["_all"]["primaries"]
+
+    latencies = {}
+    for name, query in build_queries(profile, documents[0]).items():
+        samples = []
+        for _ in range(searches):
+            query_started = time.perf_counter()
+            client.search(index=index, query=query, size=10, request_cache=False)
+            samples.append((time.perf_counter() - query_started) * 1000)
+        samples.sort()
+        latencies[name] = {
+            "p50_ms": round(statistics.median(samples), 2),
+            "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 2),
+        }
+
+    client.indices.delete(index=index)
+    return {
+        "docs_per_second": round(indexed / indexing_seconds),
+        "store_mb": round(stats["store"]["size_in_bytes"] / 1024**2, 2),
+        "lucene_docs": stats["docs"]["count"],
+        "search": latencies,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare index size, indexing rate and search latency between mapping profiles.",
+    )
+    parser.add_argument("--documents", type=int, default=50000)
+    parser.add_argument("--searches", type=int, default=200)
+    parser.add_argument("--profiles", nargs="+", default=list(MAPPING_PROFILES), choices=list(MAPPING_PROFILES))
+    args = parser.parse_args()
+
+    client = Elasticsearch(hosts=settings.ELASTIC.HOSTS, request_timeout=300)
+    print(f"Generating {args.documents:,} orders...")
+    documents = build_documents(args.documents)
+
+    results = {}
+    for profile in args.profiles:
+        print(f"Benchmarking profile '{profile}'...")
+        results[profile] = run_profile(client, profile, documents, args.searches)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+import argparse
+import io
+import json
+import os
+import struct
+import sys
+import time
+from datetime import datetime, timezone
+
+from fastavro import parse_schema, schemaless_reader, schemaless_writer
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.models.dtos.order.order_repository_interface_dtos import OrderDocumentEntity
+from src.models.mappers.order_avro_decoder import (
+    ORDER_EVENTS_SCHEMA_PATH,
+    OrderAvroDecoder,
+)
+from src.models.mappers.order_es_mapper import to_es
+
+SCHEMA_ID = 1
+
+
+def build_sample_order(index: int) -> dict:
+    now = datetime.now(tz=timezone.utc)
+    return {
+        "order": {
+            "orderId": f"ORD-{index:010d}",
+            "status": "PROCESSING",
+            "createdAt": now.isoformat(),
+            "updatedAt": now.isoformat(),
+            "channel": "ONLINE_WEB",
+            "customerAccount": {
+                "accountId": f"ACC-{index % 50000}",
+                "type": "INDIVIDUAL",
+                "loyaltyTier": "GOLD",
+                "vip": False,
+                "customerSince": None,
+                "preferredLanguage": "fa",
+            },
+            "party": {
+                "nationalId": f"{index % 10**10:010d}",
+                "fullName": "Sara Ahmadi",
+                "contactPoints": {
+                    "mobile": "+989121234567",
+                    "email": "sara.ahmadi@example.com",
+                    "preferredMethod": "SMS",
+                },
+                "birthDate": None,
+                "gender": "FEMALE",
+            },
+            "priceSummary": {
+                "totalAmount": 2500000,
+                "discountAmount": 250000,
+                "payableAmount": 2250000,
+                "currency": "IRR",
+            },
+            "appliedDiscounts": [],
+            "productOrderItems": [
+                {
+                    "itemId": f"ITEM-{index}-{n}",
+                    "productId": "PROD-100",
+                    "sku": "SKU-1000",
+                    "status": "PROCESSING",
+                    "type": "PHYSICAL",
+                    "quantity": 1,
+                    "unitPrice": 1250000,
+                    "totalPrice": 1250000,
+                    "stockLocation": "Warehouse-1",
+                    "attributes": {
+                        "brand": "Acme",
+                        "model": "Model-X",
+                        "mac_id": "00:1b:44:11:3a:b7",
+                        "category": "Electronics",
+                    },
+                }
+                for n in range(2)
+            ],
+            "serviceOrderItems": [],
+            "shipmentOrders": [],
+            "payment": [
+                {
+                    "method": "ONLINE_GATEWAY",
+                    "status": "SUCCESSFUL",
+                    "provider": "SamanBank",
+                    "transactions": [
+                        {
+                            "id": f"TX-{index}",
+                            "type": "SALE",
+                            "amount": 2250000,
+                            "processedAt": now,
+                            "authorizationCode": "a1b2c3",
+                        },
+                    ],
+                },
+            ],
+            "invoices": [],
+            "returns": [],
+            "communications": [],
+            "auditTrail": [
+                {
+                    "timestamp": now,
+                    "action": "STATUS_UPDATE",
+                    "performedBy": "SYSTEM",
+                    "details": {"field": "status", "from": "CONFIRMED", "to": "PROCESSING"},
+                },
+            ],
+        },
+    }
+
+
+def encode_messages(schema: dict, count: int) -> list[bytes]:
+    header = struct.pack(">bI", 0, SCHEMA_ID)
+    messages = []
+    for index in range(count):
+        buffer = io.BytesIO()
+        buffer.write(header)
+        schemaless_writer(buffer, schema, build_sample_order(index))
+        messages.append(buffer.getvalue())
+    return messages
+
+
+def legacy_decode(schema: dict, messages: list[bytes]) -> list[dict]:
+    documents = []
+    for message in messages:
+        buffer = io.BytesIO(message)
+        buffer.seek(5)
+        value = schemaless_reader(buffer, schema, None)
+        documents.append(to_es(OrderDocumentEntity.model_validate(value)).to_dict())
+    return documents
+
+
+def measure(name: str, func, messages: list[bytes], rounds: int) -> float:
+    best = 0.0
+    for _ in range(rounds):
+        cpu_start = time.process_time()
+        func(messages)
+        cpu_elapsed = time.process_time() - cpu_start
+        best = max(best, len(messages) / cpu_elapsed)
+    print(f"{name:<28} {best:>12,.0f} msg/s/core")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark order event decoding throughput in messages/second/core.",
+    )
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    with open(ORDER_EVENTS_SCHEMA_PATH) as f:
+        raw_schema = json.load(f)
+    schema = parse_schema(raw_schema)
+    messages = encode_messages(schema, args.messages)
+
+    decoder = OrderAvroDecoder()
+    decoder.register_writer_schema(SCHEMA_ID, raw_schema)
+
+    print(f"Decoding {args.messages:,} messages, best of {args.rounds} rounds (CPU time)")
+    legacy = measure("generic + pydantic + dsl", lambda m: legacy_decode(schema, m), messages, args.rounds)
+    fast = measure("precompiled decoder", decoder.decode_batch, messages, args.rounds)
+    print(f"Speedup: {fast / legacy:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime
+
+import msgspec
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.models.dtos.order.order_domain_interface_dtos import SearchOrdersOutputDTO
+from src.models.dtos.order.order_dto import OrderRoot
+from src.models.dtos.order.order_structs import SearchOrdersResponseStruct, decode_order, encode_response
+
+
+def build_es_order(index: int) -> dict:
+    """
+    An order as stored in the index, with every nested type populated.
+    """
+    timestamp = f"2025-08-{index % 28 + 1:02d}T10:{index % 60:02d}:00.123000Z"
+    return {
+        "orderId": f"ORD-{index:010d}",
+        "status": ["PROCESSING", "SHIPPED", "DELIVERED", "COMPLETED"][index % 4],
+        "createdAt": timestamp,
+        "updatedAt": timestamp,
+        "channel": "ONLINE_WEB",
+        "customerAccount": {
+            "accountId": f"ACC-{index % 50000}",
+            "type": "INDIVIDUAL",
+            "loyaltyTier": "GOLD",
+            "vip": index % 7 == 0,
+            "customerSince": "2021-03-04",
+            "preferredLanguage": "fa",
+        },
+        "party": {
+            "nationalId": f"{index % 10**10:010d}",
+            "fullName": "Sara Ahmadi",
+            "contactPoints": {"mobile": "+989121234567", "email": "sara.ahmadi@example.com", "preferredMethod": "SMS"},
+            "birthDate": "1990-05-17",
+            "gender": "FEMALE",
+        },
+        "priceSummary": {"totalAmount": 2500000, "discountAmount": 250000, "payableAmount": 2250000, "currency": "IRR"},
+        "appliedDiscounts": [{"code": "WELCOME10", "description": None, "amount": 250000}],
+        "productOrderItems": [
+            {
+                "itemId": f"ITEM-{index}-{n}",
+                "productId": "PROD-100",
+                "sku": "SKU-1000",
+                "status": "PROCESSING",
+                "type": "PHYSICAL",
+                "quantity": 1,
+                "unitPrice": 1250000,
+                "totalPrice": 1250000,
+                "stockLocation": "Warehouse-1",
+                "attributes": {"brand": "Acme", "model": "Model-X", "mac_id": "00:1b:44:11:3a:b7", "category": "Electronics"},
+            }
+            for n in range(2)
+        ],
+        "serviceOrderItems": [
+            {
+                "itemId": f"SRV-{index}",
+                "productId": "PLAN-10",
+                "sku": "SKU-PLAN-10",
+                "status": "CONFIRMED",
+                "type": "DIGITAL_SERVICE",
+                "quantity": 1,
+                "unitPrice": 0,
+                "totalPrice": 0,
+                "bundleId": None,
+                "attributes": {"planType": "DATA", "planName": "10GB", "dataAllowance": "10GB", "bandwidth": "100Mbps", "category": "Mobile"},
+                "provisioning": {
+                    "status": "ACTIVE",
+                    "provisioningType": "NEW_ACTIVATION",
+                    "targetIdentifier": "+989121234567",
+                    "serviceIds": ["SVC-1"],
+                    "activationDate": timestamp,
+                    "billingStartDate": None,
+                },
+            },
+        ],
+        "shipmentOrders": [
+            {
+                "shipmentId": f"SHP-{index}",
+                "status": "SHIPPED",
+                "trackingNumber": "TRK-1",
+                "carrier": "Peyk",
+                "items": [f"ITEM-{index}-0", f"ITEM-{index}-1"],
+                "address": {"fullAddress": "Valiasr St. 12", "city": "Tehran", "postalCode": "1234567890", "country": "IR"},
+                "history": [{"status": "SHIPPED", "timestamp": timestamp, "recipientName": None}],
+            },
+        ],
+        "payment": [
+            {
+                "method": "ONLINE_GATEWAY",
+                "status": "SUCCESSFUL",
+                "provider": "SamanBank",
+                "transactions": [
+                    {"id": f"TX-{index}", "type": "SALE", "amount": 2250000, "processedAt": timestamp, "authorizationCode": "a1b2c3"},
+                ],
+            },
+        ],
+        "invoices": [
+            {"invoiceId": f"INV-{index}", "status": "PAID", "issueDate": timestamp, "amount": 2250000, "taxAmount": 0, "currency": "IRR"},
+        ],
+        "returns": [],
+        "communications": [],
+        "auditTrail": [
+            {
+                "timestamp": timestamp,
+                "action": "STATUS_UPDATE",
+                "performedBy": "SYSTEM",
+                "details": {"field": "status", "from_": "CONFIRMED", "to": "PROCESSING"},
+            },
+        ],
+    }
+
+
+def build_connector_order(index: int) -> dict:
+    """
+    The same order as the sink connector writes it: timestamp-millis fields as epoch milliseconds, audit `from` under its Avro name.
+    """
+    document = build_es_order(index)
+
+    def epoch_ms(value: str) -> int:
+        return int(datetime.fromisoformat(value).timestamp() * 1000)
+
+    document["createdAt"] = document["updatedAt"] = epoch_ms(document["createdAt"])
+    for item in document["serviceOrderItems"]:
+        item["provisioning"]["activationDate"] = epoch_ms(item["provisioning"]["activationDate"])
+    for shipment in document["shipmentOrders"]:
+        for event in shipment["history"]:
+            event["timestamp"] = epoch_ms(event["timestamp"])
+    for payment in document["payment"]:
+        for transaction in payment["transactions"]:
+            transaction["processedAt"] = epoch_ms(transaction["processedAt"])
+    for invoice in document["invoices"]:
+        invoice["issueDate"] = epoch_ms(invoice["issueDate"])
+    for entry in document["auditTrail"]:
+        entry["timestamp"] = epoch_ms(entry["timestamp"])
+        # The connector writes Avro field names, while older indexer documents carry `from_`.
+        entry["details"]["from"] = entry["details"].pop("from_")
+    return document
+
+
+def pydantic_page(documents: list[dict]) -> bytes:
+    items = [OrderRoot.model_validate(document) for document in documents]
+    page = SearchOrdersOutputDTO(total=len(items), page=1, size=len(items), total_pages=1, items=items)
+    return page.model_dump_json(by_alias=True).encode()
+
+
+def struct_page(documents: list[dict]) -> bytes:
+    items = [decode_order(document) for document in documents]
+    page = SearchOrdersResponseStruct(total=len(items), page=1, size=len(items), total_pages=1, items=items)
+    return encode_response(page)
+
+
+def check_parity(documents: list[dict]) -> None:
+    """
+    Fails if the struct and Pydantic models decode or encode any document differently.
+    """
+    for document in documents:
+        model = OrderRoot.model_validate(document)
+        struct = decode_order(document)
+        expected = model.model_dump(by_alias=True)
+        actual = msgspec.to_builtins(struct, builtin_types=(datetime, date))
+        if expected != actual:
+            raise AssertionError(f"Decoded {document['orderId']} differs:\n{expected}\n{actual}")
+
+    # Encoded pages must carry the same values; datetimes are compared parsed,
+    # since the two encoders may print fractional seconds differently.
+    def normalize(value):
+        if isinstance(value, dict):
+            return {key: normalize(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [normalize(item) for item in value]
+        if isinstance(value, str) and len(value) >= 20 and value[10:11] == "T":
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                return value
+        return value
+
+    expected_page = normalize(json.loads(pydantic_page(documents)))
+    actual_page = normalize(json.loads(struct_page(documents)))
+    if expected_page != actual_page:
+        raise AssertionError("Encoded search pages differ")
+
+
+def throughput(func, documents: list[dict], rounds: int) -> float:
+    best = 0.0
+    for _ in range(rounds):
+        started = time.process_time()
+        func(documents)
+        best = max(best, len(documents) / (time.process_time() - started))
+    return best
+
+
+def retained_bytes(decode, documents: list[dict]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    decoded = [decode(document) for document in documents]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del decoded
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare Pydantic and msgspec read models: parity, page throughput and memory per hit.",
+    )
+    parser.add_argument("--pages", type=int, default=100, help="Search pages per round.")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    page = [build_es_order(index) for index in range(args.page_size)]
+    check_parity(page)
+    check_parity([build_connector_order(index) for index in range(args.page_size)])
+    print(f"Parity: {len(page)} orders decode and encode identically, with ISO and epoch-ms timestamps")
+
+    def run(encode_page):
+        return lambda documents: [encode_page(documents) for _ in range(args.pages)]
+
+    results = {}
+    for name, encode_page, decode in (
+        ("pydantic", pydantic_page, OrderRoot.model_validate),
+        ("msgspec", struct_page, decode_order),
+    ):
+        orders_per_second = throughput(run(encode_page), page, args.rounds) * args.pages
+        results[name] = (orders_per_second, retained_bytes(decode, page) / len(page))
+
+    print(f"{'model':<10} {'orders/s/core':>14} {'bytes/order':>12}")
+    for name, (orders_per_second, bytes_per_order) in results.items():
+        print(f"{name:<10} {orders_per_second:>14,.0f} {bytes_per_order:>12,.0f}")
+    print(
+        f"Speedup: {results['msgspec'][0] / results['pydantic'][0]:.1f}x, "
+        f"memory: {results['msgspec'][1] / results['pydantic'][1]:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
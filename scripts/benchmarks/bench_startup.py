@@ -0,0 +1,88 @@
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# "import time:       self [us] |  cumulative | imported package"
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+# Modules the API imports lazily; they should not show up in a worker boot.
+LAZY_MODULES = ["duckdb", "pyarrow", "elasticsearch.dsl"]
+
+
+def run_import(module: str, extra_args: list[str]) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": REPO_ROOT, "PYTHONDONTWRITEBYTECODE": "1"}
+    return subprocess.run(
+        [sys.executable, *extra_args, "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def import_breakdown(module: str) -> tuple[dict[str, int], dict[str, int], set[str]]:
+    """
+    Returns cumulative and self import time in microseconds per top-level package, and all imported modules.
+    """
+    output = run_import(module, ["-X", "importtime"]).stderr
+    cumulative: dict[str, int] = defaultdict(int)
+    self_time: dict[str, int] = defaultdict(int)
+    imported = set()
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if not match:
+            continue
+        own, total, indent, name = match.groups()
+        imported.add(name)
+        package = name.split(".")[0]
+        self_time[package] += int(own)
+        # Only the outermost import of a package counts, nested ones are inside its cumulative time.
+        if len(indent) <= 1:
+            cumulative[package] += int(total)
+    return cumulative, self_time, imported
+
+
+def boot_times(module: str, runs: int) -> list[float]:
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        run_import(module, [])
+        times.append((time.perf_counter() - started) * 1000)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Break down API worker import time and measure cold worker boot.",
+    )
+    parser.add_argument("--module", default="manage", help="Module a worker imports at boot.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    cumulative, self_time, imported = import_breakdown(args.module)
+    total = sum(cumulative.values())
+    print(f"Import of '{args.module}': {total / 1000:.0f}ms cumulative")
+    print(f"{'package':<28} {'cumulative ms':>14} {'self ms':>9} {'share':>7}")
+    for package, value in sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"{package:<28} {value / 1000:>14.1f} {self_time[package] / 1000:>9.1f} {value / total:>7.1%}")
+
+    for module in LAZY_MODULES:
+        print(f"{module:<28} {'imported at boot' if module in imported else 'deferred'}")
+
+    times = boot_times(args.module, args.runs)
+    print(
+        f"Cold boot over {args.runs} runs (interpreter + imports): "
+        f"median {statistics.median(times):.0f}ms, min {min(times):.0f}ms, max {max(times):.0f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
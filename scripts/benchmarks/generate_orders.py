@@ -0,0 +1,406 @@
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import struct
+import sys
+import time
+
+import numpy as np
+from fastavro import parse_schema, schemaless_writer
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.configs.config import settings
+from src.models.mappers.order_avro_decoder import ORDER_EVENTS_SCHEMA_PATH
+
+STATUS_MIX = {
+    "PENDING": 0.10,
+    "CONFIRMED": 0.15,
+    "PROCESSING": 0.30,
+    "SHIPPED": 0.15,
+    "DELIVERED": 0.12,
+    "COMPLETED": 0.13,
+    "CANCELLED": 0.05,
+}
+SHIPPED_STATUSES = {"SHIPPED", "DELIVERED", "COMPLETED"}
+ITEM_COUNT_WEIGHTS = [0.55, 0.30, 0.10, 0.05]
+CHANNEL_MIX = {"ONLINE_WEB": 0.5, "MOBILE_APP": 0.35, "CALL_CENTER": 0.1, "RETAIL_STORE": 0.05}
+PAYMENT_STATUS_MIX = {"SUCCESSFUL": 0.85, "PENDING": 0.1, "FAILED": 0.05}
+CATEGORIES = ["Electronics", "Mobile", "Accessories", "Networking", "Home"]
+EMAIL_DOMAINS = ["example.com", "mail.example.org", "shop.example.net"]
+# Unit prices follow a log-normal distribution around ~700k IRR.
+PRICE_LOG_MEAN = 13.5
+PRICE_LOG_SIGMA = 0.8
+CREATED_AT_SPREAD_MS = 30 * 24 * 3600 * 1000
+FRAMING = struct.Struct(">bI")
+LENGTH_PREFIX = struct.Struct(">I")
+
+
+class OrderPools:
+    """
+    Pre-generated identity and attribute pools that orders are assembled from.
+
+    Faker is only used to seed the name, company and city pools once; national
+    IDs, mobiles, emails and account IDs are generated in bulk with NumPy.
+    """
+
+    def __init__(self, rng: np.random.Generator, size: int, seed: int):
+        from faker import Faker
+
+        fake = Faker()
+        fake.seed_instance(seed)
+        first_names = [fake.first_name() for _ in range(500)]
+        last_names = [fake.last_name() for _ in range(500)]
+        first = rng.integers(0, len(first_names), size).tolist()
+        last = rng.integers(0, len(last_names), size).tolist()
+        suffixes = rng.integers(1, 10_000, size).tolist()
+        domains = rng.integers(0, len(EMAIL_DOMAINS), size).tolist()
+
+        self.size = size
+        self.full_names = [f"{first_names[f]} {last_names[l]}" for f, l in zip(first, last)]
+        self.emails = [
+            f"{first_names[f]}.{last_names[l]}{n}@{EMAIL_DOMAINS[d]}".lower()
+            for f, l, n, d in zip(first, last, suffixes, domains)
+        ]
+        self.national_ids = [f"{value:010d}" for value in rng.integers(0, 10**10, size).tolist()]
+        self.mobiles = [f"+989{value:09d}" for value in rng.integers(0, 10**9, size).tolist()]
+        self.account_ids = [f"ACC-{value:08d}" for value in rng.integers(0, 10**8, size).tolist()]
+        self.genders = rng.choice(["MALE", "FEMALE", "UNKNOWN"], size, p=[0.48, 0.48, 0.04]).tolist()
+        self.brands = [fake.company() for _ in range(200)]
+        self.cities = [fake.city() for _ in range(300)]
+        self.addresses = [fake.street_address() for _ in range(1000)]
+
+
+def _choice(rng: np.random.Generator, mix: dict[str, float], size: int) -> list[str]:
+    return rng.choice(list(mix), size, p=list(mix.values())).tolist()
+
+
+def _uuids(rng: np.random.Generator, count: int) -> list[str]:
+    raw = rng.bytes(16 * count).hex()
+    return [
+        f"{raw[i:i + 8]}-{raw[i + 8:i + 12]}-4{raw[i + 13:i + 16]}-a{raw[i + 17:i + 20]}-{raw[i + 20:i + 32]}"
+        for i in range(0, 32 * count, 32)
+    ]
+
+
+class OrderBatchBuilder:
+    """
+    Builds batches of UnifiedOrder payloads from NumPy-sampled distributions.
+
+    All random draws for a batch are vectorized and converted to Python lists
+    once; the per-order loop only assembles dicts.
+    """
+
+    def __init__(self, seed: int, pool_size: int, update_ratio: float):
+        self.rng = np.random.default_rng(seed)
+        self.pools = OrderPools(self.rng, pool_size, seed)
+        self.update_ratio = update_ratio
+        self._recent_ids: list[str] = []
+
+    def build(self, count: int) -> list[dict]:
+        rng, pools = self.rng, self.pools
+
+        order_ids = _uuids(rng, count)
+        if self.update_ratio and self._recent_ids:
+            updates = np.flatnonzero(rng.random(count) < self.update_ratio).tolist()
+            picks = rng.integers(0, len(self._recent_ids), len(updates)).tolist()
+            for position, pick in zip(updates, picks):
+                order_ids[position] = self._recent_ids[pick]
+        self._recent_ids = order_ids
+
+        statuses = _choice(rng, STATUS_MIX, count)
+        channels = _choice(rng, CHANNEL_MIX, count)
+        payment_statuses = _choice(rng, PAYMENT_STATUS_MIX, count)
+        people = rng.integers(0, pools.size, count).tolist()
+        vip = (rng.random(count) < 0.15).tolist()
+
+        now_ms = int(time.time() * 1000)
+        created_ms = now_ms - rng.integers(0, CREATED_AT_SPREAD_MS, count)
+        created_at = np.datetime_as_string(created_ms.astype("datetime64[ms]"), unit="ms", timezone="UTC").tolist()
+        updated_at = np.datetime_as_string(np.datetime64(now_ms, "ms"), unit="ms", timezone="UTC")
+
+        item_counts = rng.choice(len(ITEM_COUNT_WEIGHTS), count, p=ITEM_COUNT_WEIGHTS) + 1
+        item_total = int(item_counts.sum())
+        unit_prices = (np.round(rng.lognormal(PRICE_LOG_MEAN, PRICE_LOG_SIGMA, item_total), -3) + 1000).astype(np.int64)
+        quantities = rng.integers(1, 4, item_total)
+        line_totals = (unit_prices * quantities).tolist()
+        unit_prices, quantities = unit_prices.tolist(), quantities.tolist()
+        item_ids = _uuids(rng, item_total)
+        product_numbers = rng.integers(100, 1000, item_total).tolist()
+        categories = rng.integers(0, len(CATEGORIES), item_total).tolist()
+        brands = rng.integers(0, len(pools.brands), item_total).tolist()
+        discount_fractions = rng.beta(1.2, 8.0, count).tolist()
+        places = rng.integers(0, len(pools.cities), count).tolist()
+        addresses = rng.integers(0, len(pools.addresses), count).tolist()
+
+        orders = []
+        offset = 0
+        for i, items_in_order in enumerate(item_counts.tolist()):
+            status = statuses[i]
+            person = people[i]
+            items = []
+            for j in range(offset, offset + items_in_order):
+                items.append(
+                    {
+                        "itemId": item_ids[j],
+                        "productId": f"PROD-{product_numbers[j]}",
+                        "sku": f"SKU-{product_numbers[j] * 10 + categories[j]}",
+                        "status": status,
+                        "type": "PHYSICAL",
+                        "quantity": quantities[j],
+                        "unitPrice": unit_prices[j],
+                        "totalPrice": line_totals[j],
+                        "stockLocation": "Warehouse-1",
+                        "attributes": {
+                            "brand": pools.brands[brands[j]],
+                            "model": "Model-X",
+                            "mac_id": None,
+                            "category": CATEGORIES[categories[j]],
+                        },
+                    },
+                )
+            total = sum(line_totals[offset : offset + items_in_order])
+            offset += items_in_order
+            discount = int(total * discount_fractions[i]) // 1000 * 1000
+
+            orders.append(
+                {
+                    "order": {
+                        "orderId": order_ids[i],
+                        "status": status,
+                        "createdAt": created_at[i],
+                        "updatedAt": updated_at,
+                        "channel": channels[i],
+                        "customerAccount": {
+                            "accountId": pools.account_ids[person],
+                            "type": "INDIVIDUAL",
+                            "loyaltyTier": "STANDARD",
+                            "vip": vip[i],
+                            "customerSince": None,
+                            "preferredLanguage": "fa",
+                        },
+                        "party": {
+                            "nationalId": pools.national_ids[person],
+                            "fullName": pools.full_names[person],
+                            "contactPoints": {
+                                "mobile": pools.mobiles[person],
+                                "email": pools.emails[person],
+                                "preferredMethod": "SMS",
+                            },
+                            "birthDate": None,
+                            "gender": pools.genders[person],
+                        },
+                        "priceSummary": {
+                            "totalAmount": total,
+                            "discountAmount": discount,
+                            "payableAmount": total - discount,
+                            "currency": "IRR",
+                        },
+                        "appliedDiscounts": [],
+                        "productOrderItems": items,
+                        "serviceOrderItems": [],
+                        "shipmentOrders": [
+                            {
+                                "shipmentId": f"SHP-{order_ids[i]}",
+                                "status": status,
+                                "trackingNumber": None,
+                                "carrier": "Peyk",
+                                "items": [item["itemId"] for item in items],
+                                "address": {
+                                    "fullAddress": pools.addresses[addresses[i]],
+                                    "city": pools.cities[places[i]],
+                                    "postalCode": None,
+                                    "country": "IR",
+                                },
+                                "history": [],
+                            },
+                        ]
+                        if status in SHIPPED_STATUSES
+                        else [],
+                        "payment": [
+                            {
+                                "method": "ONLINE_GATEWAY",
+                                "status": payment_statuses[i],
+                                "provider": "SamanBank",
+                                "transactions": [
+                                    {
+                                        "id": f"TX-{order_ids[i]}",
+                                        "type": "SALE",
+                                        "amount": total - discount,
+                                        "processedAt": now_ms,
+                                        "authorizationCode": None,
+                                    },
+                                ],
+                            },
+                        ],
+                        "invoices": [],
+                        "returns": [],
+                        "communications": [],
+                        "auditTrail": [],
+                    },
+                },
+            )
+        return orders
+
+
+class AvroBatchEncoder:
+    """
+    Serializes order batches into Confluent-framed Avro with a parsed schema and one reused buffer.
+    """
+
+    def __init__(self, schema_id: int, key_schema_id: int | None = None):
+        with open(ORDER_EVENTS_SCHEMA_PATH) as f:
+            self.schema = parse_schema(json.load(f))
+        self.header = FRAMING.pack(0, schema_id)
+        self.key_header = FRAMING.pack(0, key_schema_id) if key_schema_id is not None else None
+        self.buffer = io.BytesIO()
+
+    def encode(self, orders: list[dict]) -> list[bytes]:
+        buffer = self.buffer
+        payloads = []
+        for order in orders:
+            buffer.seek(0)
+            buffer.truncate()
+            buffer.write(self.header)
+            schemaless_writer(buffer, self.schema, order)
+            payloads.append(buffer.getvalue())
+        return payloads
+
+    def encode_key(self, order_id: str) -> bytes:
+        if self.key_header is None:
+            return order_id.encode()
+        # An Avro string is its zig-zag varint length followed by UTF-8 bytes.
+        raw = order_id.encode()
+        length, encoded = len(raw) << 1, bytearray()
+        while length > 0x7F:
+            encoded.append((length & 0x7F) | 0x80)
+            length >>= 7
+        encoded.append(length)
+        return self.key_header + bytes(encoded) + raw
+
+
+def register_schemas(topic: str) -> tuple[int, int]:
+    from confluent_kafka.schema_registry import Schema, SchemaRegistryClient
+
+    client = SchemaRegistryClient({"url": settings.ORDER_INDEXER.SCHEMA_REGISTRY_URL})
+    with open(ORDER_EVENTS_SCHEMA_PATH) as f:
+        value_id = client.register_schema(f"{topic}-value", Schema(f.read(), "AVRO"))
+    key_id = client.register_schema(f"{topic}-key", Schema('"string"', "AVRO"))
+    return value_id, key_id
+
+
+def run_generator(worker_id: int, args: argparse.Namespace, schema_ids: tuple[int, int]) -> dict:
+    builder = OrderBatchBuilder(args.seed + worker_id, args.pool_size, args.update_ratio)
+    encoder = AvroBatchEncoder(*schema_ids) if args.format == "avro" else None
+    producer = output = None
+    if args.sink == "kafka":
+        from confluent_kafka import Producer
+
+        producer = Producer(
+            {
+                "bootstrap.servers": settings.ORDER_INDEXER.BOOTSTRAP_SERVERS,
+                "linger.ms": 20,
+                "batch.size": 1_000_000,
+                "compression.type": "lz4",
+                "queue.buffering.max.messages": 1_000_000,
+            },
+        )
+    elif args.sink == "file":
+        os.makedirs(args.output, exist_ok=True)
+        extension = "bin" if encoder else "ndjson"
+        output = open(os.path.join(args.output, f"orders-{worker_id:03d}.{extension}"), "wb")
+
+    target = args.count // args.processes + (1 if worker_id < args.count % args.processes else 0)
+    generated = payload_bytes = 0
+    started = time.perf_counter()
+    try:
+        while generated < target:
+            orders = builder.build(min(args.batch_size, target - generated))
+            if encoder:
+                payloads = encoder.encode(orders)
+            else:
+                payloads = [json.dumps(order, separators=(",", ":")).encode() for order in orders]
+            payload_bytes += sum(len(payload) for payload in payloads)
+
+            if producer is not None:
+                for order, payload in zip(orders, payloads):
+                    while True:
+                        try:
+                            producer.produce(args.topic, value=payload, key=encoder.encode_key(order["order"]["orderId"]))
+                            break
+                        except BufferError:
+                            producer.poll(0.05)
+                producer.poll(0)
+            elif output is not None:
+                if encoder:
+                    output.write(b"".join(LENGTH_PREFIX.pack(len(payload)) + payload for payload in payloads))
+                else:
+                    output.write(b"\n".join(payloads) + b"\n")
+            generated += len(orders)
+    finally:
+        if producer is not None:
+            producer.flush()
+        if output is not None:
+            output.close()
+    return {"orders": generated, "bytes": payload_bytes, "seconds": time.perf_counter() - started}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate synthetic UnifiedOrder events at high rate for ingest benchmarks.",
+    )
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--pool-size", type=int, default=100_000, help="Distinct customers to draw from.")
+    parser.add_argument("--update-ratio", type=float, default=0.0, help="Share of events that update a recent order.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--format", choices=["avro", "json"], default="avro")
+    parser.add_argument("--sink", choices=["kafka", "file", "null"], default="null")
+    parser.add_argument("--topic", default=settings.ORDER_INDEXER.TOPIC)
+    parser.add_argument(
+        "--output",
+        default="data/generated",
+        help="Directory for --sink file. Avro is written as length-prefixed Confluent-framed payloads.",
+    )
+    parser.add_argument("--schema-id", type=int, default=1, help="Schema ID framed into Avro files.")
+    args = parser.parse_args()
+
+    if args.sink == "kafka":
+        if args.format != "avro":
+            parser.error("--sink kafka requires --format avro")
+        schema_ids = register_schemas(args.topic)
+    else:
+        schema_ids = (args.schema_id, None)
+
+    started = time.perf_counter()
+    with multiprocessing.get_context("spawn").Pool(args.processes) as pool:
+        results = pool.starmap(run_generator, [(worker_id, args, schema_ids) for worker_id in range(args.processes)])
+    elapsed = time.perf_counter() - started
+
+    orders = sum(result["orders"] for result in results)
+    payload_bytes = sum(result["bytes"] for result in results)
+    per_process = [round(result["orders"] / result["seconds"]) for result in results if result["seconds"]]
+    print(
+        json.dumps(
+            {
+                "orders": orders,
+                "sink": args.sink,
+                "format": args.format,
+                "processes": args.processes,
+                "seconds": round(elapsed, 2),
+                "orders_per_second": round(orders / elapsed),
+                "orders_per_second_per_process": per_process,
+                "avg_payload_bytes": round(payload_bytes / orders) if orders else 0,
+            },
+            indent=2,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
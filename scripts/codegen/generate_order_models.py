@@ -0,0 +1,357 @@
+import argparse
+import difflib
+import json
+import keyword
+import os
+import re
+import sys
+from typing import Any
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(REPO_ROOT)
+
+from src.models.types import order_types
+
+SCHEMA_PATH = "schemas/avro/orders/order-events.avsc"
+CODEGEN_PATH = "schemas/avro/orders/order-events.codegen.json"
+DTO_PATH = "src/models/dtos/order/order_dto.py"
+ES_PATH = "src/models/entities/order_document.py"
+
+HEADER = (
+    f"# Generated from {SCHEMA_PATH} and {CODEGEN_PATH}\n"
+    "# by scripts/codegen/generate_order_models.py; do not edit, run `make codegen`.\n"
+)
+
+PYTHON_PRIMITIVES = {
+    "string": "str",
+    "int": "int",
+    "long": "int",
+    "boolean": "bool",
+    "float": "float",
+    "double": "float",
+}
+PYTHON_LOGICAL_TYPES = {
+    "date": "date",
+    "timestamp-millis": "datetime",
+    "timestamp-micros": "datetime",
+}
+ES_FIELD_CLASSES = {"Boolean", "Date", "Integer", "Keyword", "Long", "Nested", "Object", "Text"}
+
+
+class OrderModelGenerator:
+    """
+    Renders the order DTOs and Elasticsearch InnerDocs from the Avro schema.
+
+    The Avro schema decides names, nesting, optionality, defaults and enum
+    symbols; the codegen file only adds what Avro cannot say, such as analyzers
+    or a narrower Python type. Anything the codegen file refers to must exist in
+    the schema, and every mapped StrEnum must accept every Avro symbol, so the
+    generated read models accept whatever the indexer writes.
+    """
+
+    def __init__(self, schema: dict[str, Any], codegen: dict[str, Any]):
+        self.codegen = codegen
+        self.records: dict[str, dict[str, Any]] = {}
+        self.enums: dict[str, dict[str, Any]] = {}
+        self._collect(schema)
+        self.document = self.records[codegen["document_record"]]
+        self.errors: list[str] = []
+
+    def _collect(self, schema: Any) -> None:
+        """
+        Registers named types in post-order, so a record comes after every record it contains.
+        """
+        if isinstance(schema, list):
+            for branch in schema:
+                self._collect(branch)
+        elif isinstance(schema, dict):
+            if schema.get("type") == "enum":
+                self.enums[schema["name"]] = schema
+            elif schema.get("type") == "record":
+                for field in schema["fields"]:
+                    self._collect(field["type"])
+                self.records[schema["name"]] = schema
+            elif schema.get("type") == "array":
+                self._collect(schema["items"])
+
+    def _resolve(self, schema: Any) -> Any:
+        if isinstance(schema, str) and schema in self.records:
+            return self.records[schema]
+        if isinstance(schema, str) and schema in self.enums:
+            return self.enums[schema]
+        if isinstance(schema, dict) and schema.get("type") in PYTHON_PRIMITIVES and "logicalType" not in schema:
+            return schema["type"]
+        return schema
+
+    def _unwrap(self, schema: Any, path: str) -> tuple[Any, bool]:
+        """
+        Returns the non-null branch of a field type and whether it is nullable.
+        """
+        if not isinstance(schema, list):
+            return self._resolve(schema), False
+        branches = [branch for branch in schema if branch != "null"]
+        if len(branches) != 1:
+            self.errors.append(f"{path}: only unions of null and one type are supported")
+        return self._resolve(branches[0]), len(branches) < len(schema)
+
+    def _reachable(self, follow_es: bool = False) -> list[dict[str, Any]]:
+        """
+        Records reachable from the document record, in definition order.
+
+        With follow_es, fields the codegen file maps to a fixed expression are
+        not followed, since their records never appear in the ES mapping.
+        """
+        reachable = {self.document["name"]}
+        pending = [self.document]
+        while pending:
+            record = pending.pop()
+            for field in record["fields"]:
+                override = self._override(record, field)
+                if follow_es and override.get("es"):
+                    continue
+                for name in self._record_names(field["type"]):
+                    if name not in reachable:
+                        reachable.add(name)
+                        pending.append(self.records[name])
+        return [record for name, record in self.records.items() if name in reachable]
+
+    def _record_names(self, schema: Any) -> list[str]:
+        schema = self._resolve(schema)
+        if isinstance(schema, list):
+            return [name for branch in schema for name in self._record_names(branch)]
+        if isinstance(schema, dict) and schema.get("type") == "record":
+            return [schema["name"]]
+        if isinstance(schema, dict) and schema.get("type") == "array":
+            return self._record_names(schema["items"])
+        return []
+
+    def _override(self, record: dict[str, Any], field: dict[str, Any]) -> dict[str, Any]:
+        return self.codegen["fields"].get(f"{record['name']}.{field['name']}", {})
+
+    def _field_name(self, path: str, name: str) -> str:
+        name = self.codegen["es_field_names"].get(name, name)
+        if keyword.iskeyword(name) or not name.isidentifier():
+            self.errors.append(f"{path}: '{name}' is not a valid attribute name, add it to es_field_names")
+        return name
+
+    def _class_name(self, record: dict[str, Any]) -> str:
+        return self.codegen["python_names"].get(record["name"], record["name"])
+
+    def _python_type(self, schema: Any, path: str, enum_override: str | None = None) -> str:
+        if isinstance(schema, str):
+            if schema not in PYTHON_PRIMITIVES:
+                self.errors.append(f"{path}: unsupported Avro type '{schema}'")
+                return "Any"
+            return PYTHON_PRIMITIVES[schema]
+        if "logicalType" in schema:
+            return PYTHON_LOGICAL_TYPES[schema["logicalType"]]
+        if schema["type"] == "record":
+            return self._class_name(schema)
+        if schema["type"] == "array":
+            item, _ = self._unwrap(schema["items"], path)
+            return f"list[{self._python_type(item, path)}]"
+        if schema["type"] == "enum":
+            enum_name = enum_override or self.codegen["python_enums"].get(schema["name"])
+            if enum_name is None:
+                return f"Literal[{', '.join(json.dumps(symbol) for symbol in schema['symbols'])}]"
+            self._check_enum(enum_name, schema, path)
+            return enum_name
+        self.errors.append(f"{path}: unsupported Avro type '{schema['type']}'")
+        return "Any"
+
+    def _check_enum(self, enum_name: str, schema: dict[str, Any], path: str) -> None:
+        enum_type = getattr(order_types, enum_name, None)
+        if enum_type is None:
+            self.errors.append(f"{path}: {enum_name} is not defined in src/models/types/order_types.py")
+            return
+        missing = [symbol for symbol in schema["symbols"] if symbol not in enum_type.__members__]
+        if missing:
+            self.errors.append(f"{path}: {enum_name} is missing Avro symbols {', '.join(missing)}")
+
+    def _python_default(self, field: dict[str, Any], annotation: str) -> str | None:
+        if "default" not in field:
+            return None
+        default = field["default"]
+        if default is None:
+            return "None"
+        enum_name = annotation.removesuffix(" | None")
+        if isinstance(default, str):
+            return f"{enum_name}.{default}" if hasattr(order_types, enum_name) else json.dumps(default)
+        return repr(default)
+
+    def _es_field(self, schema: Any, path: str) -> str:
+        es_types = self.codegen["es_types"]
+        if isinstance(schema, str):
+            return es_types[schema]
+        if "logicalType" in schema:
+            return es_types[schema["logicalType"]]
+        if schema["type"] == "record":
+            return f"Object({schema['name']})"
+        if schema["type"] == "enum":
+            return es_types["enum"]
+        if schema["type"] == "array":
+            item, _ = self._unwrap(schema["items"], path)
+            if isinstance(item, dict) and item.get("type") == "record":
+                return f"Nested({item['name']})"
+            # Arrays of scalars are plain fields in ES; multi only tells the DSL to expect a list.
+            expression = self._es_field(item, path)
+            field_class, arguments = expression.split("(", 1)
+            return f"{field_class}(multi=True{', ' if arguments != ')' else ''}{arguments}"
+        self.errors.append(f"{path}: no Elasticsearch field for Avro type '{schema['type']}'")
+        return "Object()"
+
+    def check_codegen_file(self) -> None:
+        """
+        Flags codegen entries that do not match the schema, which would otherwise be silently ignored.
+        """
+        for path in self.codegen["fields"]:
+            record_name, _, field_name = path.partition(".")
+            record = self.records.get(record_name)
+            if record is None or all(field["name"] != field_name for field in record["fields"]):
+                self.errors.append(f"{path}: no such field in {SCHEMA_PATH}")
+        for enum_name in self.codegen["python_enums"]:
+            if enum_name not in self.enums:
+                self.errors.append(f"python_enums.{enum_name}: no such enum in {SCHEMA_PATH}")
+
+    def render_dtos(self) -> str:
+        classes = []
+        names_used = set()
+        for record in self._reachable():
+            lines = [f"class {self._class_name(record)}(BaseModel):"]
+            if record.get("doc"):
+                lines.append(f'    """\n    {record["doc"]}\n    """\n')
+            for field in record["fields"]:
+                path = f"{record['name']}.{field['name']}"
+                schema, nullable = self._unwrap(field["type"], path)
+                overrides = self._override(record, field)
+                python_override = overrides.get("python")
+                if python_override and isinstance(schema, dict) and schema.get("type") == "enum":
+                    annotation = self._python_type(schema, path, enum_override=python_override)
+                else:
+                    annotation = python_override or self._python_type(schema, path)
+                default_source = field
+                if "read_default" in overrides:
+                    # Documents indexed before the field was required may lack it.
+                    default_source = {"default": overrides["read_default"]}
+                    nullable = nullable or overrides["read_default"] is None
+                if nullable:
+                    annotation = f"{annotation} | None"
+                names_used.update(re.findall(r"\w+", annotation))
+                default = self._python_default(default_source, annotation)
+                name = self._field_name(path, field["name"])
+                if name != field["name"]:
+                    # Documents carry either name; responses keep the Avro one.
+                    arguments = [f"default={default}"] if default is not None else []
+                    arguments += [
+                        f'validation_alias=AliasChoices("{field["name"]}", "{name}")',
+                        f'serialization_alias="{field["name"]}"',
+                    ]
+                    default = "Field(\n" + "".join(f"        {argument},\n" for argument in arguments) + "    )"
+                    names_used.update(("Field", "AliasChoices"))
+                lines.append(f"    {name}: {annotation}" + (f" = {default}" if default is not None else ""))
+            classes.append("\n".join(lines))
+
+        body = "\n\n\n".join(classes)
+        imports = []
+        datetime_names = [name for name in ("date", "datetime") if name in names_used]
+        if datetime_names:
+            imports.append(f"from datetime import {', '.join(datetime_names)}")
+        if "Literal" in names_used:
+            imports.append("from typing import Literal")
+        pydantic_names = sorted({"BaseModel"} | (names_used & {"AliasChoices", "Field"}))
+        imports.append(f"\nfrom pydantic import {', '.join(pydantic_names)}\n")
+        enum_names = sorted(name for name in names_used if hasattr(order_types, name))
+        if enum_names:
+            imports.append(
+                "from src.models.types.order_types import (\n"
+                + "".join(f"    {name},\n" for name in enum_names)
+                + ")"
+            )
+        return f"{HEADER}\n" + "\n".join(imports) + "\n\n\n" + body + "\n"
+
+    def render_es(self) -> str:
+        classes = []
+        for record in self._reachable(follow_es=True):
+            is_document = record is self.document
+            class_name = f"{record['name']}Document" if is_document else record["name"]
+            lines = [f"class {class_name}({'Document' if is_document else 'InnerDoc'}):"]
+            if is_document:
+                lines.append(
+                    '    """\n'
+                    "    Fields of an order document; OrderIndex adds the collections, which are mapped per profile.\n"
+                    '    """\n'
+                )
+            for field in record["fields"]:
+                path = f"{record['name']}.{field['name']}"
+                override = self._override(record, field)
+                if "es" in override and override["es"] is None:
+                    continue
+                schema, _ = self._unwrap(field["type"], path)
+                expression = override.get("es") or self._es_field(schema, path)
+                lines.append(f"    {self._field_name(path, field['name'])} = {expression}")
+            classes.append("\n".join(lines))
+
+        body = "\n\n\n".join(classes)
+        dsl_names = sorted(
+            {"Document", "InnerDoc"} | (set(re.findall(r"\b([A-Z]\w*)\(", body)) & ES_FIELD_CLASSES)
+        )
+        imports = (
+            "from elasticsearch.dsl import (\n"
+            + "".join(f"    {name},\n" for name in dsl_names)
+            + ")\n\n"
+            + "\n".join(self.codegen["es_imports"])
+        )
+        return f"{HEADER}\n{imports}\n\n\n{body}\n"
+
+
+def load_generator() -> OrderModelGenerator:
+    with open(os.path.join(REPO_ROOT, SCHEMA_PATH)) as f:
+        schema = json.load(f)
+    with open(os.path.join(REPO_ROOT, CODEGEN_PATH)) as f:
+        codegen = json.load(f)
+    return OrderModelGenerator(schema, codegen)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate the order DTOs and Elasticsearch InnerDocs from the Avro schema.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail if the generated files are out of date instead of writing them.",
+    )
+    args = parser.parse_args()
+
+    generator = load_generator()
+    generator.check_codegen_file()
+    outputs = {DTO_PATH: generator.render_dtos(), ES_PATH: generator.render_es()}
+    if generator.errors:
+        print("\n".join(generator.errors), file=sys.stderr)
+        sys.exit(1)
+
+    stale = []
+    for path, content in outputs.items():
+        full_path = os.path.join(REPO_ROOT, path)
+        current = open(full_path).read() if os.path.exists(full_path) else ""
+        if current == content:
+            continue
+        stale.append(path)
+        if args.check:
+            sys.stdout.writelines(
+                difflib.unified_diff(current.splitlines(True), content.splitlines(True), path, f"{path} (generated)")
+            )
+        else:
+            with open(full_path, "w") as f:
+                f.write(content)
+            print(f"Wrote {path}")
+
+    if args.check and stale:
+        print(f"\n{', '.join(stale)} out of date with {SCHEMA_PATH}; run `make codegen`.", file=sys.stderr)
+        sys.exit(1)
+    if not stale:
+        print("Generated order models are up to date.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+import argparse
+import base64
+import json
+import logging
+import os
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+from confluent_kafka import Consumer, KafkaError, Message
+from confluent_kafka.schema_registry import SchemaRegistryClient
+from elasticsearch import Elasticsearch, TransportError
+from elasticsearch.helpers import streaming_bulk
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.configs.config import settings
+from src.models.mappers.order_avro_decoder import OrderAvroDecoder
+from src.models.mappers.order_es_mapper import to_bulk_action, to_bulk_upsert_if_newer_action
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+
+DLQ_TOPIC = "dlq-elasticsearch-orders"
+CONSUMER_GROUP = "dlq-reprocessor-orders"
+
+MALFORMED = "malformed"
+MAPPING = "mapping"
+TRANSIENT = "transient"
+
+_CONVERTER_STAGES = {"KEY_CONVERTER", "VALUE_CONVERTER", "HEADER_CONVERTER"}
+_MALFORMED_MARKERS = ("SerializationException", "DataException", "Unknown magic byte")
+_MAPPING_MARKERS = (
+    "mapper_parsing_exception",
+    "strict_dynamic_mapping_exception",
+    "document_parsing_exception",
+    "illegal_argument_exception",
+)
+_TRANSIENT_STATUSES = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class DeadLetter:
+    message: Message
+    headers: dict[str, str]
+    category: str
+    reason: str
+    document: dict | None = None
+
+    @property
+    def original_offset(self) -> int:
+        return int(self.headers.get("__connect.errors.offset", self.message.offset()))
+
+    @property
+    def from_python_indexer(self) -> bool:
+        return self.headers.get("__connect.errors.connector.name") == settings.ORDER_INDEXER.GROUP_ID
+
+
+def read_headers(message: Message) -> dict[str, str]:
+    return {
+        key: value.decode("utf-8", errors="replace") if value is not None else ""
+        for key, value in (message.headers() or [])
+    }
+
+
+def classify(headers: dict[str, str]) -> tuple[str, str]:
+    stage = headers.get("__connect.errors.stage", "")
+    exception = headers.get("__connect.errors.exception.class.name", "")
+    reason = headers.get("__connect.errors.exception.message", "") or exception or "unknown"
+
+    if stage in _CONVERTER_STAGES or any(marker in exception + reason for marker in _MALFORMED_MARKERS):
+        return MALFORMED, reason
+    if any(marker in reason for marker in _MAPPING_MARKERS):
+        return MAPPING, reason
+    # Timeouts, rejected executions, circuit breakers and anything the sink could
+    # not pin down are retried; a retry that fails permanently is quarantined.
+    return TRANSIENT, reason
+
+
+class DlqReprocessor:
+    """
+    Drains the Elasticsearch sink DLQ: retries transient failures in bulk and quarantines the rest.
+    """
+
+    def __init__(self, args):
+        config = settings.ORDER_INDEXER
+        self.args = args
+        self.counts: Counter[str] = Counter()
+        self.client = Elasticsearch(hosts=settings.ELASTIC.HOSTS)
+        self.decoder = OrderAvroDecoder(
+            SchemaRegistryClient({"url": config.SCHEMA_REGISTRY_URL}),
+        )
+        self.index = args.index or config.WRITE_ALIAS
+        self.consumer = Consumer(
+            {
+                "bootstrap.servers": config.BOOTSTRAP_SERVERS,
+                "group.id": CONSUMER_GROUP,
+                "enable.auto.commit": False,
+                "auto.offset.reset": "earliest",
+                "enable.partition.eof": True,
+            },
+        )
+
+    def run(self) -> Counter[str]:
+        self.consumer.subscribe([self.args.topic])
+        idle_partitions: set[int] = set()
+        with open(self.args.quarantine_file, "a") as quarantine:
+            while True:
+                messages = self.consumer.consume(num_messages=self.args.batch_size, timeout=5.0)
+                if not messages:
+                    break
+
+                letters = []
+                for message in messages:
+                    error = message.error()
+                    if error is None:
+                        idle_partitions.discard(message.partition())
+                        letters.append(self._to_dead_letter(message))
+                    elif error.code() == KafkaError._PARTITION_EOF:
+                        idle_partitions.add(message.partition())
+                    else:
+                        logging.error(f"Consume error: {error}")
+
+                if letters:
+                    self._handle_batch(letters, quarantine)
+                    quarantine.flush()
+                    if not self.args.dry_run:
+                        self.consumer.commit(asynchronous=False)
+
+                if idle_partitions and idle_partitions >= {p.partition for p in self.consumer.assignment()}:
+                    break
+
+        self.consumer.close()
+        return self.counts
+
+    def _to_dead_letter(self, message: Message) -> DeadLetter:
+        self.counts["read"] += 1
+        headers = read_headers(message)
+        category, reason = classify(headers)
+        letter = DeadLetter(message=message, headers=headers, category=category, reason=reason)
+        if category == TRANSIENT:
+            try:
+                letter.document = self.decoder.decode(message.value())
+            except Exception as e:
+                letter.category, letter.reason = MALFORMED, f"Cannot decode value: {e}"
+        return letter
+
+    def _handle_batch(self, letters: list[DeadLetter], quarantine) -> None:
+        to_retry = []
+        for letter in letters:
+            self.counts[letter.category] += 1
+            if letter.category == TRANSIENT:
+                to_retry.append(letter)
+            else:
+                self._quarantine(letter, quarantine)
+
+        for letter in self._retry(to_retry):
+            self._quarantine(letter, quarantine)
+
+    def _retry(self, letters: list[DeadLetter]) -> list[DeadLetter]:
+        """
+        Re-indexes transient failures in bulk with exponential backoff; returns the ones that still fail.
+        """
+        if self.args.dry_run:
+            return []
+
+        # Later DLQ entries of the same order supersede earlier ones.
+        pending = {letter.document["order"]["orderId"]: letter for letter in letters}
+        rejected = []
+        for attempt in range(self.args.max_attempts):
+            if not pending:
+                break
+            if attempt:
+                time.sleep(self.args.backoff_seconds * 2 ** (attempt - 1))
+
+            actions = [self._to_action(letter) for letter in pending.values()]
+            results = streaming_bulk(
+                self.client,
+                actions,
+                raise_on_error=False,
+                raise_on_exception=False,
+                yield_ok=True,
+            )
+            failed = {}
+            not_recovered = 0
+            seen = set()
+            try:
+                for ok, result in results:
+                    item = next(iter(result.values()))
+                    seen.add(item["_id"])
+                    status = item.get("status")
+                    if ok and item.get("result") != "noop":
+                        continue
+                    not_recovered += 1
+                    letter = pending[item["_id"]]
+                    if ok or status == 409:
+                        # A newer version of the order was indexed since the failure.
+                        self.counts["stale"] += 1
+                    elif status in _TRANSIENT_STATUSES or status is None:
+                        letter.reason = str(item.get("error"))
+                        failed[item["_id"]] = letter
+                    else:
+                        letter.category, letter.reason = MAPPING, str(item.get("error"))
+                        self.counts["retry_rejected"] += 1
+                        rejected.append(letter)
+            except TransportError as e:
+                # Connection errors are raised even with raise_on_exception=False; retry what was not answered.
+                logging.error(f"Bulk request failed: {e}")
+                unanswered = {order_id: letter for order_id, letter in pending.items() if order_id not in seen}
+                failed.update(unanswered)
+                not_recovered += len(unanswered)
+
+            self.counts["recovered"] += len(pending) - not_recovered
+            pending = failed
+
+        self.counts["retry_exhausted"] += len(pending)
+        return rejected + list(pending.values())
+
+    def _to_action(self, letter: DeadLetter) -> dict:
+        """
+        Guards the write against overwriting a newer order.
+
+        The Python indexer versions documents by Kafka offset, so its events keep
+        that external version. The sink connector upserts with internal versions,
+        which an offset would always beat, so its events are only written if
+        their updatedAt is later than the stored one.
+        """
+        if letter.from_python_indexer:
+            return to_bulk_action(self.index, letter.document, letter.original_offset)
+        return to_bulk_upsert_if_newer_action(self.index, letter.document)
+
+    def _quarantine(self, letter: DeadLetter, quarantine) -> None:
+        self.counts["quarantined"] += 1
+        message = letter.message
+        value = message.value()
+        record = {
+            "category": letter.category,
+            "reason": letter.reason,
+            "dlq": {"partition": message.partition(), "offset": message.offset()},
+            "source": {
+                "topic": letter.headers.get("__connect.errors.topic"),
+                "partition": letter.headers.get("__connect.errors.partition"),
+                "offset": letter.headers.get("__connect.errors.offset"),
+            },
+            "stage": letter.headers.get("__connect.errors.stage"),
+            "key": message.key().decode("utf-8", errors="replace") if message.key() else None,
+            "value": base64.b64encode(value).decode("ascii") if value else None,
+        }
+        quarantine.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Reprocess the Elasticsearch sink dead letter queue for orders.",
+    )
+    parser.add_argument("--topic", default=DLQ_TOPIC, help="DLQ topic to drain.")
+    parser.add_argument("--index", help="Index or alias to write to. Defaults to the write alias.")
+    parser.add_argument("--quarantine-file", default="dlq-quarantine.jsonl", help="JSONL file for non-retryable events.")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--max-attempts", type=int, default=5, help="Bulk attempts for transient failures.")
+    parser.add_argument("--backoff-seconds", type=float, default=1.0, help="Initial retry backoff, doubled per attempt.")
+    parser.add_argument("--dry-run", action="store_true", help="Classify and quarantine only; no writes or commits.")
+    args = parser.parse_args()
+
+    counts = DlqReprocessor(args).run()
+    logging.info(f"DLQ reprocessing finished: {json.dumps(dict(counts), sort_keys=True)}")
@@ -0,0 +1,318 @@
+# export_orders_parquet.py
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from elasticsearch import Elasticsearch
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from manage_es_indices import CATCHUP_SAFETY_SECONDS, CREATED_AT_FIELD, UPDATED_AT_FIELD
+from src.configs.config import settings
+from src.models.mappers.order_analytics_mapper import (
+    EXPORT_SCHEMA,
+    SOURCE_FIELDS,
+    created_month,
+    to_export_rows,
+)
+
+WATERMARK_FILE = "_watermark.json"
+# Incremental runs add the orders updated since the last run as new files and
+# never rewrite earlier ones, so an order updated between runs has rows in
+# several files, possibly under different status partitions. Readers keep the
+# rows of each order's latest updated_at, e.g. in DuckDB:
+#   SELECT * FROM read_parquet('<output>/*/*/*.parquet', hive_partitioning = true)
+#   QUALIFY updated_at = max(updated_at) OVER (PARTITION BY order_id)
+# A full export would repeat versions the incremental runs already wrote, so it
+# is refused in a directory that has a watermark.
+PIT_KEEP_ALIVE = "5m"
+
+
+class PartitionedParquetWriter:
+    """
+    Streams rows into Parquet files partitioned by creation month and order status.
+
+    Rows are buffered per partition and flushed as row groups, so memory is
+    bounded by the buffer limit and the number of open files, not by the export
+    size. Files are written under a temporary name and only closed here; the
+    run renames them once every slice has succeeded, so readers never pick up a
+    partial file or the files of a failed run.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        file_prefix: str,
+        row_group_size: int,
+        max_buffered_rows: int,
+        max_open_files: int,
+    ):
+        self.output_dir = output_dir
+        self.file_prefix = file_prefix
+        self.row_group_size = row_group_size
+        self.max_buffered_rows = max_buffered_rows
+        self.max_open_files = max_open_files
+        self._buffers: dict[tuple[str, str], list[dict]] = defaultdict(list)
+        self._buffered_rows = 0
+        self._writers: OrderedDict[tuple[str, str], tuple[pq.ParquetWriter, Path]] = OrderedDict()
+        self._sequence = 0
+        self.files: list[tuple[str, str]] = []
+
+    def write(self, partition: tuple[str, str], rows: list[dict]) -> None:
+        buffer = self._buffers[partition]
+        buffer.extend(rows)
+        self._buffered_rows += len(rows)
+        if len(buffer) >= self.row_group_size:
+            self._flush(partition)
+        while self._buffered_rows > self.max_buffered_rows:
+            self._flush(max(self._buffers, key=lambda key: len(self._buffers[key])))
+
+    def _flush(self, partition: tuple[str, str]) -> None:
+        rows = self._buffers.pop(partition, [])
+        if not rows:
+            return
+        self._buffered_rows -= len(rows)
+        self._writer(partition).write_table(pa.Table.from_pylist(rows, schema=EXPORT_SCHEMA))
+
+    def _writer(self, partition: tuple[str, str]) -> pq.ParquetWriter:
+        if partition in self._writers:
+            self._writers.move_to_end(partition)
+            return self._writers[partition][0]
+        if len(self._writers) >= self.max_open_files:
+            self._close(next(iter(self._writers)))
+
+        month, status = partition
+        directory = self.output_dir / f"created_month={month}" / f"status={status}"
+        directory.mkdir(parents=True, exist_ok=True)
+        self._sequence += 1
+        path = directory / f"{self.file_prefix}-{self._sequence:05d}.parquet"
+        writer = pq.ParquetWriter(path.with_suffix(".tmp"), EXPORT_SCHEMA, compression="zstd")
+        self._writers[partition] = (writer, path)
+        return writer
+
+    def _close(self, partition: tuple[str, str]) -> None:
+        writer, path = self._writers.pop(partition)
+        writer.close()
+        self.files.append((str(path.with_suffix(".tmp")), str(path)))
+
+    def close(self) -> list[tuple[str, str]]:
+        """
+        Writes out the buffered rows and returns the (temporary, final) paths of every file.
+        """
+        for partition in list(self._buffers):
+            self._flush(partition)
+        for partition in list(self._writers):
+            self._close(partition)
+        return self.files
+
+    def abort(self) -> None:
+        """
+        Drops the buffered rows and deletes every file written so far.
+        """
+        self._buffers.clear()
+        self._buffered_rows = 0
+        for writer, path in self._writers.values():
+            try:
+                writer.close()
+            except Exception:
+                pass
+            self.files.append((str(path.with_suffix(".tmp")), str(path)))
+        self._writers.clear()
+        for temp_path, _ in self.files:
+            Path(temp_path).unlink(missing_ok=True)
+        self.files = []
+
+
+def export_slice(pit_id: str, slice_id: int, slices: int, query: dict, args: argparse.Namespace, run_id: str) -> dict:
+    """
+    Exports one slice of the point in time. Runs in its own process with its own client.
+
+    Returns the slice's files still under their temporary names; if the slice
+    fails, its files are deleted before the error is raised.
+    """
+    client = Elasticsearch(hosts=settings.ELASTIC.HOSTS, request_timeout=120)
+    writer = PartitionedParquetWriter(
+        Path(args.output),
+        f"part-{run_id}-{slice_id:03d}",
+        args.row_group_size,
+        args.max_buffered_rows,
+        args.max_open_files,
+    )
+    orders = rows = 0
+    search_after = None
+    try:
+        while True:
+            request = {
+                "pit": {"id": pit_id, "keep_alive": PIT_KEEP_ALIVE},
+                "query": query,
+                "sort": ["_shard_doc"],
+                "size": args.batch_size,
+                "source": [f"order.{field}" for field in SOURCE_FIELDS],
+                "track_total_hits": False,
+            }
+            if slices > 1:
+                request["slice"] = {"id": slice_id, "max": slices}
+            if search_after is not None:
+                request["search_after"] = search_after
+
+            response = client.search(**request)
+            pit_id = response.get("pit_id", pit_id)
+            hits = response["hits"]["hits"]
+            if not hits:
+                break
+
+            for hit in hits:
+                order = hit["_source"].get("order")
+                if not order:
+                    continue
+                order_rows = to_export_rows(order)
+                writer.write((created_month(order), order.get("status") or "UNKNOWN"), order_rows)
+                orders += 1
+                rows += len(order_rows)
+            search_after = hits[-1]["sort"]
+        files = writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+    finally:
+        client.close()
+    return {"slice": slice_id, "orders": orders, "rows": rows, "files": files}
+
+
+def publish_files(files: list[tuple[str, str]]) -> None:
+    for temp_path, path in files:
+        os.replace(temp_path, path)
+
+
+def discard_run(output: Path, run_id: str) -> None:
+    """
+    Deletes the temporary files of a failed run, including those of slices that died without cleaning up.
+    """
+    for temp_path in output.glob(f"created_month=*/status=*/part-{run_id}-*.tmp"):
+        temp_path.unlink(missing_ok=True)
+
+
+def read_watermark(output: Path) -> str | None:
+    path = output / WATERMARK_FILE
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)["updatedAt"]
+
+
+def write_watermark(output: Path, watermark: str, run_id: str) -> None:
+    path = output / WATERMARK_FILE
+    temp_path = path.with_suffix(".tmp")
+    with open(temp_path, "w") as f:
+        json.dump({"updatedAt": watermark, "runId": run_id}, f)
+    os.replace(temp_path, path)
+
+
+def build_query(args: argparse.Namespace, updated_after: str | None, updated_until: str | None) -> dict:
+    filters = []
+    if args.from_time or args.to_time:
+        created_range = {}
+        if args.from_time:
+            created_range["gte"] = args.from_time
+        if args.to_time:
+            created_range["lt"] = args.to_time
+        filters.append({"range": {CREATED_AT_FIELD: created_range}})
+    if updated_until:
+        updated_range = {"lte": updated_until}
+        if updated_after:
+            updated_range["gt"] = updated_after
+        filters.append({"range": {UPDATED_AT_FIELD: updated_range}})
+    return {"bool": {"filter": filters}} if filters else {"match_all": {}}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export orders to Parquet, one row per order item, partitioned by month and status.",
+    )
+    parser.add_argument("--output", default="data/exports/orders", help="Output directory.")
+    parser.add_argument("--index", default=settings.ORDER_INDEX_NAME, help="Index or alias to export.")
+    parser.add_argument("--slices", type=int, default=os.cpu_count() or 1, help="Parallel PIT slices, one process each.")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--row-group-size", type=int, default=50_000)
+    parser.add_argument("--max-buffered-rows", type=int, default=200_000, help="Buffered rows per slice before flushing.")
+    parser.add_argument("--max-open-files", type=int, default=32, help="Open Parquet files per slice.")
+    parser.add_argument("--from-time", help="Only orders created at or after this ISO timestamp.")
+    parser.add_argument("--to-time", help="Only orders created before this ISO timestamp.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Export only orders updated since the last incremental run and advance the watermark. "
+            "Earlier files are kept: readers keep the rows of each order's latest updated_at."
+        ),
+    )
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    if not args.incremental and (output / WATERMARK_FILE).exists():
+        parser.error(f"'{output}' holds incremental exports; write a full export to another directory.")
+    output.mkdir(parents=True, exist_ok=True)
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S") + f"-{uuid.uuid4().hex[:6]}"
+
+    updated_after = updated_until = None
+    if args.incremental:
+        updated_after = read_watermark(output)
+        # Stop short of "now" so documents still waiting for a refresh are picked up next run.
+        updated_until = (datetime.now(timezone.utc) - timedelta(seconds=CATCHUP_SAFETY_SECONDS)).isoformat()
+        print(f"Incremental export of orders updated in ({updated_after or '-inf'}, {updated_until}]")
+    query = build_query(args, updated_after, updated_until)
+
+    client = Elasticsearch(hosts=settings.ELASTIC.HOSTS)
+    pit_id = client.open_point_in_time(index=args.index, keep_alive=PIT_KEEP_ALIVE)["id"]
+    started = time.perf_counter()
+    totals = {"orders": 0, "rows": 0}
+    files: list[tuple[str, str]] = []
+    try:
+        with ProcessPoolExecutor(max_workers=args.slices) as executor:
+            futures = [
+                executor.submit(export_slice, pit_id, slice_id, args.slices, query, args, run_id)
+                for slice_id in range(args.slices)
+            ]
+            try:
+                for future in as_completed(futures):
+                    result = future.result()
+                    for key in totals:
+                        totals[key] += result[key]
+                    files.extend(result["files"])
+                    print(f"  slice {result['slice']}: {result['orders']:,} orders, {result['rows']:,} rows")
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+    except BaseException:
+        # Nothing of a failed run is published, so a rerun does not duplicate rows.
+        discard_run(output, run_id)
+        raise
+    finally:
+        client.close_point_in_time(id=pit_id)
+        client.close()
+
+    publish_files(files)
+    if args.incremental:
+        write_watermark(output, updated_until, run_id)
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"Exported {totals['orders']:,} orders as {totals['rows']:,} rows in {len(files):,} files "
+        f"in {elapsed:.1f}s ({totals['orders'] / max(elapsed, 1e-9):,.0f} orders/s), run {run_id}."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 # manage_es_indices.py
+import argparse
+import re
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
 from elasticsearch.dsl.connections import connections
 from elasticsearch.exceptions import NotFoundError
 import os
@@ -9,120 +12,526 @@ sys.path.append(
     os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 )
 
+from src.configs.config import settings
 from src.models.entities.order_index import OrderIndex
 
 INDEX_PATTERN_PREFIX = "orders-v1"
 SEARCH_ALIAS = "orders-search"
 WRITE_ALIAS = "order.events.v1"
-TEMPLATE_NAME = "orders_template_v1"
+UPDATED_AT_FIELD = "order.updatedAt"
+CREATED_AT_FIELD = "order.createdAt"
+# Stamps every written document with the time it reached Elasticsearch, so
+# catch-up copies do not depend on how late an event was indexed.
+INGEST_TIME_PIPELINE = "orders-ingest-time"
+INDEXED_AT_FIELD = "indexedAt"
+ILM_POLICY_NAME = "orders-lifecycle"
+ROLLOVER_CONDITIONS = {
+    "max_primary_shard_size": "30gb",
+    "max_docs": 150_000_000,
+    "max_age": "30d",
+}
+WARM_AFTER = "30d"
+# Must be a factor of OrderIndex's number_of_shards.
+WARM_SHARDS = 5
+# Catch-up windows overlap by this much to cover clock skew and refresh delay.
+CATCHUP_SAFETY_SECONDS = 60
 
 
-def setup_template():
-    print(f"Setting up index template '{TEMPLATE_NAME}'...")
+def index_prefix(version):
+    return f"orders-v{version}"
+
+
+def template_name(version):
+    return f"orders_template_v{version}"
+
+
+def setup_ingest_time_pipeline():
+    client = connections.get_connection()
+    client.ingest.put_pipeline(
+        id=INGEST_TIME_PIPELINE,
+        description="Sets the time an order document was indexed.",
+        processors=[{"set": {"field": INDEXED_AT_FIELD, "value": "{{_ingest.timestamp}}"}}],
+    )
+
+
+def stored_settings_overrides(version):
+    """
+    Returns the settings overrides kept in the ``_meta`` of a version's index
+    template, such as those written by ``sizing_advisor.py --apply``.
+    """
+    client = connections.get_connection()
+    try:
+        templates = client.indices.get_index_template(name=template_name(version))["index_templates"]
+    except NotFoundError:
+        return {}
+    if not templates:
+        return {}
+    return templates[0]["index_template"].get("_meta", {}).get("settings_overrides", {})
+
+
+def setup_template(version=1, with_search_alias=True, settings_overrides=None):
+    """
+    Creates or updates the index template of a version from ``OrderIndex``.
+
+    Settings overrides are stored in the template's ``_meta``. Without
+    ``settings_overrides`` the stored ones are kept, so rerunning ``setup``
+    does not revert a sizing recommendation; pass ``{}`` to drop them.
+    """
+    name = template_name(version)
+    print(f"Setting up index template '{name}'...")
 
     es = connections.get_connection()
+    setup_ingest_time_pipeline()
+    if settings_overrides is None:
+        settings_overrides = stored_settings_overrides(version)
+    shards = settings_overrides.get("number_of_shards", OrderIndex.Index.settings["number_of_shards"])
+    if shards % WARM_SHARDS:
+        raise ValueError(
+            f"number_of_shards={shards} is not a multiple of {WARM_SHARDS}, the warm-tier shrink target."
+        )
 
     template_body = {
-        "index_patterns": [f"{INDEX_PATTERN_PREFIX}-*"],
+        "index_patterns": [f"{index_prefix(version)}-*"],
         "template": {
-            "settings": OrderIndex.Index.settings,
+            "settings": {
+                **OrderIndex.Index.settings,
+                "lifecycle": {"name": ILM_POLICY_NAME, "rollover_alias": WRITE_ALIAS},
+                # A final pipeline also runs for requests that name their own pipeline.
+                "final_pipeline": INGEST_TIME_PIPELINE,
+                **settings_overrides,
+            },
             "mappings": OrderIndex._doc_type.mapping.to_dict(),
             "aliases": {
                 SEARCH_ALIAS: {},
-            },
+            }
+            if with_search_alias
+            else {},
         },
+        "_meta": {"settings_overrides": settings_overrides},
     }
 
     # استفاده از indices.put_index_template
     es.indices.put_index_template(
-        name=TEMPLATE_NAME,
+        name=name,
         body=template_body,
     )
     print("Template successfully saved.")
 
 
-def get_current_month_index_name():
-    return f"{INDEX_PATTERN_PREFIX}-{datetime.now().strftime('%Y-%m')}"
+def get_write_index():
+    """
+    Returns the index the write alias writes to, or None if the alias does not exist.
+
+    After a rollover the alias still points to older indices with
+    ``is_write_index: false``, so the flagged index wins.
+    """
+    client = connections.get_connection()
+    try:
+        aliases = client.indices.get_alias(name=WRITE_ALIAS)
+    except NotFoundError:
+        return None
+    for index, body in aliases.items():
+        if body["aliases"][WRITE_ALIAS].get("is_write_index"):
+            return index
+    return next(iter(aliases), None)
+
+
+def resolve_index_prefix():
+    """
+    Returns the prefix of the index behind the write alias, so a reindexed
+    ``orders-v2-*`` generation keeps rolling over within its own version.
+    """
+    write_index = get_write_index()
+    if write_index is None:
+        return INDEX_PATTERN_PREFIX
+    return "-".join(write_index.split("-")[:2])
+
+
+def resolve_index_version():
+    return int(resolve_index_prefix().rsplit("-v", 1)[1])
+
+
+def get_bootstrap_index_name():
+    # Date math keeps the creation month in the name across ILM rollovers,
+    # e.g. orders-v1-2025-08-000001 -> orders-v1-2025-09-000002.
+    return f"<{resolve_index_prefix()}-{{now/M{{yyyy-MM}}}}-000001>"
+
+
+def setup_lifecycle_policy(
+    rollover_conditions=None,
+    warm_after=WARM_AFTER,
+    warm_shards=WARM_SHARDS,
+    delete_after=None,
+):
+    """
+    Creates the ILM policy: size/age-based rollover while hot, then force-merge,
+    shrink and read-only in the warm tier once indices pass the warm horizon.
+    """
+    client = connections.get_connection()
+    phases = {
+        "hot": {
+            "min_age": "0ms",
+            "actions": {
+                "rollover": rollover_conditions or ROLLOVER_CONDITIONS,
+                "set_priority": {"priority": 100},
+            },
+        },
+        "warm": {
+            "min_age": warm_after,
+            "actions": {
+                "readonly": {},
+                "shrink": {"number_of_shards": warm_shards},
+                "forcemerge": {"max_num_segments": 1},
+                "set_priority": {"priority": 50},
+            },
+        },
+    }
+    if delete_after:
+        phases["delete"] = {"min_age": delete_after, "actions": {"delete": {}}}
+
+    client.ilm.put_lifecycle(name=ILM_POLICY_NAME, policy={"phases": phases})
+    print(f"Lifecycle policy '{ILM_POLICY_NAME}' saved with phases: {', '.join(phases)}.")
+
+    # Indices created before the policy existed are attached to it as well; all
+    # but the write index are done indexing, so ILM skips their rollover step.
+    write_index = get_write_index()
+    for index in client.indices.get(index=f"{resolve_index_prefix()}-*"):
+        index_settings = {"lifecycle": {"name": ILM_POLICY_NAME, "rollover_alias": WRITE_ALIAS}}
+        if index != write_index:
+            index_settings["lifecycle"]["indexing_complete"] = True
+        client.indices.put_settings(index=index, settings=index_settings)
 
 
 def ensure_current_index_and_aliases_exist():
     print("Ensuring current index and aliases exist...")
     client = connections.get_connection()
-    current_index = get_current_month_index_name()
-
-    if not client.indices.exists(index=current_index):
-        print(f"Index '{current_index}' does not exist. Creating it...")
-        client.indices.create(index=current_index)
-        print(f"Index '{current_index}' created.")
 
     if not client.indices.exists_alias(name=WRITE_ALIAS):
+        bootstrap_index = get_bootstrap_index_name()
         print(
-            f"Write alias '{WRITE_ALIAS}' does not exist. Pointing it to '{current_index}'..."
+            f"Write alias '{WRITE_ALIAS}' does not exist. Bootstrapping '{bootstrap_index}'..."
+        )
+        client.indices.create(
+            index=bootstrap_index,
+            aliases={WRITE_ALIAS: {"is_write_index": True}},
         )
-        client.indices.put_alias(index=current_index, name=WRITE_ALIAS)
         print(f"Write alias '{WRITE_ALIAS}' created.")
 
 
-def perform_monthly_rollover():
-    print("Performing monthly rollover check...")
+def perform_rollover(conditions=None, dry_run=False):
+    """
+    Rolls the write alias over when the current write index meets any of the
+    size, document count or age conditions. ILM runs the same check on its own;
+    this command forces an immediate evaluation.
+    """
+    print("Performing conditional rollover check...")
     client = connections.get_connection()
 
     try:
-        current_write_indices = list(client.indices.get_alias(name=WRITE_ALIAS).keys())
-        if not current_write_indices:
+        write_index = get_write_index()
+        if write_index is None:
             print("No write alias found. Running initial setup...")
             ensure_current_index_and_aliases_exist()
             return
 
-        old_write_index = current_write_indices[0]
-
-        new_write_index = get_current_month_index_name()
+        kwargs = {}
+        if not re.search(r"-\d+$", write_index):
+            # Calendar-month indices have no counter to increment.
+            kwargs["new_index"] = get_bootstrap_index_name()
 
-        if old_write_index == new_write_index:
-            print(
-                f"Rollover not needed. Write alias is already pointing to the current month's index: '{new_write_index}'"
-            )
+        response = client.indices.rollover(
+            alias=WRITE_ALIAS,
+            conditions=conditions or ROLLOVER_CONDITIONS,
+            dry_run=dry_run,
+            **kwargs,
+        )
+        met = [name for name, is_met in response["conditions"].items() if is_met]
+        if not met:
+            print(f"Rollover not needed. '{write_index}' meets none of {list(response['conditions'])}.")
+            return
+        if dry_run:
+            print(f"Rollover would create '{response['new_index']}' (met: {met}).")
             return
 
+        print(f"Rolled over '{response['old_index']}' to '{response['new_index']}' (met: {met}).")
+        client.indices.put_settings(
+            index=response["old_index"],
+            settings={"lifecycle": {"indexing_complete": True}},
+        )
+
+    except Exception as e:
+        print(f"An error occurred during rollover: {e}")
+        sys.exit(1)
+
+
+def setup_recent_index():
+    """
+    Creates the small, fast-refreshing index that holds only the last N days of orders.
+    """
+    tier = settings.ORDER_RECENT_TIER
+    client = connections.get_connection()
+    if client.indices.exists(index=tier.INDEX_NAME):
+        print(f"Recent index '{tier.INDEX_NAME}' already exists.")
+        return
+
+    client.indices.create(
+        index=tier.INDEX_NAME,
+        settings={
+            **OrderIndex.Index.settings,
+            "number_of_shards": tier.NUMBER_OF_SHARDS,
+            "refresh_interval": tier.REFRESH_INTERVAL,
+        },
+        mappings=OrderIndex._doc_type.mapping.to_dict(),
+    )
+    print(f"Recent index '{tier.INDEX_NAME}' created with {tier.NUMBER_OF_SHARDS} shards.")
+
+
+def prune_recent_index():
+    tier = settings.ORDER_RECENT_TIER
+    client = connections.get_connection()
+    response = client.delete_by_query(
+        index=tier.INDEX_NAME,
+        query={"range": {CREATED_AT_FIELD: {"lt": f"now-{tier.RETENTION_DAYS}d/d"}}},
+        conflicts="proceed",
+        slices="auto",
+    )
+    print(f"Pruned {response.get('deleted', 0):,} orders older than {tier.RETENTION_DAYS} days from '{tier.INDEX_NAME}'.")
+
+
+def _wait_for_task(client, task_id, label):
+    while True:
+        task = client.tasks.get(task_id=task_id)
+        status = task["task"]["status"]
         print(
-            f"Rollover needed. Transitioning from '{old_write_index}' to '{new_write_index}'..."
+            f"  {label}: {status.get('created', 0) + status.get('updated', 0):,}/{status.get('total', 0):,} docs "
+            f"({status.get('version_conflicts', 0):,} conflicts)"
         )
+        if task.get("completed"):
+            failures = task.get("response", {}).get("failures", [])
+            if failures:
+                raise RuntimeError(f"{label} finished with {len(failures)} failures, e.g. {failures[0]}")
+            return task.get("response", {})
+        time.sleep(5)
 
-        if not client.indices.exists(index=new_write_index):
-            client.indices.create(index=new_write_index)
-            print(f"Created new index: '{new_write_index}'")
 
-        actions = [
-            {"remove": {"index": old_write_index, "alias": WRITE_ALIAS}},
-            {"add": {"index": new_write_index, "alias": WRITE_ALIAS}},
-        ]
-        client.indices.update_aliases(body={"actions": actions})
-        print(f"Successfully rolled over write alias to '{new_write_index}'.")
+def _copy(client, source, target, requests_per_second, slices, since=None):
+    """
+    Copies ``source`` into ``target`` with a sliced, throttled ``_reindex``.
 
-    except NotFoundError:
-        print("Write alias not found. Running initial setup...")
-        ensure_current_index_and_aliases_exist()
-    except Exception as e:
-        print(f"An error occurred during rollover: {e}")
+    External versioning keeps the source ``_version``, so a catch-up pass only
+    overwrites target documents with newer source versions.
+    """
+    body = {
+        "conflicts": "proceed",
+        "source": {"index": source, "size": 1000},
+        "dest": {"index": target, "version_type": "external"},
+    }
+    if since is not None:
+        body["source"]["query"] = {"range": {INDEXED_AT_FIELD: {"gte": since.isoformat()}}}
+
+    response = client.reindex(
+        body=body,
+        slices=slices,
+        requests_per_second=requests_per_second,
+        wait_for_completion=False,
+    )
+    return _wait_for_task(client, response["task"], f"{source} -> {target}")
+
+
+def _verify_counts(client, pairs):
+    mismatches = []
+    for source, target in pairs:
+        source_count = client.count(index=source)["count"]
+        target_count = client.count(index=target)["count"]
+        print(f"  {source}: {source_count:,} docs, {target}: {target_count:,} docs")
+        if target_count < source_count:
+            mismatches.append(source)
+    return mismatches
+
+
+def reindex_to_version(
+    target_version,
+    requests_per_second=-1,
+    slices="auto",
+    catchup_rounds=3,
+    catchup_threshold=1000,
+    force=False,
+):
+    """
+    Rebuilds every index of the current generation into ``orders-v<target_version>-*``
+    with the current ``OrderIndex`` mapping and swaps the aliases atomically.
+
+    Catch-up rounds copy what was written after the previous round by the time
+    it reached Elasticsearch, not by ``order.updatedAt``, so events the indexer
+    or the connector wrote long after they were produced are not missed. The
+    source indices get the ingest-time pipeline before the first copy starts.
+    """
+    client = connections.get_connection()
+    source_prefix = resolve_index_prefix()
+    target_prefix = index_prefix(target_version)
+    if source_prefix == target_prefix:
+        print(f"Write alias already points to '{target_prefix}'. Nothing to do.")
+        return
+
+    source_indices = sorted(client.indices.get(index=f"{source_prefix}-*").keys())
+    pairs = [(source, source.replace(source_prefix, target_prefix, 1)) for source in source_indices]
+    print(f"Reindexing {len(pairs)} index(es) from '{source_prefix}' to '{target_prefix}'...")
+
+    # Target indices join the search alias only at swap time to avoid duplicate hits.
+    overrides = stored_settings_overrides(resolve_index_version())
+    setup_template(target_version, with_search_alias=False, settings_overrides=overrides)
+    for _, target in pairs:
+        if not client.indices.exists(index=target):
+            client.indices.create(index=target)
+        client.indices.put_settings(index=target, settings={"refresh_interval": "-1", "number_of_replicas": 0})
+
+    setup_ingest_time_pipeline()
+    client.indices.put_mapping(index=source_indices, properties={INDEXED_AT_FIELD: {"type": "date"}})
+    client.indices.put_settings(index=source_indices, settings={"index.final_pipeline": INGEST_TIME_PIPELINE})
+
+    checkpoint = datetime.now(timezone.utc) - timedelta(seconds=CATCHUP_SAFETY_SECONDS)
+    for source, target in pairs:
+        _copy(client, source, target, requests_per_second, slices)
+
+    for round_number in range(1, catchup_rounds + 1):
+        next_checkpoint = datetime.now(timezone.utc) - timedelta(seconds=CATCHUP_SAFETY_SECONDS)
+        print(f"Catch-up round {round_number} for documents indexed since {checkpoint.isoformat()}...")
+        copied = 0
+        for source, target in pairs:
+            response = _copy(client, source, target, requests_per_second, slices, since=checkpoint)
+            copied += response.get("created", 0) + response.get("updated", 0)
+        checkpoint = next_checkpoint
+        if copied <= catchup_threshold:
+            break
+
+    index_settings = {**OrderIndex.Index.settings, **overrides}
+    for _, target in pairs:
+        client.indices.put_settings(
+            index=target,
+            settings={
+                "refresh_interval": index_settings["refresh_interval"],
+                "number_of_replicas": index_settings["number_of_replicas"],
+            },
+        )
+        client.indices.refresh(index=target)
+
+    print("Verifying document counts...")
+    mismatches = _verify_counts(client, pairs)
+    if mismatches and not force:
+        print(f"Aborting alias swap, target has fewer documents for: {mismatches}. Use --force to override.")
         sys.exit(1)
 
+    write_source = get_write_index()
+    write_alias_indices = set(client.indices.get_alias(name=WRITE_ALIAS))
+    actions = []
+    for source, target in pairs:
+        actions.append({"remove": {"index": source, "alias": SEARCH_ALIAS}})
+        actions.append({"add": {"index": target, "alias": SEARCH_ALIAS}})
+        if source in write_alias_indices:
+            actions.append({"remove": {"index": source, "alias": WRITE_ALIAS}})
+        if source == write_source:
+            actions.append({"add": {"index": target, "alias": WRITE_ALIAS, "is_write_index": True}})
+    client.indices.update_aliases(body={"actions": actions})
+    print(f"Swapped '{SEARCH_ALIAS}' and '{WRITE_ALIAS}' to '{target_prefix}'.")
+
+    for source, target in pairs:
+        if source != write_source:
+            client.indices.put_settings(index=target, settings={"lifecycle": {"indexing_complete": True}})
+
+    # Writes that reached the old write index between the last catch-up and the swap.
+    print(f"Final catch-up for documents indexed since {checkpoint.isoformat()}...")
+    # Writes from just before the swap may still wait for a refresh of the old indices.
+    client.indices.refresh(index=source_indices)
+    for source, target in pairs:
+        _copy(client, source, target, requests_per_second, slices, since=checkpoint)
+
+    setup_template(target_version, with_search_alias=True, settings_overrides=overrides)
+    print(f"Reindex to '{target_prefix}' completed. Old '{source_prefix}' indices were kept for rollback.")
+
 
 if __name__ == "__main__":
     connections.create_connection(hosts=["http://localhost:9200"])
 
-    if len(sys.argv) < 2:
-        print("Usage: python manage_es_indices.py <command>")
-        print("Commands: setup, ensure, rollover")
-        sys.exit(1)
-
-    command = sys.argv[1]
+    parser = argparse.ArgumentParser(description="Manage Elasticsearch order indices.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("setup", help="Create or update the index template.")
+    subparsers.add_parser("ensure", help="Ensure the current index and aliases exist.")
+    rollover_parser = subparsers.add_parser(
+        "rollover",
+        help="Roll the write alias over if the write index exceeds a size, doc count or age limit.",
+    )
+    ilm_parser = subparsers.add_parser(
+        "ilm",
+        help="Create the hot/warm lifecycle policy and attach existing indices to it.",
+    )
+    for condition_parser in (rollover_parser, ilm_parser):
+        condition_parser.add_argument(
+            "--max-primary-shard-size",
+            default=ROLLOVER_CONDITIONS["max_primary_shard_size"],
+        )
+        condition_parser.add_argument("--max-docs", type=int, default=ROLLOVER_CONDITIONS["max_docs"])
+        condition_parser.add_argument("--max-age", default=ROLLOVER_CONDITIONS["max_age"])
+    rollover_parser.add_argument("--dry-run", action="store_true")
+    ilm_parser.add_argument("--warm-after", default=WARM_AFTER, help="Age after rollover to move to warm.")
+    ilm_parser.add_argument("--warm-shards", type=int, default=WARM_SHARDS, help="Shard count after shrink.")
+    ilm_parser.add_argument("--delete-after", default=None, help="Optional age after rollover to delete.")
+    subparsers.add_parser("recent", help="Create the recent-orders tier index.")
+    subparsers.add_parser("prune-recent", help="Delete orders older than the retention from the recent tier.")
+    reindex_parser = subparsers.add_parser(
+        "reindex",
+        help="Rebuild all indices into a new version and swap aliases with zero downtime.",
+    )
+    reindex_parser.add_argument("--target-version", type=int, required=True)
+    reindex_parser.add_argument(
+        "--requests-per-second",
+        type=float,
+        default=-1,
+        help="Reindex throttle per slice group, -1 for unthrottled.",
+    )
+    reindex_parser.add_argument("--slices", default="auto", help="Number of slices or 'auto'.")
+    reindex_parser.add_argument("--catchup-rounds", type=int, default=3)
+    reindex_parser.add_argument(
+        "--catchup-threshold",
+        type=int,
+        default=1000,
+        help="Stop catch-up rounds once a round copies at most this many documents.",
+    )
+    reindex_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Swap aliases even if document counts do not match.",
+    )
+    args = parser.parse_args()
 
-    if command == "setup":
-        setup_template()
-    elif command == "ensure":
+    if args.command == "setup":
+        setup_template(resolve_index_version())
+    elif args.command == "ensure":
         ensure_current_index_and_aliases_exist()
-    elif command == "rollover":
-        perform_monthly_rollover()
-    else:
-        print(f"Unknown command: {command}")
-        sys.exit(1)
+    elif args.command in ("rollover", "ilm"):
+        conditions = {
+            "max_primary_shard_size": args.max_primary_shard_size,
+            "max_docs": args.max_docs,
+            "max_age": args.max_age,
+        }
+        if args.command == "rollover":
+            perform_rollover(conditions, dry_run=args.dry_run)
+        else:
+            setup_lifecycle_policy(
+                conditions,
+                warm_after=args.warm_after,
+                warm_shards=args.warm_shards,
+                delete_after=args.delete_after,
+            )
+    elif args.command == "recent":
+        setup_recent_index()
+    elif args.command == "prune-recent":
+        prune_recent_index()
+    elif args.command == "reindex":
+        reindex_to_version(
+            args.target_version,
+            requests_per_second=args.requests_per_second,
+            slices=args.slices if args.slices == "auto" else int(args.slices),
+            catchup_rounds=args.catchup_rounds,
+            catchup_threshold=args.catchup_threshold,
+            force=args.force,
+        )
@@ -0,0 +1,285 @@
+# replay_orders.py
+import argparse
+import os
+import re
+import sys
+import time
+from collections import Counter
+from collections.abc import Iterator
+from datetime import datetime, timezone
+
+from confluent_kafka import OFFSET_END, Consumer, KafkaError, TopicPartition
+from confluent_kafka.schema_registry import SchemaRegistryClient
+from elasticsearch import Elasticsearch
+from elasticsearch.helpers import parallel_bulk
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.configs.config import settings
+from src.models.mappers.order_analytics_mapper import created_month
+from src.models.mappers.order_avro_decoder import OrderAvroDecoder
+from src.models.mappers.order_es_mapper import to_bulk_action
+
+BULK_LOAD_SETTINGS = {"refresh_interval": "-1", "number_of_replicas": 0}
+PROGRESS_INTERVAL_SECONDS = 5
+# The creation month in a monthly index name, e.g. orders-v1-2025-08-000001 or orders-v1-2025-08.
+INDEX_MONTH_PATTERN = re.compile(r"-(\d{4}-\d{2})(?:-\d+)?$")
+
+
+def parse_timestamp_ms(value: str) -> int:
+    """
+    Returns an ISO timestamp as epoch milliseconds, reading one without an offset as UTC, not local time.
+    """
+    timestamp = datetime.fromisoformat(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return int(timestamp.timestamp() * 1000)
+
+
+def index_month(index: str) -> str | None:
+    """
+    Returns the YYYY-MM creation month a monthly index holds, or None for a name without one.
+    """
+    match = INDEX_MONTH_PATTERN.search(index)
+    return match.group(1) if match else None
+
+
+def resolve_offsets(consumer: Consumer, topic: str, args) -> tuple[list[TopicPartition], dict[int, int]]:
+    """
+    Returns the start positions to assign and the exclusive end offset of every partition.
+    """
+    metadata = consumer.list_topics(topic, timeout=10)
+    partitions = sorted(metadata.topics[topic].partitions)
+
+    high_watermarks = {
+        partition: consumer.get_watermark_offsets(TopicPartition(topic, partition), timeout=10)[1]
+        for partition in partitions
+    }
+
+    if args.from_time:
+        from_ms = parse_timestamp_ms(args.from_time)
+        starts = consumer.offsets_for_times(
+            [TopicPartition(topic, partition, from_ms) for partition in partitions],
+            timeout=10,
+        )
+    else:
+        starts = [TopicPartition(topic, partition, args.from_offset) for partition in partitions]
+
+    if args.to_time:
+        to_ms = parse_timestamp_ms(args.to_time)
+        ends = consumer.offsets_for_times(
+            [TopicPartition(topic, partition, to_ms) for partition in partitions],
+            timeout=10,
+        )
+        end_offsets = {
+            tp.partition: high_watermarks[tp.partition] if tp.offset < 0 else tp.offset for tp in ends
+        }
+    elif args.to_offset is not None:
+        end_offsets = {partition: min(args.to_offset, high_watermarks[partition]) for partition in partitions}
+    else:
+        end_offsets = high_watermarks
+
+    # Partitions with nothing to replay are skipped entirely.
+    assignments = [
+        tp for tp in starts if tp.offset != OFFSET_END and 0 <= tp.offset < end_offsets[tp.partition]
+    ]
+    return assignments, end_offsets
+
+
+def read_actions(
+    consumer: Consumer,
+    decoder: OrderAvroDecoder,
+    index: str,
+    end_offsets: dict[int, int],
+    remaining: set[int],
+    batch_size: int,
+    month: str | None = None,
+    other_months: Counter | None = None,
+) -> Iterator[dict]:
+    """
+    Yields bulk actions for the events up to the end offsets, skipping tombstones and undecodable events.
+
+    With ``month``, only orders created in that month are written: a time or
+    offset range of the topic holds events of orders of every month, and a
+    monthly index must only get its own. The others are counted per month in
+    ``other_months``.
+    """
+    while remaining:
+        messages = consumer.consume(num_messages=batch_size, timeout=1.0)
+        in_range = []
+        for message in messages:
+            partition = message.partition()
+            if message.error() is not None:
+                if message.error().code() != KafkaError._PARTITION_EOF:
+                    print(f"Consume error: {message.error()}")
+                elif message.offset() >= end_offsets.get(partition, 0):
+                    # Compacted or transactional topics may never yield the last offset.
+                    remaining.discard(partition)
+                continue
+            if partition not in remaining:
+                continue
+            if message.offset() >= end_offsets[partition]:
+                remaining.discard(partition)
+                consumer.pause([TopicPartition(message.topic(), partition)])
+                continue
+            in_range.append(message)
+            if message.offset() == end_offsets[partition] - 1:
+                remaining.discard(partition)
+                consumer.pause([TopicPartition(message.topic(), partition)])
+
+        documents = decoder.decode_batch(message.value() for message in in_range)
+        for message, document in zip(in_range, documents):
+            if document is None:
+                continue
+            if month is not None:
+                document_month = created_month(document["order"])
+                if document_month != month:
+                    if other_months is not None:
+                        other_months[document_month] += 1
+                    continue
+            yield to_bulk_action(index, document, message.offset())
+
+
+def apply_bulk_load_settings(client: Elasticsearch, index: str) -> dict:
+    current = client.indices.get_settings(index=index, flat_settings=True)[index]["settings"]
+    original = {
+        "refresh_interval": current.get("index.refresh_interval", "1s"),
+        "number_of_replicas": current.get("index.number_of_replicas", "1"),
+    }
+    client.indices.put_settings(index=index, settings=BULK_LOAD_SETTINGS)
+    print(f"Disabled refresh and replicas on '{index}' (was {original}).")
+    return original
+
+
+def restore_settings(client: Elasticsearch, index: str, original: dict) -> None:
+    client.indices.put_settings(index=index, settings=original)
+    client.indices.refresh(index=index)
+    print(f"Restored settings on '{index}': {original}.")
+
+
+def replay(args) -> None:
+    config = settings.ORDER_INDEXER
+    client = Elasticsearch(hosts=settings.ELASTIC.HOSTS, request_timeout=120)
+
+    if not client.indices.exists(index=args.index):
+        print(f"Index '{args.index}' does not exist. Creating it from the template...")
+        client.indices.create(index=args.index)
+
+    consumer = Consumer(
+        {
+            "bootstrap.servers": args.bootstrap_servers or config.BOOTSTRAP_SERVERS,
+            "group.id": f"order-replay-{args.index}",
+            "enable.auto.commit": False,
+            "enable.partition.eof": True,
+            # A start offset that retention already deleted resumes at the oldest
+            # kept event instead of silently skipping to the end of the partition.
+            "auto.offset.reset": "earliest",
+        },
+    )
+    decoder = OrderAvroDecoder(
+        SchemaRegistryClient({"url": args.schema_registry_url or config.SCHEMA_REGISTRY_URL}),
+    )
+
+    assignments, end_offsets = resolve_offsets(consumer, config.TOPIC, args)
+    if not assignments:
+        print("Nothing to replay in the requested range.")
+        return
+
+    total_messages = sum(end_offsets[tp.partition] - tp.offset for tp in assignments)
+    print(f"Replaying up to {total_messages:,} events from {len(assignments)} partition(s) into '{args.index}'...")
+    consumer.assign(assignments)
+
+    month = None if args.all_months else args.created_month or index_month(args.index)
+    if month is not None:
+        print(f"Only orders created in {month} are written to '{args.index}'.")
+    other_months: Counter = Counter()
+
+    original_settings = apply_bulk_load_settings(client, args.index)
+    indexed = skipped = failed = 0
+    started = last_report = time.monotonic()
+    try:
+        actions = read_actions(
+            consumer,
+            decoder,
+            args.index,
+            end_offsets,
+            {tp.partition for tp in assignments},
+            args.chunk_size,
+            month,
+            other_months,
+        )
+        for ok, item in parallel_bulk(
+            client,
+            actions,
+            thread_count=args.writers,
+            chunk_size=args.chunk_size,
+            raise_on_error=False,
+            raise_on_exception=False,
+        ):
+            if ok:
+                indexed += 1
+            elif next(iter(item.values())).get("status") == 409:
+                skipped += 1
+            else:
+                failed += 1
+                if failed <= 10:
+                    print(f"Failed to index: {item}")
+
+            now = time.monotonic()
+            if now - last_report >= PROGRESS_INTERVAL_SECONDS:
+                last_report = now
+                done = indexed + skipped + failed
+                print(
+                    f"Progress: {done:,}/{total_messages:,} events "
+                    f"({indexed / (now - started):,.0f} docs/sec, {skipped:,} stale, {failed:,} failed)"
+                )
+    finally:
+        consumer.close()
+        restore_settings(client, args.index, original_settings)
+
+    elapsed = time.monotonic() - started
+    print(
+        f"Replay finished in {elapsed:,.1f}s: {indexed:,} indexed, {skipped:,} stale, "
+        f"{failed:,} failed ({indexed / elapsed:,.0f} docs/sec)."
+    )
+    if other_months:
+        print(f"Skipped {sum(other_months.values()):,} events of orders created in other months: {dict(other_months)}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Replay order events from Kafka into an orders index.",
+    )
+    parser.add_argument("--index", required=True, help="Target index, e.g. orders-v1-2025-08.")
+    start = parser.add_mutually_exclusive_group(required=True)
+    start.add_argument("--from-time", help="ISO timestamp of the first event to replay, UTC unless it has an offset.")
+    start.add_argument("--from-offset", type=int, help="Offset to start from on every partition.")
+    end = parser.add_mutually_exclusive_group()
+    end.add_argument(
+        "--to-time",
+        help="ISO timestamp to stop at (exclusive), UTC unless it has an offset. Defaults to the current end.",
+    )
+    end.add_argument("--to-offset", type=int, help="Offset to stop at on every partition (exclusive).")
+    months = parser.add_mutually_exclusive_group()
+    months.add_argument(
+        "--created-month",
+        help="Only replay orders created in this month (YYYY-MM). Defaults to the month in --index.",
+    )
+    months.add_argument(
+        "--all-months",
+        action="store_true",
+        help="Replay orders of every month, e.g. into an index or alias without a month in its name.",
+    )
+    parser.add_argument("--writers", type=int, default=4, help="Parallel bulk writer threads.")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Documents per bulk request.")
+    parser.add_argument("--bootstrap-servers", help="Overrides ORDER_INDEXER__BOOTSTRAP_SERVERS.")
+    parser.add_argument("--schema-registry-url", help="Overrides ORDER_INDEXER__SCHEMA_REGISTRY_URL.")
+
+    args = parser.parse_args()
+    if not args.all_months and not args.created_month and index_month(args.index) is None:
+        parser.error(f"'{args.index}' has no month in its name; pass --created-month or --all-months.")
+    replay(args)
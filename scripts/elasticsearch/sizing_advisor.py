@@ -0,0 +1,235 @@
+# sizing_advisor.py
+import argparse
+import json
+import math
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+from elasticsearch.dsl.connections import connections
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from manage_es_indices import (
+    SEARCH_ALIAS,
+    WARM_SHARDS,
+    resolve_index_version,
+    setup_template,
+    stored_settings_overrides,
+)
+from src.models.entities.order_index import OrderIndex
+
+CREATED_AT_FIELD = "order.createdAt"
+# Inverted index, doc values and norms on top of _source, measured on the
+# default OrderIndex mapping. Replaced by the real ratio when sampling from ES.
+DEFAULT_DISK_TO_SOURCE_RATIO = 1.4
+# Lucene caps a shard at 2^31 documents and nested objects count as documents.
+MAX_LUCENE_DOCS_PER_SHARD = 2_000_000_000
+
+
+def nested_paths(properties, prefix=""):
+    """
+    Yields the dotted paths of all Nested fields in a mapping, parents before children.
+    """
+    for name, field in properties.items():
+        path = f"{prefix}{name}"
+        if field.get("type") == "nested":
+            yield path
+        if "properties" in field:
+            yield from nested_paths(field["properties"], f"{path}.")
+
+
+def count_nested_docs(order, paths):
+    """
+    Counts the hidden Lucene documents one order creates for its nested fields.
+    """
+    total = 0
+    for path in paths:
+        values = [order]
+        for part in path.split("."):
+            next_values = []
+            for value in values:
+                child = value.get(part) if isinstance(value, dict) else None
+                if isinstance(child, list):
+                    next_values.extend(child)
+                elif child is not None:
+                    next_values.append(child)
+            values = next_values
+        total += len(values)
+    return total
+
+
+def sample_from_es(client, size):
+    response = client.search(
+        index=SEARCH_ALIAS,
+        size=size,
+        query={"function_score": {"query": {"match_all": {}}, "random_score": {}}},
+    )
+    return [hit["_source"] for hit in response["hits"]["hits"]]
+
+
+def sample_generated(size):
+    from scripts.locust.locust_file import generate_unified_order_payload
+
+    statuses = ["PROCESSING", "SHIPPED", "DELIVERED", "COMPLETED"]
+    return [generate_unified_order_payload(status=statuses[i % len(statuses)]) for i in range(size)]
+
+
+def measure_disk_ratio(client, avg_source_bytes):
+    stats = client.indices.stats(index=SEARCH_ALIAS, metric="store")["_all"]["primaries"]
+    orders = client.count(index=SEARCH_ALIAS)["count"]
+    if not orders or not avg_source_bytes:
+        return DEFAULT_DISK_TO_SOURCE_RATIO
+    return stats["store"]["size_in_bytes"] / orders / avg_source_bytes
+
+
+def measure_orders_per_day(client, days=7):
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    count = client.count(
+        index=SEARCH_ALIAS,
+        query={"range": {CREATED_AT_FIELD: {"gte": since.isoformat()}}},
+    )["count"]
+    return count / days
+
+
+def data_node_count(client):
+    nodes = client.nodes.info(filter_path="nodes.*.roles")["nodes"]
+    return sum(1 for node in nodes.values() if any(role.startswith("data") for role in node["roles"]))
+
+
+def recommend(
+    avg_source_bytes,
+    avg_nested_docs,
+    disk_ratio,
+    orders_per_day,
+    peak_factor,
+    data_nodes,
+    target_shard_gb,
+    search_heavy,
+    warm_shards=WARM_SHARDS,
+):
+    monthly_orders = orders_per_day * 30
+    monthly_primary_bytes = monthly_orders * avg_source_bytes * disk_ratio
+    monthly_lucene_docs = monthly_orders * (1 + avg_nested_docs)
+
+    shards = max(
+        math.ceil(monthly_primary_bytes / (target_shard_gb * 1024**3)),
+        math.ceil(monthly_lucene_docs / MAX_LUCENE_DOCS_PER_SHARD),
+        1,
+    )
+    # The warm tier shrinks to warm_shards, so the count must be a multiple of
+    # it. Primaries are also spread evenly across data nodes when that at most
+    # doubles the count.
+    step = warm_shards
+    if data_nodes > 1:
+        spread_step = math.lcm(warm_shards, data_nodes)
+        if math.ceil(shards / spread_step) * spread_step <= 2 * math.ceil(shards / warm_shards) * warm_shards:
+            step = spread_step
+    shards = math.ceil(shards / step) * step
+
+    peak_orders_per_second = orders_per_day / 86400 * peak_factor
+    if peak_orders_per_second < 50:
+        refresh_interval = "1s"
+    elif peak_orders_per_second < 500:
+        refresh_interval = "5s"
+    elif peak_orders_per_second < 5000:
+        refresh_interval = "15s"
+    else:
+        refresh_interval = "30s"
+
+    if data_nodes <= 1:
+        replicas = 0
+    elif search_heavy and data_nodes >= 3:
+        replicas = 2
+    else:
+        replicas = 1
+
+    return {
+        "projection": {
+            "orders_per_month": round(monthly_orders),
+            "primary_gb_per_month": round(monthly_primary_bytes / 1024**3, 2),
+            "lucene_docs_per_month": round(monthly_lucene_docs),
+            "peak_orders_per_second": round(peak_orders_per_second, 1),
+        },
+        "settings": {
+            "number_of_shards": shards,
+            "refresh_interval": refresh_interval,
+            "number_of_replicas": replicas,
+        },
+        "rollover": {"max_primary_shard_size": f"{target_shard_gb}gb"},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Recommend shard count, refresh interval and replicas for order indices.",
+    )
+    parser.add_argument("--source", choices=["es", "generated"], default="es", help="Where to sample orders from.")
+    parser.add_argument("--sample-size", type=int, default=1000)
+    parser.add_argument("--orders-per-day", type=float, help="Projected volume. Measured from ES when omitted.")
+    parser.add_argument("--peak-factor", type=float, default=5.0, help="Peak-to-average ingest ratio.")
+    parser.add_argument("--data-nodes", type=int, help="Data node count. Read from the cluster when omitted.")
+    parser.add_argument("--target-shard-gb", type=int, default=30, help="Target primary shard size.")
+    parser.add_argument("--search-heavy", action="store_true", help="Favor replicas for search throughput.")
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Store the recommendation as the index template's settings overrides.",
+    )
+    args = parser.parse_args()
+
+    client = connections.create_connection(hosts=["http://localhost:9200"])
+
+    orders = sample_from_es(client, args.sample_size) if args.source == "es" else sample_generated(args.sample_size)
+    if not orders:
+        print("No orders sampled. Use --source generated on an empty cluster.")
+        sys.exit(1)
+
+    paths = list(nested_paths(OrderIndex._doc_type.mapping.to_dict()["properties"]))
+    # Nested paths start at the ``order`` object, as in indexed documents.
+    documents = [order if "order" in order else {"order": order} for order in orders]
+    avg_source_bytes = sum(len(json.dumps(order, default=str)) for order in orders) / len(orders)
+    avg_nested_docs = sum(count_nested_docs(document, paths) for document in documents) / len(documents)
+
+    disk_ratio = measure_disk_ratio(client, avg_source_bytes) if args.source == "es" else DEFAULT_DISK_TO_SOURCE_RATIO
+    orders_per_day = args.orders_per_day
+    if orders_per_day is None:
+        orders_per_day = measure_orders_per_day(client)
+    data_nodes = args.data_nodes or data_node_count(client)
+
+    print(f"Sampled {len(orders):,} orders from {args.source}:")
+    print(f"  average _source size:       {avg_source_bytes:,.0f} bytes")
+    print(f"  average nested docs/order:  {avg_nested_docs:.1f} ({', '.join(paths)})")
+    print(f"  disk/_source ratio:         {disk_ratio:.2f}")
+    print(f"  orders/day:                 {orders_per_day:,.0f}")
+    print(f"  data nodes:                 {data_nodes}")
+
+    recommendation = recommend(
+        avg_source_bytes,
+        avg_nested_docs,
+        disk_ratio,
+        orders_per_day,
+        args.peak_factor,
+        data_nodes,
+        args.target_shard_gb,
+        args.search_heavy,
+    )
+    print(json.dumps(recommendation, indent=2))
+
+    version = resolve_index_version()
+    template_settings = {**OrderIndex.Index.settings, **stored_settings_overrides(version)}
+    current = {key: template_settings[key] for key in recommendation["settings"]}
+    print(f"Current template settings: {current}")
+
+    if args.apply:
+        setup_template(version, settings_overrides=recommendation["settings"])
+        print(
+            "Applied to the index template; new indices pick it up at the next rollover. "
+            "The overrides are kept in the template, so 'setup' and 'reindex' keep them."
+        )
+
+
+if __name__ == "__main__":
+    main()
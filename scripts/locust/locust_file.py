@@ -1,7 +1,11 @@
 import uuid
+import json
 import random
 import os
-from locust import task, between, User
+import time
+import gevent
+import requests
+from locust import events, task, between, HttpUser, User
 from faker import Faker
 from confluent_kafka.avro import AvroProducer
 from confluent_kafka import avro
@@ -23,6 +27,18 @@ KAFKA_BOOTSTRAP_SERVERS = os.getenv("LOCUST_KAFKA_HOSTS", "localhost:9092")
 SCHEMA_REGISTRY_URL = os.getenv("LOCUST_SCHEMA_REGISTRY_URL", "http://localhost:8081")
 TOPIC = "order.events.v1"
 
+# Freshness benchmark: run with
+#   FRESHNESS_BENCHMARK=1 locust -f scripts/locust/locust_file.py FreshnessUser --host http://localhost:8000
+# "api_search" and "es_search" measure when an order becomes searchable (bound
+# by refresh_interval); "api_get" uses the real-time GET and measures indexing only.
+FRESHNESS_TARGET = os.getenv("FRESHNESS_TARGET", "api_search")
+FRESHNESS_POLL_INTERVAL_SECONDS = float(os.getenv("FRESHNESS_POLL_INTERVAL_SECONDS", "0.05"))
+FRESHNESS_TIMEOUT_SECONDS = float(os.getenv("FRESHNESS_TIMEOUT_SECONDS", "30"))
+FRESHNESS_REPORT_FILE = os.getenv("FRESHNESS_REPORT_FILE", "freshness-results.jsonl")
+ELASTIC_URL = os.getenv("LOCUST_ELASTIC_URL", "http://localhost:9200")
+ORDER_SEARCH_INDEX = os.getenv("LOCUST_ORDER_INDEX", "orders-search")
+ORDERS_API_PREFIX = "/api/v1/orders"
+
 fake = Faker()
 
 
@@ -250,3 +266,207 @@ class KafkaUser(User):
                 response_length=0,
                 exception=e,
             )
+
+
+freshness_samples_ms = []
+freshness_stats = {"produced": 0, "timeouts": 0, "started_at": None}
+
+
+class FreshnessUser(HttpUser):
+    """
+    Produces new orders stamped with their send time and polls until each one
+    is visible, recording the produce-to-visible delay as a locust request.
+    """
+
+    # Left out of regular load tests unless explicitly enabled.
+    abstract = not os.getenv("FRESHNESS_BENCHMARK")
+    wait_time = between(0.05, 0.2)
+
+    def on_start(self):
+        self.producer = AvroProducer(
+            {
+                "bootstrap.servers": KAFKA_BOOTSTRAP_SERVERS,
+                "schema.registry.url": SCHEMA_REGISTRY_URL,
+                "linger.ms": 0,
+            },
+            default_value_schema=value_schema,
+            default_key_schema=key_schema,
+        )
+        if freshness_stats["started_at"] is None:
+            freshness_stats["started_at"] = time.time()
+
+    def on_stop(self):
+        self.producer.flush()
+
+    @task
+    def produce_and_wait(self):
+        payload = generate_unified_order_payload(status="PROCESSING")
+        order_id = payload["order"]["orderId"]
+        sent_at = time.time()
+        self.producer.produce(
+            topic=TOPIC,
+            key=order_id,
+            value=payload,
+            headers={"sent_at_ms": str(int(sent_at * 1000))},
+        )
+        self.producer.poll(0)
+        freshness_stats["produced"] += 1
+        gevent.spawn(self._wait_until_visible, order_id, sent_at)
+
+    def _is_visible(self, order_id):
+        if FRESHNESS_TARGET == "api_get":
+            response = self.client.get(f"{ORDERS_API_PREFIX}/orders/{order_id}", name="freshness_poll_get")
+            return response.status_code == 200 and response.json() is not None
+        if FRESHNESS_TARGET == "es_search":
+            response = self.client.post(
+                f"{ELASTIC_URL}/{ORDER_SEARCH_INDEX}/_search",
+                json={"query": {"ids": {"values": [order_id]}}, "_source": False},
+                name="freshness_poll_es",
+            )
+            return response.status_code == 200 and response.json()["hits"]["total"]["value"] > 0
+        response = self.client.get(
+            f"{ORDERS_API_PREFIX}/orders",
+            params={"order_id": order_id, "encrypted": "false", "size": 1},
+            name="freshness_poll_search",
+        )
+        return response.status_code == 200 and response.json()["total"] > 0
+
+    def _wait_until_visible(self, order_id, sent_at):
+        deadline = sent_at + FRESHNESS_TIMEOUT_SECONDS
+        while time.time() < deadline:
+            if self._is_visible(order_id):
+                freshness_ms = (time.time() - sent_at) * 1000
+                freshness_samples_ms.append(freshness_ms)
+                self.environment.events.request.fire(
+                    request_type="FRESHNESS",
+                    name=FRESHNESS_TARGET,
+                    response_time=freshness_ms,
+                    response_length=0,
+                    exception=None,
+                )
+                return
+            gevent.sleep(FRESHNESS_POLL_INTERVAL_SECONDS)
+
+        freshness_stats["timeouts"] += 1
+        self.environment.events.request.fire(
+            request_type="FRESHNESS",
+            name=FRESHNESS_TARGET,
+            response_time=FRESHNESS_TIMEOUT_SECONDS * 1000,
+            response_length=0,
+            exception=TimeoutError(f"Order {order_id} not visible after {FRESHNESS_TIMEOUT_SECONDS}s"),
+        )
+
+
+def _percentile(samples, percent):
+    return samples[min(int(len(samples) * percent / 100), len(samples) - 1)]
+
+
+def _refresh_interval():
+    try:
+        response = requests.get(
+            f"{ELASTIC_URL}/{ORDER_SEARCH_INDEX}/_settings/index.refresh_interval",
+            params={"include_defaults": "true", "flat_settings": "true"},
+            timeout=5,
+        )
+        intervals = set()
+        for index_settings in response.json().values():
+            for section in ("settings", "defaults"):
+                value = index_settings.get(section, {}).get("index.refresh_interval")
+                if value:
+                    intervals.add(value)
+                    break
+        return sorted(intervals)
+    except Exception as e:
+        return f"unknown ({e})"
+
+
+@events.test_stop.add_listener
+def report_freshness(environment, **kwargs):
+    if not freshness_samples_ms and not freshness_stats["timeouts"]:
+        return
+
+    samples = sorted(freshness_samples_ms)
+    elapsed = time.time() - (freshness_stats["started_at"] or time.time())
+    report = {
+        "target": FRESHNESS_TARGET,
+        "produced": freshness_stats["produced"],
+        "produce_rate_per_second": round(freshness_stats["produced"] / elapsed, 1) if elapsed else None,
+        "visible": len(samples),
+        "timeouts": freshness_stats["timeouts"],
+        "refresh_interval": _refresh_interval(),
+        # Indexer and connector settings of the run, for comparing results.
+        "indexer": {key: value for key, value in os.environ.items() if key.startswith("ORDER_INDEXER__")},
+        "connector": os.getenv("FRESHNESS_CONNECTOR_LABEL"),
+    }
+    if samples:
+        report["freshness_ms"] = {
+            "p50": round(_percentile(samples, 50), 1),
+            "p90": round(_percentile(samples, 90), 1),
+            "p95": round(_percentile(samples, 95), 1),
+            "p99": round(_percentile(samples, 99), 1),
+            "max": round(samples[-1], 1),
+        }
+
+    print(json.dumps(report, indent=2))
+    with open(FRESHNESS_REPORT_FILE, "a") as f:
+        f.write(json.dumps(report) + "\n")
+
+
+# Priority lanes benchmark: run with
+#   PRIORITY_LANES_BENCHMARK=1 locust -f scripts/locust/locust_file.py AgentUser BulkReaderUser --host http://localhost:8000
+# and compare the agent_get_order percentiles with PRIORITY_LANES__IS_ENABLED true and false on the API.
+PRIORITY_LANES_BENCHMARK = os.getenv("PRIORITY_LANES_BENCHMARK")
+
+
+class AgentUser(HttpUser):
+    """
+    A CRM agent opening single orders, the latency-sensitive traffic of the interactive lane.
+    """
+
+    abstract = not PRIORITY_LANES_BENCHMARK
+    weight = 4
+    wait_time = between(0.1, 0.5)
+
+    def on_start(self):
+        response = self.client.get(
+            f"{ORDERS_API_PREFIX}/orders",
+            params={"encrypted": "false", "size": 50},
+            name="agent_sample_orders",
+        )
+        self.order_ids = [item["orderId"] for item in response.json().get("items", [])] if response.ok else []
+
+    @task
+    def get_order(self):
+        if not self.order_ids:
+            return
+        self.client.get(f"{ORDERS_API_PREFIX}/orders/{random.choice(self.order_ids)}", name="agent_get_order")
+
+
+class BulkReaderUser(HttpUser):
+    """
+    A batch consumer paging deep into search results and streaming exports, classified into the bulk lane.
+    """
+
+    abstract = not PRIORITY_LANES_BENCHMARK
+    weight = 1
+    wait_time = between(0, 0.1)
+
+    @task(3)
+    def deep_page(self):
+        self.client.get(
+            f"{ORDERS_API_PREFIX}/orders",
+            params={"encrypted": "false", "page": random.randint(20, 100), "size": 100},
+            name="bulk_deep_page",
+        )
+
+    @task(1)
+    def export(self):
+        with self.client.get(
+            f"{ORDERS_API_PREFIX}/orders/export",
+            params={"encrypted": "false", "batch_size": 5000},
+            name="bulk_export",
+            stream=True,
+            catch_response=True,
+        ) as response:
+            for _ in response.iter_content(chunk_size=65536):
+                pass
@@ -1,10 +1,121 @@
+from typing import Literal
+
 from archipy.configs.base_config import BaseConfig
+from pydantic import BaseModel
+
+
+class OrderIndexerConfig(BaseModel):
+    BOOTSTRAP_SERVERS: str = "localhost:9092"
+    SCHEMA_REGISTRY_URL: str = "http://localhost:8081"
+    TOPIC: str = "order.events.v1"
+    GROUP_ID: str = "order-indexer-v1"
+    WRITE_ALIAS: str = "order.events.v1"
+    WORKERS_COUNT: int = 4
+    BATCH_SIZE: int = 500
+    POLL_TIMEOUT_SECONDS: float = 1.0
+    BULK_MAX_RETRIES: int = 3
+    BULK_RETRY_BACKOFF_SECONDS: float = 2.0
+    # Shared with the sink connector, so scripts/connectors/reprocess_dlq.py drains both.
+    DLQ_TOPIC: str = "dlq-elasticsearch-orders"
+    DLQ_FLUSH_TIMEOUT_SECONDS: float = 30.0
+    LAG_REPORT_INTERVAL_SECONDS: int = 30
+
+
+class OrderRecentTierConfig(BaseModel):
+    IS_ENABLED: bool = False
+    INDEX_NAME: str = "orders-recent"
+    RETENTION_DAYS: int = 30
+    NUMBER_OF_SHARDS: int = 3
+    REFRESH_INTERVAL: str = "1s"
+
+
+class OrderAnalyticsConfig(BaseModel):
+    DATA_PATH: str = "data/analytics/orders"
+    ROLLUP_DATABASE_PATH: str = "data/analytics/order_rollups.sqlite3"
+    GROUP_ID: str = "order-analytics-v1"
+    BATCH_SIZE: int = 5000
+    POLL_TIMEOUT_SECONDS: float = 5.0
+    COMPACTION_INTERVAL_SECONDS: int = 600
+    DUCKDB_THREADS: int = 2
+    DUCKDB_MEMORY_LIMIT: str = "1GB"
+    # Kept apart from the Elasticsearch DLQ, which the indexer fills with the same undecodable events.
+    DLQ_TOPIC: str = "dlq-analytics-orders"
+    DLQ_FLUSH_TIMEOUT_SECONDS: float = 30.0
+
+
+class ElasticClientConfig(BaseModel):
+    # Connections per ES node; None derives the pool from FASTAPI__LIMIT_CONCURRENCY,
+    # or from each lane's limit when PRIORITY_LANES is enabled.
+    CONNECTIONS_PER_NODE: int | None = None
+    # ES round trips one API request can hold at once (search + count), used to size the pool.
+    REQUESTS_PER_API_CALL: int = 2
+    MAX_CONNECTIONS_PER_NODE: int = 128
+    WARMUP_CONNECTIONS_PER_NODE: int = 4
+    WARMUP_TIMEOUT_SECONDS: float = 5.0
+    # Refuse to start when ES is unreachable instead of serving errors.
+    FAIL_ON_WARMUP_ERROR: bool = False
+
+
+class StartupConfig(BaseModel):
+    # Imported by the gunicorn master before forking, so preloaded workers share
+    # them even though the app imports them lazily on first use.
+    PRELOAD_MODULES: list[str] = ["duckdb"]
+
+
+class ResponseCompressionConfig(BaseModel):
+    IS_ENABLED: bool = True
+    # Responses below this size are sent as is; headers and CPU would outweigh the saved bytes.
+    MINIMUM_SIZE: int = 1024
+    # Server preference when the client accepts several encodings with the same q-value.
+    ENCODINGS: list[Literal["zstd", "br", "gzip"]] = ["zstd", "br", "gzip"]
+    GZIP_LEVEL: int = 5
+    BROTLI_QUALITY: int = 4
+    ZSTD_LEVEL: int = 3
+    COMPRESSIBLE_CONTENT_TYPES: list[str] = ["application/json", "application/x-ndjson", "text/"]
+
+
+class PriorityLanesConfig(BaseModel):
+    IS_ENABLED: bool = True
+    # Requests served at once per lane and worker; each lane's ES pool is sized from its limit.
+    INTERACTIVE_MAX_CONCURRENCY: int = 200
+    BULK_MAX_CONCURRENCY: int = 8
+    # How long a request may wait for a slot before it is answered with 503 and Retry-After.
+    INTERACTIVE_QUEUE_TIMEOUT_SECONDS: float = 2.0
+    BULK_QUEUE_TIMEOUT_SECONDS: float = 30.0
+    # A request matching any rule below runs in the bulk lane, everything else is interactive.
+    BULK_PATH_PREFIXES: list[str] = [
+        "/api/v1/orders/orders/export",
+        "/api/v1/orders/orders/facets",
+        "/api/v1/analytics/",
+    ]
+    BULK_MIN_PAGE: int = 20
+    BULK_MIN_SIZE: int = 100
+    CLIENT_ID_HEADER: str = "X-Client-Id"
+    BULK_CLIENT_IDS: list[str] = []
+    # Never queued behind API traffic.
+    EXEMPT_PATH_PREFIXES: list[str] = ["/metrics", "/docs", "/redoc", "/openapi.json"]
 
 
 class Config(BaseConfig):
     ORDER_INDEX_NAME: str = "orders-search"
+    ORDER_INDEX_MAPPING_PROFILE: Literal["full", "slim"] = "full"
+    # Search on the ingest-computed order.searchKeys instead of raw party fields. Enable
+    # once every index was created from the current template (which maps them as
+    # keywords) and written by the Python indexer or backfilled by replay.
+    ORDER_SEARCH_CANONICAL_KEYS: bool = False
+    ORDER_SEARCH_DEFAULT_COUNTRY_CODE: str = "98"
+    # Read path models: msgspec Structs derived from the Pydantic DTOs, or the DTOs themselves.
+    # Switch to msgspec once `make bench-read-models` reports parity for your documents.
+    ORDER_READ_MODEL: Literal["msgspec", "pydantic"] = "pydantic"
     VAULT_ADDR: str = "http://vault:8200"
     VAULT_TOKEN: str = "dev-root-token"
+    ORDER_INDEXER: OrderIndexerConfig = OrderIndexerConfig()
+    ORDER_RECENT_TIER: OrderRecentTierConfig = OrderRecentTierConfig()
+    ORDER_ANALYTICS: OrderAnalyticsConfig = OrderAnalyticsConfig()
+    RESPONSE_COMPRESSION: ResponseCompressionConfig = ResponseCompressionConfig()
+    ELASTIC_CLIENT: ElasticClientConfig = ElasticClientConfig()
+    STARTUP: StartupConfig = StartupConfig()
+    PRIORITY_LANES: PriorityLanesConfig = PriorityLanesConfig()
 
     def customize(self) -> None:
         self.FASTAPI.PROJECT_NAME = "Order Repository Service"
@@ -1,24 +1,39 @@
 """Containers module."""
 
 from dependency_injector import containers, providers
-from archipy.adapters.elasticsearch.adapters import AsyncElasticsearchAdapter
 from src.configs.config import Config
+from src.configs.elastic_client import create_elastic_client
 from src.models.repositories.order.adapters.order_elastic_adapter import (
     OrderElasticAdapter,
 )
 from src.models.repositories.order.order_repository import OrderRepository
 from src.logics.order.order_logic import OrderLogic
+from src.models.repositories.analytics.adapters.order_analytics_duckdb_adapter import (
+    OrderAnalyticsDuckDBAdapter,
+)
+from src.models.repositories.analytics.adapters.order_rollup_sqlite_adapter import (
+    OrderRollupSQLiteAdapter,
+)
+from src.models.repositories.analytics.order_analytics_repository import (
+    OrderAnalyticsRepository,
+)
+from src.logics.analytics.order_analytics_logic import OrderAnalyticsLogic
 
 
 class ServiceContainer(containers.DeclarativeContainer):
     _config = Config.global_config()
 
     wiring_config = containers.WiringConfiguration(
-        packages=["src.controllers.order.order_controller"],
+        packages=[
+            "src.controllers.order.order_controller",
+            "src.controllers.analytics.order_analytics_controller",
+        ],
     )
 
+    # Opened and warmed up in the app lifespan, see manage.py; one pool per
+    # priority lane when PRIORITY_LANES is enabled.
     elastic_client = providers.Singleton(
-        AsyncElasticsearchAdapter,
+        create_elastic_client,
     )
 
     # Order
@@ -34,3 +49,20 @@ class ServiceContainer(containers.DeclarativeContainer):
         OrderLogic,
         order_repository=order_repository,
     )
+
+    # Analytics
+    order_analytics_adapter = providers.Singleton(
+        OrderAnalyticsDuckDBAdapter,
+    )
+    order_rollup_adapter = providers.Singleton(
+        OrderRollupSQLiteAdapter,
+    )
+    order_analytics_repository = providers.Singleton(
+        OrderAnalyticsRepository,
+        analytics_adapter=order_analytics_adapter,
+        rollup_adapter=order_rollup_adapter,
+    )
+    order_analytics_logic = providers.Singleton(
+        OrderAnalyticsLogic,
+        order_analytics_repository=order_analytics_repository,
+    )
@@ -1,6 +1,10 @@
 from fastapi import FastAPI
+from prometheus_client import make_asgi_app
 from src.controllers.order.order_controller import router as order_router
+from src.controllers.analytics.order_analytics_controller import router as order_analytics_router
 
 
 def set_dispatch_routes(app: FastAPI) -> None:
     app.include_router(order_router, prefix="/api/v1/orders", tags=["Order"])
+    app.include_router(order_analytics_router, prefix="/api/v1/analytics", tags=["Analytics"])
+    app.mount("/metrics", make_asgi_app())
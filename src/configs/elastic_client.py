@@ -0,0 +1,161 @@
+"""Elasticsearch client tuning and its startup/shutdown lifecycle."""
+
+import asyncio
+import logging
+import math
+import time
+
+from archipy.adapters.elasticsearch.adapters import AsyncElasticsearchAdapter
+from archipy.configs.config_template import ElasticsearchConfig
+from elasticsearch import AsyncElasticsearch
+
+from src.configs.config import ElasticClientConfig, PriorityLanesConfig, settings
+from src.configs.priority_lanes import BULK_LANE, INTERACTIVE_LANE, LaneType, current_lane
+
+logger = logging.getLogger(__name__)
+
+
+def connections_per_node(
+    elastic_config: ElasticsearchConfig,
+    client_config: ElasticClientConfig,
+    limit_concurrency: int | None,
+) -> int:
+    """
+    Sizes the per-node pool so one worker can run its full uvicorn concurrency without queueing for connections.
+    """
+    if client_config.CONNECTIONS_PER_NODE:
+        return client_config.CONNECTIONS_PER_NODE
+    if not limit_concurrency:
+        return elastic_config.CONNECTIONS_PER_NODE
+    # Round-robin spreads requests evenly, so each node sees its share of the worker's concurrency.
+    wanted = math.ceil(limit_concurrency * client_config.REQUESTS_PER_API_CALL / max(len(elastic_config.HOSTS), 1))
+    return max(1, min(wanted, client_config.MAX_CONNECTIONS_PER_NODE))
+
+
+class TunedAsyncElasticsearchAdapter(AsyncElasticsearchAdapter):
+    """
+    AsyncElasticsearchAdapter with a pool sized for the API worker and the full transport configuration.
+
+    The base adapter leaves node selection, sniffing delay and dead-node
+    backoff at the client defaults; here they come from ELASTIC__* as well, so
+    a failing node is taken out of rotation and retried with backoff.
+    """
+
+    def __init__(
+        self,
+        elasticsearch_config: ElasticsearchConfig | None = None,
+        client_config: ElasticClientConfig | None = None,
+        limit_concurrency: int | None = None,
+    ) -> None:
+        self.client_config = client_config or settings.ELASTIC_CLIENT
+        # Requests this client serves at once: the worker's whole concurrency, or one priority lane's.
+        self.limit_concurrency = limit_concurrency or settings.FASTAPI.LIMIT_CONCURRENCY
+        super().__init__(elasticsearch_config)
+
+    def _get_client(self, configs: ElasticsearchConfig) -> AsyncElasticsearch:
+        api_key = basic_auth = None
+        if configs.API_KEY and configs.API_SECRET:
+            api_key = (configs.API_KEY, configs.API_SECRET.get_secret_value())
+        elif configs.HTTP_USER_NAME and configs.HTTP_PASSWORD:
+            basic_auth = (configs.HTTP_USER_NAME, configs.HTTP_PASSWORD.get_secret_value())
+
+        self.connections_per_node = connections_per_node(
+            configs,
+            self.client_config,
+            self.limit_concurrency,
+        )
+        return AsyncElasticsearch(
+            hosts=configs.HOSTS,
+            api_key=api_key,
+            basic_auth=basic_auth,
+            ca_certs=configs.CA_CERTS,
+            client_key=configs.CLIENT_KEY,
+            client_cert=configs.CLIENT_CERT,
+            ssl_assert_fingerprint=configs.SSL_ASSERT_FINGERPRINT,
+            verify_certs=configs.VERIFY_CERTS,
+            request_timeout=configs.REQUEST_TIMEOUT,
+            max_retries=configs.MAX_RETRIES,
+            retry_on_status=configs.RETRY_ON_STATUS,
+            retry_on_timeout=configs.RETRY_ON_TIMEOUT,
+            http_compress=configs.HTTP_COMPRESS,
+            connections_per_node=self.connections_per_node,
+            node_selector_class=configs.NODE_SELECTOR_CLASS,
+            sniff_on_start=configs.SNIFF_ON_START,
+            sniff_before_requests=configs.SNIFF_BEFORE_REQUESTS,
+            sniff_on_node_failure=configs.SNIFF_ON_NODE_FAILURE,
+            min_delay_between_sniffing=configs.MIN_DELAY_BETWEEN_SNIFFING,
+            dead_node_backoff_factor=configs.DEAD_NODE_BACKOFF_FACTOR,
+            max_dead_node_backoff=configs.MAX_DEAD_NODE_BACKOFF,
+        )
+
+
+class LaneRoutedElasticsearchAdapter:
+    """
+    One tuned adapter, and so one connection pool, per priority lane.
+
+    Attribute access is forwarded to the adapter of the lane serving the
+    current request, so repositories use it like a single adapter while bulk
+    requests can only ever exhaust the bulk pool.
+    """
+
+    def __init__(self, lanes_config: PriorityLanesConfig | None = None) -> None:
+        lanes_config = lanes_config or settings.PRIORITY_LANES
+        self.adapters: dict[LaneType, TunedAsyncElasticsearchAdapter] = {
+            INTERACTIVE_LANE: TunedAsyncElasticsearchAdapter(limit_concurrency=lanes_config.INTERACTIVE_MAX_CONCURRENCY),
+            BULK_LANE: TunedAsyncElasticsearchAdapter(limit_concurrency=lanes_config.BULK_MAX_CONCURRENCY),
+        }
+
+    def __getattr__(self, name: str):
+        return getattr(self.adapters[current_lane.get()], name)
+
+
+def create_elastic_client() -> TunedAsyncElasticsearchAdapter | LaneRoutedElasticsearchAdapter:
+    if settings.PRIORITY_LANES.IS_ENABLED:
+        return LaneRoutedElasticsearchAdapter()
+    return TunedAsyncElasticsearchAdapter()
+
+
+async def warm_up(
+    adapter: AsyncElasticsearchAdapter | LaneRoutedElasticsearchAdapter,
+    client_config: ElasticClientConfig | None = None,
+) -> int:
+    """
+    Opens connections before the first request arrives; returns how many pings succeeded.
+
+    The pings are sent concurrently, so each one needs its own connection and
+    the round-robin selector spreads them over the nodes. TLS handshakes and
+    TCP setup are then paid at startup instead of by the first API requests.
+    """
+    if isinstance(adapter, LaneRoutedElasticsearchAdapter):
+        return sum([await warm_up(lane_adapter, client_config) for lane_adapter in adapter.adapters.values()])
+    client_config = client_config or settings.ELASTIC_CLIENT
+    pings = client_config.WARMUP_CONNECTIONS_PER_NODE * max(len(settings.ELASTIC.HOSTS), 1)
+    if pings <= 0:
+        return 0
+
+    started = time.perf_counter()
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(*(adapter.client.ping() for _ in range(pings)), return_exceptions=True),
+            timeout=client_config.WARMUP_TIMEOUT_SECONDS,
+        )
+        succeeded = sum(1 for result in results if result is True)
+    except TimeoutError:
+        succeeded = 0
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if succeeded == 0:
+        if client_config.FAIL_ON_WARMUP_ERROR:
+            raise RuntimeError(f"Elasticsearch is unreachable at {settings.ELASTIC.HOSTS}")
+        logger.warning(f"Elasticsearch warm-up failed after {elapsed_ms:.0f}ms; connections will open on demand")
+    else:
+        logger.info(f"Elasticsearch warm-up opened {succeeded}/{pings} connections in {elapsed_ms:.0f}ms")
+    return succeeded
+
+
+async def close(adapter: AsyncElasticsearchAdapter | LaneRoutedElasticsearchAdapter) -> None:
+    if isinstance(adapter, LaneRoutedElasticsearchAdapter):
+        for lane_adapter in adapter.adapters.values():
+            await lane_adapter.client.close()
+        return
+    await adapter.client.close()
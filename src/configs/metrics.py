@@ -0,0 +1,65 @@
+"""Prometheus metrics exposed on /metrics."""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+ORDER_SEARCH_TIER_REQUESTS = Counter(
+    "order_search_tier_requests_total",
+    "Order searches by the index tier that served them and the routing decision.",
+    ["tier", "route"],
+)
+
+ORDER_EXPORT_DOCUMENTS = Counter(
+    "order_export_documents_total",
+    "Orders streamed by the NDJSON export endpoint.",
+)
+
+ORDER_CONDITIONAL_REQUESTS = Counter(
+    "order_conditional_requests_total",
+    "Conditional order reads by endpoint and whether they were answered with 304.",
+    ["endpoint", "result"],
+)
+
+RESPONSE_COMPRESSION_BYTES = Counter(
+    "response_compression_bytes_total",
+    "Response bytes before and after compression by endpoint and encoding.",
+    ["endpoint", "encoding", "stage"],
+)
+
+RESPONSE_COMPRESSION_RATIO = Histogram(
+    "response_compression_ratio",
+    "Compressed size divided by original size per response.",
+    ["endpoint", "encoding"],
+    buckets=(0.05, 0.1, 0.15, 0.2, 0.3, 0.4, 0.5, 0.7, 1.0),
+)
+
+RESPONSE_COMPRESSION_CPU_SECONDS = Histogram(
+    "response_compression_cpu_seconds",
+    "CPU time spent compressing one response.",
+    ["endpoint", "encoding"],
+    buckets=(0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+)
+
+WORKER_BOOT_SECONDS = Gauge(
+    "worker_boot_seconds",
+    "Time one API worker spent booting, by phase.",
+    ["phase"],
+)
+
+PRIORITY_LANE_REQUESTS = Counter(
+    "priority_lane_requests_total",
+    "API requests by priority lane and whether they got a slot or were rejected after queueing.",
+    ["lane", "result"],
+)
+
+PRIORITY_LANE_IN_FLIGHT = Gauge(
+    "priority_lane_in_flight",
+    "Requests holding a slot in each priority lane.",
+    ["lane"],
+)
+
+PRIORITY_LANE_QUEUE_SECONDS = Histogram(
+    "priority_lane_queue_seconds",
+    "Time a request waited for a slot in its priority lane.",
+    ["lane"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
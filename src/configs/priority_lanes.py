@@ -0,0 +1,48 @@
+"""Priority lanes: which lane a request runs in, and the lane of the request being served."""
+
+from contextvars import ContextVar
+from typing import Literal
+
+from starlette.datastructures import Headers, QueryParams
+from starlette.types import Scope
+
+from src.configs.config import PriorityLanesConfig
+
+LaneType = Literal["interactive", "bulk"]
+
+INTERACTIVE_LANE: LaneType = "interactive"
+BULK_LANE: LaneType = "bulk"
+LANES: tuple[LaneType, ...] = (INTERACTIVE_LANE, BULK_LANE)
+
+# Set by PriorityLaneMiddleware for the duration of a request; code outside a
+# request, such as the lifespan warm-up, runs in the interactive lane.
+current_lane: ContextVar[LaneType] = ContextVar("priority_lane", default=INTERACTIVE_LANE)
+
+
+def _int_param(query: QueryParams, name: str) -> int:
+    try:
+        return int(query.get(name, 0))
+    except ValueError:
+        return 0
+
+
+def classify_request(scope: Scope, config: PriorityLanesConfig) -> LaneType:
+    """
+    Sends exports, aggregations, deep or large pages and known batch clients to the bulk lane.
+
+    Only the request line and headers are looked at, so classification costs
+    nothing and happens before the request waits for a slot.
+    """
+    path = scope["path"]
+    if any(path.startswith(prefix) for prefix in config.BULK_PATH_PREFIXES):
+        return BULK_LANE
+
+    query = QueryParams(scope.get("query_string", b""))
+    if _int_param(query, "page") >= config.BULK_MIN_PAGE or _int_param(query, "size") >= config.BULK_MIN_SIZE:
+        return BULK_LANE
+
+    if config.BULK_CLIENT_IDS:
+        client_id = Headers(scope=scope).get(config.CLIENT_ID_HEADER)
+        if client_id in config.BULK_CLIENT_IDS:
+            return BULK_LANE
+    return INTERACTIVE_LANE
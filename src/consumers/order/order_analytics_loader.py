@@ -0,0 +1,121 @@
+import logging
+import time
+from threading import Event
+from typing import Any
+
+from confluent_kafka import Consumer, KafkaError, Message
+from confluent_kafka.schema_registry import SchemaRegistryClient
+
+from src.configs.config import OrderAnalyticsConfig, OrderIndexerConfig
+from src.consumers.order.order_dead_letters import DeadLetter, OrderDeadLetterProducer, message_position
+from src.models.mappers.order_analytics_mapper import created_month
+from src.models.mappers.order_avro_decoder import OrderAvroDecoder
+from src.models.repositories.analytics.adapters.order_analytics_duckdb_adapter import (
+    OrderAnalyticsDuckDBAdapter,
+)
+from src.models.repositories.analytics.adapters.order_rollup_sqlite_adapter import (
+    OrderRollupSQLiteAdapter,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class OrderAnalyticsLoader:
+    """
+    Consumes the order events topic into the columnar analytics store.
+
+    It runs in its own consumer group next to the Elasticsearch indexer, so the
+    analytical path never reads from or adds load to the operational cluster.
+    Each batch becomes one Parquet file per table and month and is applied to
+    the hourly rollups, and offsets are committed only after both are stored. Months that received data are
+    compacted periodically to keep the file count and old versions in check.
+    Undecodable events are sent to the analytics DLQ before their offsets are
+    committed; registry and network errors stop the loader instead.
+    """
+
+    def __init__(self, config: OrderAnalyticsConfig, source: OrderIndexerConfig):
+        self.config = config
+        self.source = source
+        self.store = OrderAnalyticsDuckDBAdapter(config)
+        self.rollups = OrderRollupSQLiteAdapter(config)
+        self.decoder = OrderAvroDecoder(
+            SchemaRegistryClient({"url": source.SCHEMA_REGISTRY_URL}),
+        )
+        self.consumer = Consumer(
+            {
+                "bootstrap.servers": source.BOOTSTRAP_SERVERS,
+                "group.id": config.GROUP_ID,
+                "enable.auto.commit": False,
+                "auto.offset.reset": "earliest",
+            },
+        )
+        self.dead_letters = OrderDeadLetterProducer(
+            source.BOOTSTRAP_SERVERS,
+            f"{config.GROUP_ID}-dlq",
+            config.DLQ_TOPIC,
+            config.GROUP_ID,
+            config.DLQ_FLUSH_TIMEOUT_SECONDS,
+        )
+        self._dirty_months: set[str] = set()
+        self._last_compaction = time.monotonic()
+
+    def run(self, stop_event: Event) -> None:
+        self.consumer.subscribe([self.source.TOPIC])
+        logger.info(f"Order analytics loader subscribed to '{self.source.TOPIC}'.")
+        try:
+            while not stop_event.is_set():
+                messages = self.consumer.consume(
+                    num_messages=self.config.BATCH_SIZE,
+                    timeout=self.config.POLL_TIMEOUT_SECONDS,
+                )
+                if messages:
+                    self._process_batch(messages)
+                self._compact_if_due()
+        finally:
+            self.consumer.close()
+            self.dead_letters.flush()
+            logger.info("Order analytics loader stopped.")
+
+    def _process_batch(self, messages: list[Message]) -> None:
+        valid_messages = []
+        for message in messages:
+            error = message.error()
+            if error is not None:
+                if error.code() != KafkaError._PARTITION_EOF:
+                    logger.error(f"Analytics loader consume error: {error}")
+                continue
+            valid_messages.append(message)
+        if not valid_messages:
+            return
+
+        dead_letters: list[DeadLetter] = []
+
+        def dead_letter(position: int, error: Exception) -> None:
+            dead_letters.append((valid_messages[position], "VALUE_CONVERTER", type(error).__name__, str(error)))
+
+        documents = self.decoder.decode_batch((message.value() for message in valid_messages), on_error=dead_letter)
+        # The Kafka offset is the row version: events of one order share a
+        # partition, so a later event always has a higher offset.
+        rows: list[tuple[dict[str, Any], int]] = [
+            (document["order"], message_position(message)[2])
+            for message, document in zip(valid_messages, documents)
+            if document is not None
+        ]
+        if rows:
+            self.store.write_batch(rows)
+            self.rollups.apply_batch(rows)
+            self._dirty_months.update(created_month(order) for order, _ in rows)
+        if dead_letters:
+            self.dead_letters.send(dead_letters)
+        self.consumer.commit(asynchronous=False)
+
+    def _compact_if_due(self) -> None:
+        if time.monotonic() - self._last_compaction < self.config.COMPACTION_INTERVAL_SECONDS:
+            return
+        for month in sorted(self._dirty_months):
+            try:
+                self.store.compact(month)
+            except Exception as e:
+                logger.error(f"Failed to compact analytics month {month}: {e}")
+        self._dirty_months.clear()
+        self._last_compaction = time.monotonic()
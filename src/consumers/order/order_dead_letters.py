@@ -0,0 +1,85 @@
+"""Dead-lettering of order events a consumer cannot process, in the Kafka Connect DLQ format."""
+
+import logging
+
+from confluent_kafka import Message, Producer
+
+logger = logging.getLogger(__name__)
+
+# The failed event, the Connect stage it failed in, the exception class name and the reason.
+DeadLetter = tuple[Message, str, str, str]
+
+
+def message_position(message: Message) -> tuple[str, int, int]:
+    """
+    Returns the topic, partition and offset of a consumed event; only error events lack them.
+    """
+    topic, partition, offset = message.topic(), message.partition(), message.offset()
+    if topic is None or partition is None or offset is None:
+        raise ValueError(f"Consumed message has no position: {message.error()}")
+    return topic, partition, offset
+
+
+class OrderDeadLetterProducer:
+    """
+    Produces failed order events to a DLQ topic with the Kafka Connect error headers.
+
+    The headers are those the Elasticsearch sink connector writes, so one
+    reprocessor reads both; the connector name header carries the consumer
+    group that dead-lettered the event.
+    """
+
+    def __init__(
+        self,
+        bootstrap_servers: str,
+        client_id: str,
+        topic: str,
+        connector_name: str,
+        flush_timeout_seconds: float,
+    ):
+        self.topic = topic
+        self.connector_name = connector_name
+        self.flush_timeout_seconds = flush_timeout_seconds
+        self.producer = Producer(
+            {
+                "bootstrap.servers": bootstrap_servers,
+                "client.id": client_id,
+                "enable.idempotence": True,
+            },
+        )
+
+    def send(self, dead_letters: list[DeadLetter]) -> None:
+        """
+        Produces the events and waits until Kafka acknowledged every one of them; raises otherwise.
+        """
+        delivery_errors = []
+
+        def on_delivery(error, _):
+            if error is not None:
+                delivery_errors.append(error)
+
+        for message, stage, exception_class, reason in dead_letters:
+            headers: list[tuple[str, str | bytes | None]] = [
+                *(message.headers() or []),
+                ("__connect.errors.connector.name", self.connector_name),
+                ("__connect.errors.topic", message.topic()),
+                ("__connect.errors.partition", str(message.partition())),
+                ("__connect.errors.offset", str(message.offset())),
+                ("__connect.errors.stage", stage),
+                ("__connect.errors.exception.class.name", exception_class),
+                ("__connect.errors.exception.message", reason),
+            ]
+            self.producer.produce(
+                self.topic,
+                key=message.key(),
+                value=message.value(),
+                headers=headers,
+                on_delivery=on_delivery,
+            )
+        remaining = self.producer.flush(self.flush_timeout_seconds)
+        if remaining or delivery_errors:
+            raise RuntimeError(f"Failed to dead-letter {remaining + len(delivery_errors)} events to '{self.topic}'")
+        logger.warning(f"Sent {len(dead_letters)} events to '{self.topic}'")
+
+    def flush(self) -> None:
+        self.producer.flush(self.flush_timeout_seconds)
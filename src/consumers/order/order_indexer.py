@@ -0,0 +1,328 @@
+import json
+import logging
+import multiprocessing
+import signal
+import time
+from datetime import datetime, timedelta, timezone
+from multiprocessing.synchronize import Event
+from typing import Any, cast
+
+from confluent_kafka import Consumer, KafkaError, Message, TopicPartition
+from confluent_kafka.schema_registry import SchemaRegistryClient
+from elasticsearch import Elasticsearch, TransportError
+from elasticsearch.helpers import bulk
+
+from src.configs.config import Config, OrderIndexerConfig, OrderRecentTierConfig
+from src.consumers.order.order_dead_letters import DeadLetter, OrderDeadLetterProducer, message_position
+from src.models.mappers.order_avro_decoder import OrderAvroDecoder, is_undecodable
+from src.models.mappers.order_es_mapper import to_bulk_action
+
+logger = logging.getLogger(__name__)
+
+
+class OrderIndexerWorker:
+    """
+    Consumes a subset of the order events partitions and indexes them into Elasticsearch.
+
+    Every worker joins the same consumer group, so Kafka hands each one its own
+    partitions. Messages of a partition are processed in offset order and an
+    order key always maps to one partition, which keeps per-``orderId`` ordering.
+    Offsets are committed synchronously after each bulk request and on partition
+    revocation, so a rebalance never hands already-indexed messages to another worker.
+
+    A batch's offsets are only recorded once each of its events is indexed,
+    superseded or dead-lettered. Transient bulk failures (429, 5xx, connection
+    errors) are retried with backoff; if they persist the worker exits without
+    committing and is restarted from the last committed offset. Undecodable
+    events and documents Elasticsearch rejects are sent to the DLQ topic with
+    the Kafka Connect error headers, so the sink DLQ reprocessor handles both.
+    """
+
+    _VERSION_CONFLICT_STATUS = 409
+    _TRANSIENT_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        worker_id: int,
+        config: OrderIndexerConfig,
+        elastic_hosts: list[str] | str,
+        recent_tier: OrderRecentTierConfig | None = None,
+    ):
+        self.worker_id = worker_id
+        self.config = config
+        self.recent_tier = recent_tier
+        self.elastic_client = Elasticsearch(hosts=elastic_hosts)
+        self.decoder = OrderAvroDecoder(
+            SchemaRegistryClient({"url": config.SCHEMA_REGISTRY_URL}),
+        )
+        self.consumer = Consumer(
+            {
+                "bootstrap.servers": config.BOOTSTRAP_SERVERS,
+                "group.id": config.GROUP_ID,
+                "client.id": f"{config.GROUP_ID}-{worker_id}",
+                "enable.auto.commit": False,
+                "auto.offset.reset": "earliest",
+                "partition.assignment.strategy": "cooperative-sticky",
+            },
+        )
+        # The connector name tells the DLQ reprocessor these documents are versioned by Kafka offset.
+        self.dead_letters = OrderDeadLetterProducer(
+            config.BOOTSTRAP_SERVERS,
+            f"{config.GROUP_ID}-{worker_id}-dlq",
+            config.DLQ_TOPIC,
+            config.GROUP_ID,
+            config.DLQ_FLUSH_TIMEOUT_SECONDS,
+        )
+        self._pending_offsets: dict[tuple[str, int], int] = {}
+        self._last_lag_report = 0.0
+
+    def run(self, stop_event: Event) -> None:
+        self.consumer.subscribe(
+            [self.config.TOPIC],
+            on_assign=self._on_assign,
+            on_revoke=self._on_revoke,
+            on_lost=self._on_lost,
+        )
+        logger.info(f"Order indexer worker {self.worker_id} subscribed to '{self.config.TOPIC}'.")
+        try:
+            while not stop_event.is_set():
+                messages = self.consumer.consume(
+                    num_messages=self.config.BATCH_SIZE,
+                    timeout=self.config.POLL_TIMEOUT_SECONDS,
+                )
+                if messages:
+                    self._process_batch(messages)
+                    self._commit_pending()
+                self._report_lag()
+        finally:
+            self._commit_pending()
+            self.consumer.close()
+            self.dead_letters.flush()
+            self.elastic_client.close()
+            logger.info(f"Order indexer worker {self.worker_id} stopped.")
+
+    def _process_batch(self, messages: list[Message]) -> None:
+        valid_messages = []
+        for message in messages:
+            error = message.error()
+            if error is not None:
+                if error.code() != KafkaError._PARTITION_EOF:
+                    logger.error(f"Worker {self.worker_id} consume error: {error}")
+                continue
+            valid_messages.append(message)
+
+        # Keep only the latest event per order; older events of the same order
+        # in this batch would be overwritten anyway.
+        latest_by_order: dict[str, tuple[Message, dict[str, Any]]] = {}
+        dead_letters: list[DeadLetter] = []
+        for message in valid_messages:
+            document = self._decode(message, dead_letters)
+            if document is None:
+                continue
+            action = to_bulk_action(self.config.WRITE_ALIAS, document, message_position(message)[2])
+            latest_by_order[action["_id"]] = (message, action)
+
+        actions = [action for _, action in latest_by_order.values()]
+        if self.recent_tier is not None and self.recent_tier.IS_ENABLED:
+            actions.extend(self._recent_tier_actions(actions, self.recent_tier))
+        if actions:
+            for order_id, status, error in self._bulk_index(actions):
+                message, _ = latest_by_order[order_id]
+                reason = json.dumps(error, default=str)
+                dead_letters.append((message, "TASK_PUT", f"ElasticsearchStatus{status}", reason))
+        if dead_letters:
+            self.dead_letters.send(dead_letters)
+
+        for message in valid_messages:
+            topic, partition, offset = message_position(message)
+            self._pending_offsets[(topic, partition)] = offset + 1
+
+    def _decode(self, message: Message, dead_letters: list[DeadLetter]) -> dict[str, Any] | None:
+        """
+        Decodes an event, or queues it for the DLQ and returns None; tombstones are skipped.
+
+        Registry and network errors are raised, so they stop the worker instead
+        of dead-lettering events that are fine.
+        """
+        value = message.value()
+        if value is None:
+            return None
+        try:
+            return self.decoder.decode(value)
+        except Exception as e:
+            if not is_undecodable(e):
+                raise
+            logger.error(
+                f"Worker {self.worker_id} cannot decode offset {message.offset()} "
+                f"of partition {message.partition()}: {e}"
+            )
+            dead_letters.append((message, "VALUE_CONVERTER", type(e).__name__, str(e)))
+            return None
+
+    def _recent_tier_actions(
+        self,
+        actions: list[dict[str, Any]],
+        recent_tier: OrderRecentTierConfig,
+    ) -> list[dict[str, Any]]:
+        """
+        Duplicates the actions of orders created inside the recent window into the recent index.
+        """
+        window_start = datetime.now(timezone.utc) - timedelta(days=recent_tier.RETENTION_DAYS)
+        recent_actions = []
+        for action in actions:
+            try:
+                created_at = datetime.fromisoformat(action["_source"]["order"]["createdAt"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            if created_at >= window_start:
+                recent_actions.append({**action, "_index": recent_tier.INDEX_NAME})
+        return recent_actions
+
+    def _bulk_index(self, actions: list[dict[str, Any]]) -> list[tuple[str, int, Any]]:
+        """
+        Indexes actions until each one succeeds, conflicts or is rejected; returns the write alias rejections.
+
+        Transient failures are retried with exponential backoff up to
+        BULK_MAX_RETRIES times, then raised, so their offsets are never committed.
+        """
+        recent_index = self.recent_tier.INDEX_NAME if self.recent_tier is not None else None
+        pending = {(action["_index"] == recent_index, action["_id"]): action for action in actions}
+        rejected = []
+        for attempt in range(self.config.BULK_MAX_RETRIES + 1):
+            if attempt:
+                logger.warning(f"Worker {self.worker_id} retrying {len(pending)} orders, attempt {attempt + 1}")
+                time.sleep(self.config.BULK_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            try:
+                _, errors = bulk(
+                    self.elastic_client,
+                    pending.values(),
+                    raise_on_error=False,
+                    raise_on_exception=False,
+                )
+            except TransportError as e:
+                # Connection errors and timeouts are raised even with raise_on_exception=False.
+                logger.error(f"Worker {self.worker_id} bulk request failed: {e}")
+                continue
+
+            failed = {}
+            # Without stats_only, bulk returns the failed items rather than their count.
+            for error in cast(list[dict[str, Any]], errors):
+                item = next(iter(error.values()))
+                is_recent = item.get("_index") == recent_index
+                status = item.get("status")
+                if status == self._VERSION_CONFLICT_STATUS:
+                    # A newer or identical event of this order is already indexed.
+                    continue
+                if status in self._TRANSIENT_STATUSES:
+                    failed[(is_recent, item["_id"])] = pending[(is_recent, item["_id"])]
+                elif is_recent:
+                    # The recent tier only mirrors the write alias, so its rejections are not dead-lettered.
+                    logger.error(f"Worker {self.worker_id} failed to mirror order '{item['_id']}': {item.get('error')}")
+                else:
+                    rejected.append((item["_id"], status, item.get("error")))
+            if not failed:
+                return rejected
+            pending = failed
+        raise RuntimeError(f"Worker {self.worker_id} could not index {len(pending)} orders, leaving offsets uncommitted")
+
+    def _commit_pending(self, partitions: list[TopicPartition] | None = None) -> None:
+        if partitions is None:
+            keys = list(self._pending_offsets)
+        else:
+            keys = [(p.topic, p.partition) for p in partitions if (p.topic, p.partition) in self._pending_offsets]
+        if not keys:
+            return
+
+        offsets = [TopicPartition(topic, partition, self._pending_offsets[(topic, partition)]) for topic, partition in keys]
+        try:
+            self.consumer.commit(offsets=offsets, asynchronous=False)
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id} failed to commit offsets: {e}")
+            return
+        for key in keys:
+            self._pending_offsets.pop(key, None)
+
+    def _on_assign(self, consumer: Consumer, partitions: list[TopicPartition]) -> None:
+        logger.info(f"Worker {self.worker_id} assigned partitions: {[p.partition for p in partitions]}")
+
+    def _on_revoke(self, consumer: Consumer, partitions: list[TopicPartition]) -> None:
+        logger.info(f"Worker {self.worker_id} revoked partitions: {[p.partition for p in partitions]}")
+        self._commit_pending(partitions)
+
+    def _on_lost(self, consumer: Consumer, partitions: list[TopicPartition]) -> None:
+        logger.warning(f"Worker {self.worker_id} lost partitions: {[p.partition for p in partitions]}")
+        for partition in partitions:
+            self._pending_offsets.pop((partition.topic, partition.partition), None)
+
+    def _report_lag(self) -> None:
+        now = time.monotonic()
+        if now - self._last_lag_report < self.config.LAG_REPORT_INTERVAL_SECONDS:
+            return
+        self._last_lag_report = now
+
+        assignment = self.consumer.assignment()
+        if not assignment:
+            return
+
+        lags = {}
+        for partition in self.consumer.position(assignment):
+            _, high = self.consumer.get_watermark_offsets(partition, cached=False)
+            position = partition.offset if partition.offset >= 0 else high
+            lags[partition.partition] = max(high - position, 0)
+        logger.info(f"Worker {self.worker_id} lag per partition: {lags} (total {sum(lags.values())})")
+
+
+def _run_worker(worker_id: int, stop_event: Event) -> None:
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+
+    config = Config.global_config()
+    worker = OrderIndexerWorker(
+        worker_id,
+        config.ORDER_INDEXER,
+        config.ELASTIC.HOSTS,
+        recent_tier=config.ORDER_RECENT_TIER,
+    )
+    worker.run(stop_event)
+
+
+def run_order_indexer(workers_count: int | None = None) -> None:
+    """
+    Starts the order indexer in multi-process mode and supervises its workers.
+
+    Each worker is a separate process so Avro decoding and mapping scale with cores.
+    A worker that exits unexpectedly is restarted; the consumer group rebalances
+    its partitions in the meantime.
+    """
+    config = Config.global_config().ORDER_INDEXER
+    workers_count = workers_count or config.WORKERS_COUNT
+
+    context = multiprocessing.get_context("spawn")
+    stop_event = context.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+
+    def start(worker_id: int) -> multiprocessing.process.BaseProcess:
+        process = context.Process(
+            target=_run_worker,
+            args=(worker_id, stop_event),
+            name=f"order-indexer-{worker_id}",
+        )
+        process.start()
+        return process
+
+    workers = {worker_id: start(worker_id) for worker_id in range(workers_count)}
+    logger.info(f"Started {workers_count} order indexer workers.")
+
+    while not stop_event.is_set():
+        for worker_id, process in workers.items():
+            if not process.is_alive():
+                logger.warning(f"Worker {worker_id} exited with code {process.exitcode}. Restarting...")
+                workers[worker_id] = start(worker_id)
+        stop_event.wait(1.0)
+
+    for process in workers.values():
+        process.join()
+    logger.info("Order indexer stopped.")
@@ -0,0 +1,54 @@
+from typing import Annotated
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, Query
+from src.logics.analytics.order_analytics_logic import OrderAnalyticsLogic
+from src.models.dtos.analytics.order_analytics_domain_interface_dtos import (
+    ChannelBreakdownInputDTO,
+    ChannelBreakdownOutputDTO,
+    RevenueInputDTO,
+    RevenueOutputDTO,
+    RollupInputDTO,
+    RollupOutputDTO,
+    StatusFunnelInputDTO,
+    StatusFunnelOutputDTO,
+)
+from src.configs.containers import ServiceContainer
+
+
+router = APIRouter()
+
+
+@router.get("/orders/revenue")
+@inject
+async def revenue(
+    input_dto: Annotated[RevenueInputDTO, Query()],
+    order_analytics_logic: Annotated[OrderAnalyticsLogic, Depends(Provide[ServiceContainer.order_analytics_logic])],
+) -> RevenueOutputDTO:
+    return await order_analytics_logic.revenue(input_dto)
+
+
+@router.get("/orders/status-funnel")
+@inject
+async def status_funnel(
+    input_dto: Annotated[StatusFunnelInputDTO, Query()],
+    order_analytics_logic: Annotated[OrderAnalyticsLogic, Depends(Provide[ServiceContainer.order_analytics_logic])],
+) -> StatusFunnelOutputDTO:
+    return await order_analytics_logic.status_funnel(input_dto)
+
+
+@router.get("/orders/channels")
+@inject
+async def channel_breakdown(
+    input_dto: Annotated[ChannelBreakdownInputDTO, Query()],
+    order_analytics_logic: Annotated[OrderAnalyticsLogic, Depends(Provide[ServiceContainer.order_analytics_logic])],
+) -> ChannelBreakdownOutputDTO:
+    return await order_analytics_logic.channel_breakdown(input_dto)
+
+
+@router.get("/orders/rollups")
+@inject
+async def rollups(
+    input_dto: Annotated[RollupInputDTO, Query()],
+    order_analytics_logic: Annotated[OrderAnalyticsLogic, Depends(Provide[ServiceContainer.order_analytics_logic])],
+) -> RollupOutputDTO:
+    return await order_analytics_logic.rollups(input_dto)
@@ -1,33 +1,123 @@
-from typing import Annotated
+from typing import Annotated, Any
+import msgspec
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from src.logics.order.order_logic import OrderLogic
 from src.models.dtos.order.order_domain_interface_dtos import (
+    ExportOrdersInputDTO,
     GetOrderByIdInputDTO,
     GetOrderByIdOutputDTO,
+    GetOrderFacetsInputDTO,
+    GetOrderFacetsOutputDTO,
     SearchOrdersInputDTO,
     SearchOrdersOutputDTO,
 )
 from src.configs.containers import ServiceContainer
+from src.configs.metrics import ORDER_CONDITIONAL_REQUESTS
+from src.models.dtos.order.order_structs import encode_response
+from src.models.mappers.order_etag import etag_matches
+from src.models.types.order_types import ReadConsistencyType
 
 
 router = APIRouter()
 
 
-@router.get("/orders/{order_id}")
+class MsgspecJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return encode_response(content)
+
+
+def _respond(output_dto: Any, response: Response) -> Any:
+    etag = getattr(output_dto, "etag", None)
+    if etag:
+        response.headers["ETag"] = etag
+    if isinstance(output_dto, msgspec.Struct):
+        # Compact read models are encoded as they are, skipping response-model validation.
+        return MsgspecJSONResponse(output_dto, headers=response.headers)
+    return output_dto
+
+
+# Registered before /orders/{order_id} so "facets" and "export" are not taken for an order ID.
+@router.get("/orders/facets")
+@inject
+async def get_order_facets(
+    input_dto: Annotated[GetOrderFacetsInputDTO, Query()],
+    order_logic: Annotated[OrderLogic, Depends(Provide[ServiceContainer.order_logic])],
+) -> GetOrderFacetsOutputDTO:
+    return await order_logic.get_order_facets(input_dto)
+
+
+@router.get("/orders/export")
+@inject
+async def export_orders(
+    input_dto: Annotated[ExportOrdersInputDTO, Query()],
+    order_logic: Annotated[OrderLogic, Depends(Provide[ServiceContainer.order_logic])],
+) -> StreamingResponse:
+    return StreamingResponse(order_logic.export_orders(input_dto), media_type="application/x-ndjson")
+
+
+def _not_modified(endpoint: str, etag: str) -> Response:
+    ORDER_CONDITIONAL_REQUESTS.labels(endpoint=endpoint, result="not_modified").inc()
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+@router.head("/orders/{order_id}")
+@inject
+async def probe_order(
+    order_id: str,
+    order_logic: Annotated[OrderLogic, Depends(Provide[ServiceContainer.order_logic])],
+    consistency: Annotated[ReadConsistencyType, Query()] = ReadConsistencyType.EVENTUAL,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """
+    Existence and version probe: answers from the document metadata, without fetching _source.
+    """
+    input_dto = GetOrderByIdInputDTO(order_id=order_id, consistency=consistency)
+    order_version = await order_logic.get_order_version(input_dto)
+    if order_version is None:
+        return Response(status_code=status.HTTP_404_NOT_FOUND)
+    etag = order_version.etag
+    if etag and etag_matches(if_none_match, etag):
+        return _not_modified("probe", etag)
+    return Response(headers={"ETag": etag} if etag else None)
+
+
+@router.get("/orders/{order_id}", response_model=GetOrderByIdOutputDTO)
 @inject
 async def get_order_by_id(
     order_id: str,
+    response: Response,
     order_logic: Annotated[OrderLogic, Depends(Provide[ServiceContainer.order_logic])],
-) -> GetOrderByIdOutputDTO:
-    input_dto = GetOrderByIdInputDTO(order_id=order_id)
-    return await order_logic.get_order_by_id(input_dto)
+    consistency: Annotated[ReadConsistencyType, Query()] = ReadConsistencyType.EVENTUAL,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> GetOrderByIdOutputDTO | Response:
+    input_dto = GetOrderByIdInputDTO(order_id=order_id, consistency=consistency)
+    if if_none_match:
+        # Revalidation reads only the version, so an unchanged order is never fetched or serialized.
+        order_version = await order_logic.get_order_version(input_dto)
+        if order_version is not None and order_version.etag and etag_matches(if_none_match, order_version.etag):
+            return _not_modified("get", order_version.etag)
+        ORDER_CONDITIONAL_REQUESTS.labels(endpoint="get", result="modified").inc()
 
+    output_dto = await order_logic.get_order_by_id(input_dto)
+    return _respond(output_dto, response)
 
-@router.get("/orders")
+
+@router.get("/orders", response_model=SearchOrdersOutputDTO)
 @inject
 async def search_orders(
     input_dto: Annotated[SearchOrdersInputDTO, Query()],
+    response: Response,
     order_logic: Annotated[OrderLogic, Depends(Provide[ServiceContainer.order_logic])],
-) -> SearchOrdersOutputDTO:
-    return await order_logic.search_orders(input_dto)
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> SearchOrdersOutputDTO | Response:
+    # A read-your-writes wait must run before anything is compared, so it skips the probe.
+    if if_none_match and not input_dto.wait_for_order_id:
+        etag = await order_logic.get_search_page_etag(input_dto)
+        if etag_matches(if_none_match, etag):
+            return _not_modified("search", etag)
+        ORDER_CONDITIONAL_REQUESTS.labels(endpoint="search", result="modified").inc()
+
+    output_dto = await order_logic.search_orders(input_dto)
+    return _respond(output_dto, response)
@@ -0,0 +1,46 @@
+from src.models.repositories.analytics.order_analytics_repository import (
+    OrderAnalyticsRepository,
+)
+from src.models.dtos.analytics.order_analytics_domain_interface_dtos import (
+    ChannelBreakdownInputDTO,
+    ChannelBreakdownOutputDTO,
+    RevenueInputDTO,
+    RevenueOutputDTO,
+    RollupInputDTO,
+    RollupOutputDTO,
+    StatusFunnelInputDTO,
+    StatusFunnelOutputDTO,
+)
+
+
+class OrderAnalyticsLogic:
+    def __init__(self, order_analytics_repository: OrderAnalyticsRepository):
+        self.order_analytics_repository = order_analytics_repository
+
+    async def revenue(
+        self,
+        input_dto: RevenueInputDTO,
+    ) -> RevenueOutputDTO:
+        response = await self.order_analytics_repository.revenue(input_dto)
+        return RevenueOutputDTO.model_validate(response, from_attributes=True)
+
+    async def status_funnel(
+        self,
+        input_dto: StatusFunnelInputDTO,
+    ) -> StatusFunnelOutputDTO:
+        response = await self.order_analytics_repository.status_funnel(input_dto)
+        return StatusFunnelOutputDTO.model_validate(response, from_attributes=True)
+
+    async def channel_breakdown(
+        self,
+        input_dto: ChannelBreakdownInputDTO,
+    ) -> ChannelBreakdownOutputDTO:
+        response = await self.order_analytics_repository.channel_breakdown(input_dto)
+        return ChannelBreakdownOutputDTO.model_validate(response, from_attributes=True)
+
+    async def rollups(
+        self,
+        input_dto: RollupInputDTO,
+    ) -> RollupOutputDTO:
+        response = await self.order_analytics_repository.rollups(input_dto)
+        return RollupOutputDTO.model_validate(response, from_attributes=True)
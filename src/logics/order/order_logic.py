@@ -1,7 +1,13 @@
+from collections.abc import AsyncIterator
+
 from src.models.repositories.order.order_repository import OrderRepository
 from src.models.dtos.order.order_domain_interface_dtos import (
+    ExportOrdersInputDTO,
     GetOrderByIdInputDTO,
     GetOrderByIdOutputDTO,
+    GetOrderFacetsInputDTO,
+    GetOrderFacetsOutputDTO,
+    GetOrderVersionOutputDTO,
     SearchOrdersInputDTO,
     SearchOrdersOutputDTO,
 )
@@ -17,8 +23,36 @@ class OrderLogic:
     ) -> GetOrderByIdOutputDTO:
         return await self.order_repository.get_order_by_id(input_dto)
 
+    async def get_order_version(
+        self,
+        input_dto: GetOrderByIdInputDTO,
+    ) -> GetOrderVersionOutputDTO | None:
+        response = await self.order_repository.get_order_version(input_dto)
+        if response is None:
+            return None
+        return GetOrderVersionOutputDTO.model_validate(response, from_attributes=True)
+
     async def search_orders(
         self,
         input_dto: SearchOrdersInputDTO,
     ) -> SearchOrdersOutputDTO:
         return await self.order_repository.search_orders(input_dto)
+
+    async def get_search_page_etag(
+        self,
+        input_dto: SearchOrdersInputDTO,
+    ) -> str:
+        return await self.order_repository.get_search_page_etag(input_dto)
+
+    async def get_order_facets(
+        self,
+        input_dto: GetOrderFacetsInputDTO,
+    ) -> GetOrderFacetsOutputDTO:
+        response = await self.order_repository.get_order_facets(input_dto)
+        return GetOrderFacetsOutputDTO.model_validate(response, from_attributes=True)
+
+    def export_orders(
+        self,
+        input_dto: ExportOrdersInputDTO,
+    ) -> AsyncIterator[bytes]:
+        return self.order_repository.export_orders(input_dto)
@@ -0,0 +1,76 @@
+import asyncio
+import math
+import time
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.configs.config import PriorityLanesConfig, settings
+from src.configs.metrics import (
+    PRIORITY_LANE_IN_FLIGHT,
+    PRIORITY_LANE_QUEUE_SECONDS,
+    PRIORITY_LANE_REQUESTS,
+)
+from src.configs.priority_lanes import BULK_LANE, INTERACTIVE_LANE, LaneType, classify_request, current_lane
+
+
+class PriorityLaneMiddleware:
+    """
+    Runs every API request in the interactive or the bulk lane, each with its own concurrency limit.
+
+    Bulk requests beyond BULK_MAX_CONCURRENCY queue among themselves, so a burst
+    of exports or deep pages never takes event loop time or ES connections from
+    single-order lookups. A request that waits longer than its lane's queue
+    timeout gets a 503 with Retry-After instead of piling up. The lane is
+    published in `current_lane` for the lane-aware ES client.
+    """
+
+    def __init__(self, app: ASGIApp, config: PriorityLanesConfig | None = None):
+        self.app = app
+        self.config = config or settings.PRIORITY_LANES
+        self.semaphores = {
+            INTERACTIVE_LANE: asyncio.Semaphore(self.config.INTERACTIVE_MAX_CONCURRENCY),
+            BULK_LANE: asyncio.Semaphore(self.config.BULK_MAX_CONCURRENCY),
+        }
+        self.queue_timeouts = {
+            INTERACTIVE_LANE: self.config.INTERACTIVE_QUEUE_TIMEOUT_SECONDS,
+            BULK_LANE: self.config.BULK_QUEUE_TIMEOUT_SECONDS,
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not self.config.IS_ENABLED
+            or any(scope["path"].startswith(prefix) for prefix in self.config.EXEMPT_PATH_PREFIXES)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        lane = classify_request(scope, self.config)
+        semaphore = self.semaphores[lane]
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeouts[lane])
+        except TimeoutError:
+            PRIORITY_LANE_REQUESTS.labels(lane=lane, result="rejected").inc()
+            await self._reject(lane, scope, receive, send)
+            return
+
+        PRIORITY_LANE_QUEUE_SECONDS.labels(lane=lane).observe(time.perf_counter() - started)
+        PRIORITY_LANE_REQUESTS.labels(lane=lane, result="admitted").inc()
+        PRIORITY_LANE_IN_FLIGHT.labels(lane=lane).inc()
+        token = current_lane.set(lane)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_lane.reset(token)
+            PRIORITY_LANE_IN_FLIGHT.labels(lane=lane).dec()
+            semaphore.release()
+
+    async def _reject(self, lane: LaneType, scope: Scope, receive: Receive, send: Send) -> None:
+        response = JSONResponse(
+            {"detail": f"Too many concurrent {lane} requests, retry later"},
+            status_code=503,
+            headers={"Retry-After": str(max(1, math.ceil(self.queue_timeouts[lane])))},
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,212 @@
+import time
+import zlib
+
+import brotli
+import zstandard
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.configs.config import ResponseCompressionConfig, settings
+from src.configs.metrics import (
+    RESPONSE_COMPRESSION_BYTES,
+    RESPONSE_COMPRESSION_CPU_SECONDS,
+    RESPONSE_COMPRESSION_RATIO,
+)
+
+_NOT_COMPRESSIBLE_STATUSES = {204, 304}
+
+
+class _GzipCodec:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliCodec:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdCodec:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+_Codec = _GzipCodec | _BrotliCodec | _ZstdCodec
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """
+    Parses an Accept-Encoding header into encoding -> q-value.
+    """
+    accepted = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    return accepted
+
+
+class ResponseCompressionMiddleware:
+    """
+    Compresses responses with zstd, brotli or gzip, whichever the client prefers.
+
+    Complete responses below MINIMUM_SIZE are sent uncompressed. Streaming
+    responses are compressed chunk by chunk with a flush after every chunk, so
+    clients still receive NDJSON exports progressively. Input/output bytes and
+    the CPU time spent compressing are recorded per route template.
+    """
+
+    def __init__(self, app: ASGIApp, config: ResponseCompressionConfig | None = None):
+        self.app = app
+        self.config = config or settings.RESPONSE_COMPRESSION
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.config.IS_ENABLED or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = self.negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self.config, scope, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+    def negotiate(self, accept_encoding: str) -> str | None:
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+        best, best_quality = None, 0.0
+        for encoding in self.config.ENCODINGS:
+            quality = accepted.get(encoding, wildcard)
+            # Strictly greater keeps the server preference on ties.
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+
+class _CompressionResponder:
+    def __init__(self, config: ResponseCompressionConfig, scope: Scope, send: Send, encoding: str):
+        self.config = config
+        self.scope = scope
+        self._send = send
+        self.encoding = encoding
+        self.start_message: Message | None = None
+        self.codec: _Codec | None = None
+        self.passthrough = False
+        self.input_bytes = self.output_bytes = 0
+        self.cpu_seconds = 0.0
+
+    def _new_codec(self) -> _Codec:
+        if self.encoding == "zstd":
+            return _ZstdCodec(self.config.ZSTD_LEVEL)
+        if self.encoding == "br":
+            return _BrotliCodec(self.config.BROTLI_QUALITY)
+        return _GzipCodec(self.config.GZIP_LEVEL)
+
+    def _is_compressible(self, start_message: Message, headers: MutableHeaders) -> bool:
+        if start_message["status"] in _NOT_COMPRESSIBLE_STATUSES or "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return any(content_type.startswith(prefix) for prefix in self.config.COMPRESSIBLE_CONTENT_TYPES)
+
+    def _compress(self, codec: _Codec, data: bytes, final: bool) -> bytes:
+        started = time.thread_time()
+        compressed = codec.compress(data) if data else b""
+        if final:
+            compressed += codec.finish()
+        self.cpu_seconds += time.thread_time() - started
+        self.input_bytes += len(data)
+        self.output_bytes += len(compressed)
+        return compressed
+
+    def _record(self) -> None:
+        route = self.scope.get("route")
+        endpoint = getattr(route, "path", None) or "unmatched"
+        RESPONSE_COMPRESSION_BYTES.labels(endpoint=endpoint, encoding=self.encoding, stage="input").inc(
+            self.input_bytes,
+        )
+        RESPONSE_COMPRESSION_BYTES.labels(endpoint=endpoint, encoding=self.encoding, stage="output").inc(
+            self.output_bytes,
+        )
+        RESPONSE_COMPRESSION_CPU_SECONDS.labels(endpoint=endpoint, encoding=self.encoding).observe(self.cpu_seconds)
+        if self.input_bytes:
+            RESPONSE_COMPRESSION_RATIO.labels(endpoint=endpoint, encoding=self.encoding).observe(
+                self.output_bytes / self.input_bytes,
+            )
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Held back until the first body chunk shows the response size.
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        start_message = self.start_message
+        if start_message is None:
+            raise RuntimeError("Response body sent before http.response.start")
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        codec = self.codec
+        if codec is None:
+            headers = MutableHeaders(raw=start_message["headers"])
+            if not self._is_compressible(start_message, headers):
+                self.passthrough = True
+                await self._send(start_message)
+                await self._send(message)
+                return
+            # The representation depends on Accept-Encoding even when it is not compressed.
+            headers.add_vary_header("Accept-Encoding")
+            if not more_body and len(body) < self.config.MINIMUM_SIZE:
+                self.passthrough = True
+                await self._send(start_message)
+                await self._send(message)
+                return
+
+            codec = self.codec = self._new_codec()
+            headers["Content-Encoding"] = self.encoding
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                # The compressed bytes differ from the identity ones, so the ETag is no longer strong.
+                headers["ETag"] = f"W/{etag}"
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                body = self._compress(codec, body, final=True)
+                headers["Content-Length"] = str(len(body))
+                await self._send(start_message)
+                await self._send({"type": "http.response.body", "body": body})
+                self._record()
+                return
+            await self._send(start_message)
+
+        body = self._compress(codec, body, final=not more_body)
+        await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+        if not more_body:
+            self._record()
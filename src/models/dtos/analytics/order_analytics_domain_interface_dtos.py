@@ -0,0 +1,57 @@
+from datetime import date, datetime
+
+from pydantic import Field
+from archipy.models.dtos.base_dtos import BaseDTO
+from src.models.dtos.analytics.order_analytics_dto import (
+    ChannelBreakdownItem,
+    RevenueBucket,
+    RollupBucket,
+    StatusFunnelStage,
+)
+from src.models.types.analytics_types import AnalyticsIntervalType
+
+
+class RevenueInputDTO(BaseDTO):
+    from_date: date | None = Field(None, description="First day included, by order creation date")
+    to_date: date | None = Field(None, description="Last day included, by order creation date")
+    interval: AnalyticsIntervalType = Field(AnalyticsIntervalType.DAY, description="Bucket size")
+    channel: str | None = None
+    currency: str | None = None
+
+
+class RevenueOutputDTO(BaseDTO):
+    interval: AnalyticsIntervalType
+    buckets: list[RevenueBucket]
+
+
+class StatusFunnelInputDTO(BaseDTO):
+    from_date: date | None = Field(None, description="First day included, by order creation date")
+    to_date: date | None = Field(None, description="Last day included, by order creation date")
+    channel: str | None = None
+
+
+class StatusFunnelOutputDTO(BaseDTO):
+    total_orders: int
+    stages: list[StatusFunnelStage]
+
+
+class ChannelBreakdownInputDTO(BaseDTO):
+    from_date: date | None = Field(None, description="First day included, by order creation date")
+    to_date: date | None = Field(None, description="Last day included, by order creation date")
+
+
+class ChannelBreakdownOutputDTO(BaseDTO):
+    channels: list[ChannelBreakdownItem]
+
+
+class RollupInputDTO(BaseDTO):
+    from_time: datetime | None = Field(None, description="Start of the range, by order creation time")
+    to_time: datetime | None = Field(None, description="End of the range (exclusive), by order creation time")
+    interval: AnalyticsIntervalType = Field(AnalyticsIntervalType.HOUR, description="Bucket size")
+    status: str | None = None
+    channel: str | None = None
+
+
+class RollupOutputDTO(BaseDTO):
+    interval: AnalyticsIntervalType
+    buckets: list[RollupBucket]
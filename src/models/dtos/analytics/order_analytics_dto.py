@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class RevenueBucket(BaseModel):
+    bucket: datetime
+    orders: int
+    total_amount: int
+    discount_amount: int
+    payable_amount: int
+
+
+class StatusFunnelStage(BaseModel):
+    status: str
+    orders: int
+    reached: int
+    conversion: float
+
+
+class ChannelBreakdownItem(BaseModel):
+    channel: str
+    orders: int
+    items: int
+    payable_amount: int
+    average_order_value: float
+
+
+class RollupBucket(BaseModel):
+    bucket: datetime
+    status: str
+    channel: str
+    currency: str
+    orders: int
+    total_amount: int
+    discount_amount: int
+    payable_amount: int
@@ -0,0 +1,56 @@
+from datetime import date, datetime
+
+from pydantic import BaseModel
+from src.models.dtos.analytics.order_analytics_dto import (
+    ChannelBreakdownItem,
+    RevenueBucket,
+    RollupBucket,
+    StatusFunnelStage,
+)
+from src.models.types.analytics_types import AnalyticsIntervalType
+
+
+class RevenueQueryDTO(BaseModel):
+    from_date: date | None = None
+    to_date: date | None = None
+    interval: AnalyticsIntervalType = AnalyticsIntervalType.DAY
+    channel: str | None = None
+    currency: str | None = None
+
+
+class RevenueResponseDTO(BaseModel):
+    interval: AnalyticsIntervalType
+    buckets: list[RevenueBucket]
+
+
+class StatusFunnelQueryDTO(BaseModel):
+    from_date: date | None = None
+    to_date: date | None = None
+    channel: str | None = None
+
+
+class StatusFunnelResponseDTO(BaseModel):
+    total_orders: int
+    stages: list[StatusFunnelStage]
+
+
+class ChannelBreakdownQueryDTO(BaseModel):
+    from_date: date | None = None
+    to_date: date | None = None
+
+
+class ChannelBreakdownResponseDTO(BaseModel):
+    channels: list[ChannelBreakdownItem]
+
+
+class RollupQueryDTO(BaseModel):
+    from_time: datetime | None = None
+    to_time: datetime | None = None
+    interval: AnalyticsIntervalType = AnalyticsIntervalType.HOUR
+    status: str | None = None
+    channel: str | None = None
+
+
+class RollupResponseDTO(BaseModel):
+    interval: AnalyticsIntervalType
+    buckets: list[RollupBucket]
@@ -1,16 +1,31 @@
 from pydantic import Field
 from archipy.models.dtos.base_dtos import BaseDTO
 from src.models.dtos.order.order_dto import OrderRoot
+from src.models.dtos.order.order_facet_dtos import DateFacetBucket, FacetBucket
+from src.models.types.analytics_types import AnalyticsIntervalType
 from src.models.types.base_dtos import SortType
-from src.models.types.order_types import SortOrderByType
+from src.models.types.order_types import ReadConsistencyType, SortOrderByType
 
 
 class GetOrderByIdInputDTO(BaseDTO):
     order_id: str
+    consistency: ReadConsistencyType = ReadConsistencyType.EVENTUAL
 
 
 class GetOrderByIdOutputDTO(BaseDTO):
     order: OrderRoot
+    version: int | None = None
+    seq_no: int | None = None
+    primary_term: int | None = None
+    etag: str | None = Field(None, exclude=True)
+
+
+class GetOrderVersionOutputDTO(BaseDTO):
+    order_id: str
+    version: int | None = None
+    seq_no: int | None = None
+    primary_term: int | None = None
+    etag: str | None = None
 
 
 class SearchOrdersInputDTO(BaseDTO):
@@ -31,6 +46,14 @@ class SearchOrdersInputDTO(BaseDTO):
     )
     sort_order: SortType = Field(SortType.DESC, description="Sort order asc or desc")
 
+    wait_for_order_id: str | None = Field(
+        None,
+        description="Wait until this order is visible to search before searching",
+    )
+    wait_for_version: int | None = Field(None, description="Minimum document version to wait for")
+    wait_for_seq_no: int | None = Field(None, description="Minimum sequence number to wait for")
+    wait_timeout_ms: int = Field(2000, ge=0, le=10000, description="Upper bound on the wait")
+
 
 class SearchOrdersOutputDTO(BaseDTO):
     total: int
@@ -38,3 +61,49 @@ class SearchOrdersOutputDTO(BaseDTO):
     size: int
     total_pages: int
     items: list[OrderRoot]
+    consistent: bool | None = Field(
+        None,
+        description="Whether the awaited order was visible; null when no wait was requested",
+    )
+    etag: str | None = Field(None, exclude=True)
+
+
+class GetOrderFacetsInputDTO(BaseDTO):
+    national_id: str | None = None
+    mobile: str | None = None
+    email: str | None = None
+    order_id: str | None = None
+    order_status: str | None = None
+    order_date: str | None = None
+
+    interval: AnalyticsIntervalType = Field(
+        AnalyticsIntervalType.MONTH,
+        description="Bucket size of the createdAt histogram",
+    )
+    facet_size: int = Field(20, gt=0, le=100, description="Maximum buckets per terms facet")
+
+
+class GetOrderFacetsOutputDTO(BaseDTO):
+    total: int
+    status: list[FacetBucket]
+    channel: list[FacetBucket]
+    payment_method: list[FacetBucket] = Field(description="Orders per payment method")
+    created_at: list[DateFacetBucket]
+
+
+class ExportOrdersInputDTO(BaseDTO):
+    national_id: str | None = None
+    mobile: str | None = None
+    email: str | None = None
+    order_id: str | None = None
+    order_status: str | None = None
+    order_date: str | None = None
+    from_date: str | None = Field(None, description="Orders created at or after this ISO date or timestamp")
+    to_date: str | None = Field(None, description="Orders created before this ISO date or timestamp")
+    encrypted: bool = True
+
+    fields: str | None = Field(
+        None,
+        description="Comma-separated order fields to include, e.g. orderId,status,priceSummary",
+    )
+    batch_size: int = Field(1000, gt=0, le=10000, description="Orders fetched per round trip")
@@ -1,42 +1,52 @@
-from __future__ import annotations
+# Generated from schemas/avro/orders/order-events.avsc and schemas/avro/orders/order-events.codegen.json
+# by scripts/codegen/generate_order_models.py; do not edit, run `make codegen`.
+
+from datetime import date, datetime
 from typing import Literal
-from datetime import datetime, date
-from pydantic import BaseModel, Field, EmailStr
+
+from pydantic import AliasChoices, BaseModel, Field
+
 from src.models.types.order_types import (
-    OrderStatusType,
+    ContactMethodType,
+    CustomerType,
+    GenderType,
     ItemStatusType,
+    OrderItemType,
+    OrderStatusType,
     PaymentStatusType,
-    PaymentMethodType,
-    GenderType,
-    CustomerType,
     ProvisioningStatusType,
-    ProvisioningTypeType,
-    ContactMethodType,
-    OrderItemType,
 )
 
 
 class CustomerAccount(BaseModel):
+    """
+    Information about the customer's account.
+    """
+
     accountId: str
     type: CustomerType
     loyaltyTier: str = "STANDARD"
     vip: bool = False
     customerSince: date | None = None
-    preferredLanguage: str = Field(default="fa", min_length=2, max_length=5)
+    preferredLanguage: str = "fa"
 
 
 class ContactPoints(BaseModel):
     mobile: str | None = None
-    email: EmailStr | None = None
+    email: str | None = None
     preferredMethod: ContactMethodType = ContactMethodType.SMS
 
 
 class Party(BaseModel):
+    """
+    Personal information of the customer.
+    """
+
     nationalId: str | None = None
     fullName: str | None = None
     contactPoints: ContactPoints
     birthDate: date | None = None
-    gender: GenderType = GenderType.UNKNOWN
+    gender: GenderType | None = GenderType.UNKNOWN
 
 
 class PriceSummary(BaseModel):
@@ -46,6 +56,12 @@ class PriceSummary(BaseModel):
     currency: str = "TRY"
 
 
+class AppliedDiscount(BaseModel):
+    code: str
+    description: str | None = None
+    amount: int
+
+
 class ProductAttributes(BaseModel):
     brand: str = "Unknown"
     model: str | None = None
@@ -53,6 +69,19 @@ class ProductAttributes(BaseModel):
     category: str | None = None
 
 
+class ProductOrderItem(BaseModel):
+    itemId: str
+    productId: str
+    sku: str
+    status: ItemStatusType
+    type: OrderItemType = OrderItemType.PHYSICAL
+    quantity: int = 1
+    unitPrice: int
+    totalPrice: int
+    stockLocation: str | None = None
+    attributes: ProductAttributes
+
+
 class ServiceAttributes(BaseModel):
     planType: str | None = None
     planName: str | None = None
@@ -63,26 +92,13 @@ class ServiceAttributes(BaseModel):
 
 class Provisioning(BaseModel):
     status: ProvisioningStatusType = ProvisioningStatusType.ACTIVE
-    provisioningType: ProvisioningTypeType = ProvisioningTypeType.NEW_ACTIVATION
+    provisioningType: str = "NEW_ACTIVATION"
     targetIdentifier: str | None = None
     serviceIds: list[str] = []
     activationDate: datetime | None = None
     billingStartDate: datetime | None = None
 
 
-class ProductOrderItem(BaseModel):
-    itemId: str
-    productId: str
-    sku: str
-    status: ItemStatusType
-    type: OrderItemType = OrderItemType.PHYSICAL
-    quantity: int = 1
-    unitPrice: int
-    totalPrice: int
-    stockLocation: str | None = None
-    attributes: ProductAttributes
-
-
 class ServiceOrderItem(BaseModel):
     itemId: str
     productId: str
@@ -97,14 +113,14 @@ class ServiceOrderItem(BaseModel):
     provisioning: Provisioning
 
 
-class ShipmentAddress(BaseModel):
+class Address(BaseModel):
     fullAddress: str | None = None
     city: str | None = None
     postalCode: str | None = None
     country: str = "TR"
 
 
-class ShipmentHistoryItem(BaseModel):
+class ShipmentHistory(BaseModel):
     status: ItemStatusType
     timestamp: datetime | None = None
     recipientName: str | None = None
@@ -114,43 +130,68 @@ class ShipmentOrder(BaseModel):
     shipmentId: str
     status: ItemStatusType
     trackingNumber: str | None = None
-    carrier: str = "INTERNAL_DELIVERY"
+    carrier: str | None = "INTERNAL_DELIVERY"
     items: list[str] = []
-    address: ShipmentAddress
-    history: list[ShipmentHistoryItem] = []
+    address: Address
+    history: list[ShipmentHistory] = []
 
 
-class PaymentTransaction(BaseModel):
+class Transaction(BaseModel):
     id: str
-    type: Literal["SALE", "REFUND", "AUTH", "CAPTURE"] = "SALE"
+    type: Literal["SALE", "REFUND", "AUTHORIZATION"] = "SALE"
     amount: int
     processedAt: datetime | None = None
     authorizationCode: str | None = None
 
 
 class Payment(BaseModel):
-    method: PaymentMethodType
+    method: str
     status: PaymentStatusType
     provider: str | None = None
-    transactions: list[PaymentTransaction]
+    transactions: list[Transaction] = []
 
 
 class Invoice(BaseModel):
     invoiceId: str
-    status: Literal["PAID", "UNPAID", "VOID", "REFUNDED"] = "PAID"
+    status: Literal["DRAFT", "ISSUED", "PAID", "VOID"] = "PAID"
     issueDate: datetime | None = None
     amount: int
     taxAmount: int = 0
     currency: str = "TRY"
 
 
+class Return(BaseModel):
+    """
+    Placeholder for return information.
+    """
+
+    returnId: str
+    status: str
+    reason: str | None = None
+
+
+class Communication(BaseModel):
+    """
+    Placeholder for customer communication records.
+    """
+
+    communicationId: str
+    channel: str
+    timestamp: datetime
+    content: str
+
+
 class AuditDetails(BaseModel):
     field: str | None = None
-    from_: str | None = Field(default=None, alias="from")
+    from_: str | None = Field(
+        default=None,
+        validation_alias=AliasChoices("from", "from_"),
+        serialization_alias="from",
+    )
     to: str | None = None
 
 
-class AuditTrailItem(BaseModel):
+class AuditTrail(BaseModel):
     timestamp: datetime | None = None
     action: str
     performedBy: str = "system"
@@ -158,6 +199,10 @@ class AuditTrailItem(BaseModel):
 
 
 class OrderRoot(BaseModel):
+    """
+    Main order object containing all related details.
+    """
+
     orderId: str
     status: OrderStatusType
     createdAt: datetime
@@ -166,12 +211,12 @@ class OrderRoot(BaseModel):
     customerAccount: CustomerAccount
     party: Party
     priceSummary: PriceSummary
-    appliedDiscounts: list[dict] = []
+    appliedDiscounts: list[AppliedDiscount] = []
     productOrderItems: list[ProductOrderItem] = []
     serviceOrderItems: list[ServiceOrderItem] = []
     shipmentOrders: list[ShipmentOrder] = []
     payment: list[Payment] = []
     invoices: list[Invoice] = []
-    returns: list[dict] = []
-    communications: list[dict] = []
-    auditTrail: list[AuditTrailItem] = []
+    returns: list[Return] = []
+    communications: list[Communication] = []
+    auditTrail: list[AuditTrail] = []
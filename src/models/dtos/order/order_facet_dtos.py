@@ -0,0 +1,13 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class FacetBucket(BaseModel):
+    key: str
+    count: int
+
+
+class DateFacetBucket(BaseModel):
+    key: datetime
+    count: int
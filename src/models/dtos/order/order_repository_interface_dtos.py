@@ -1,7 +1,13 @@
 from pydantic import BaseModel, Field
 from src.models.dtos.order.order_dto import OrderRoot
+from src.models.dtos.order.order_facet_dtos import DateFacetBucket, FacetBucket
+from src.models.types.analytics_types import AnalyticsIntervalType
 from src.models.types.base_dtos import SortType
-from src.models.types.order_types import OrderStatusType, SortOrderByType
+from src.models.types.order_types import (
+    OrderStatusType,
+    ReadConsistencyType,
+    SortOrderByType,
+)
 
 
 class OrderDocumentEntity(BaseModel):
@@ -10,10 +16,23 @@ class OrderDocumentEntity(BaseModel):
 
 class GetOrderByIdQueryDTO(BaseModel):
     order_id: str
+    consistency: ReadConsistencyType = ReadConsistencyType.EVENTUAL
 
 
 class GetOrderByIdResponseDTO(BaseModel):
     order: OrderRoot
+    version: int | None = None
+    seq_no: int | None = None
+    primary_term: int | None = None
+    etag: str | None = Field(None, exclude=True)
+
+
+class GetOrderVersionResponseDTO(BaseModel):
+    order_id: str
+    version: int | None = None
+    seq_no: int | None = None
+    primary_term: int | None = None
+    etag: str | None = None
 
 
 class SearchOrdersQueryDTO(BaseModel):
@@ -34,6 +53,11 @@ class SearchOrdersQueryDTO(BaseModel):
     )
     sort_order: SortType = Field(SortType.DESC, description="Sort order asc or desc")
 
+    wait_for_order_id: str | None = None
+    wait_for_version: int | None = None
+    wait_for_seq_no: int | None = None
+    wait_timeout_ms: int = Field(2000, ge=0, le=10000)
+
 
 class SearchOrdersResponseDTO(BaseModel):
     total: int
@@ -41,3 +65,40 @@ class SearchOrdersResponseDTO(BaseModel):
     size: int
     total_pages: int
     items: list[OrderRoot]
+    consistent: bool | None = None
+    etag: str | None = Field(None, exclude=True)
+
+
+class GetOrderFacetsQueryDTO(BaseModel):
+    order_id: str | None = None
+    national_id: str | None = None
+    mobile: str | None = None
+    email: str | None = None
+    order_status: OrderStatusType | None = None
+    order_date: str | None = None
+
+    interval: AnalyticsIntervalType = AnalyticsIntervalType.MONTH
+    facet_size: int = Field(20, gt=0, le=100)
+
+
+class GetOrderFacetsResponseDTO(BaseModel):
+    total: int
+    status: list[FacetBucket]
+    channel: list[FacetBucket]
+    payment_method: list[FacetBucket]
+    created_at: list[DateFacetBucket]
+
+
+class ExportOrdersQueryDTO(BaseModel):
+    order_id: str | None = None
+    national_id: str | None = None
+    mobile: str | None = None
+    email: str | None = None
+    order_status: OrderStatusType | None = None
+    order_date: str | None = None
+    from_date: str | None = None
+    to_date: str | None = None
+    encrypted: bool = True
+
+    fields: str | None = None
+    batch_size: int = Field(1000, gt=0, le=10000)
@@ -0,0 +1,201 @@
+import functools
+import operator
+import typing
+from datetime import UTC, date, datetime
+from types import GenericAlias, UnionType
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+import msgspec
+from pydantic import AliasChoices, BaseModel, EmailStr
+from pydantic.fields import FieldInfo
+
+from src.models.dtos.order.order_dto import OrderRoot
+
+_STRUCTS: dict[type[BaseModel], type[msgspec.Struct]] = {}
+
+# Pydantic reads integers above this as epoch milliseconds, below it as seconds.
+_EPOCH_MS_THRESHOLD = 2 * 10**10
+
+
+def _document_key(name: str, field: FieldInfo) -> str:
+    return field.serialization_alias or field.alias or name
+
+
+def _struct_type(annotation: Any) -> Any:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return struct_for(annotation)
+    if annotation is EmailStr:
+        return str
+    origin, args = typing.get_origin(annotation), typing.get_args(annotation)
+    if origin is list:
+        return GenericAlias(list, (_struct_type(args[0]),))
+    if origin in (UnionType, typing.Union):
+        return functools.reduce(operator.or_, (_struct_type(arg) for arg in args))
+    return annotation
+
+
+def struct_for(model: type[BaseModel]) -> type[msgspec.Struct]:
+    """
+    Derives a msgspec Struct with the fields, defaults and aliases of a Pydantic model.
+
+    Nested models become nested Structs, so the order Structs follow order_dto,
+    which is generated from the Avro schema the indexer writes with. Value
+    constraints such as EmailStr or string lengths are not carried over: the
+    read path decodes documents that were validated on ingest, and only needs
+    their shape.
+    """
+    if model in _STRUCTS:
+        return _STRUCTS[model]
+
+    fields = []
+    for name, field in model.model_fields.items():
+        options: dict[str, Any] = {}
+        if _document_key(name, field) != name:
+            options["name"] = _document_key(name, field)
+        if field.default_factory is not None:
+            options["default_factory"] = field.default_factory
+        elif not field.is_required():
+            # Mutable defaults get a fresh copy per instance, like Pydantic does.
+            if isinstance(field.default, (list, dict)):
+                options["default_factory"] = type(field.default)
+            else:
+                options["default"] = field.default
+        fields.append((name, _struct_type(field.annotation), msgspec.field(**options)))
+
+    struct = msgspec.defstruct(model.__name__, fields, kw_only=True, module=__name__)
+    _STRUCTS[model] = struct
+    return struct
+
+
+def _document_fields(model: type[BaseModel], leaf: typing.Callable[[str, FieldInfo, Any], Any]) -> dict[str, Any]:
+    """
+    Maps the document keys of a model's fields for which `leaf` returns a value, nested models included.
+    """
+    fields: dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        key = _document_key(name, field)
+        annotation = field.annotation
+        while typing.get_origin(annotation) in (UnionType, typing.Union, list):
+            annotation = next(arg for arg in typing.get_args(annotation) if arg is not type(None))
+        value = leaf(key, field, annotation)
+        if value is not None:
+            fields[key] = value
+        elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            nested = _document_fields(annotation, leaf)
+            if nested:
+                fields[key] = nested
+    return fields
+
+
+def _temporal_leaf(key: str, field: FieldInfo, annotation: Any) -> type | None:
+    return annotation if annotation in (date, datetime) else None
+
+
+def _alternate_keys_leaf(key: str, field: FieldInfo, annotation: Any) -> tuple[str, ...] | None:
+    if not isinstance(field.validation_alias, AliasChoices):
+        return None
+    alternates = tuple(choice for choice in field.validation_alias.choices if isinstance(choice, str) and choice != key)
+    return alternates or None
+
+
+def _walk(data: dict[str, Any], fields: dict[str, Any], fix: typing.Callable[[dict[str, Any], str, Any], None]) -> None:
+    for key, kind in fields.items():
+        if isinstance(kind, dict):
+            value = data.get(key)
+            for item in value if isinstance(value, list) else [value]:
+                if isinstance(item, dict):
+                    _walk(item, kind, fix)
+        else:
+            fix(data, key, kind)
+
+
+def _from_epoch(value: int, kind: type) -> date | datetime | int:
+    timestamp = datetime.fromtimestamp(
+        value / 1000 if abs(value) > _EPOCH_MS_THRESHOLD else value,
+        tz=UTC,
+    )
+    if kind is datetime:
+        return timestamp
+    # Like Pydantic, a date only accepts a timestamp at midnight.
+    return timestamp.date() if timestamp == datetime.combine(timestamp.date(), datetime.min.time(), UTC) else value
+
+
+def _normalize_epoch(data: dict[str, Any], key: str, kind: type) -> None:
+    value = data.get(key)
+    if isinstance(value, int) and not isinstance(value, bool):
+        data[key] = _from_epoch(value, kind)
+
+
+def _rename_alternate(data: dict[str, Any], key: str, alternates: tuple[str, ...]) -> None:
+    if key in data:
+        return
+    for alternate in alternates:
+        if alternate in data:
+            data[key] = data.pop(alternate)
+            return
+
+
+if TYPE_CHECKING:
+    # Derived at runtime with the fields of OrderRoot, so type checkers read it as the model.
+    OrderRootStruct: TypeAlias = OrderRoot
+else:
+    OrderRootStruct = struct_for(OrderRoot)
+_ORDER_TEMPORAL_FIELDS = _document_fields(OrderRoot, _temporal_leaf)
+_ORDER_ALTERNATE_KEYS = _document_fields(OrderRoot, _alternate_keys_leaf)
+
+
+class GetOrderByIdResponseStruct(msgspec.Struct, kw_only=True):
+    """
+    Compact counterpart of GetOrderByIdOutputDTO; encode_response leaves the ETag out of the body.
+    """
+
+    order: OrderRootStruct
+    version: int | None = None
+    seq_no: int | None = None
+    primary_term: int | None = None
+    etag: str | None = None
+
+
+class SearchOrdersResponseStruct(msgspec.Struct, kw_only=True):
+    """
+    Compact counterpart of SearchOrdersOutputDTO; encode_response leaves the ETag out of the body.
+    """
+
+    total: int
+    page: int
+    size: int
+    total_pages: int
+    items: list[OrderRootStruct]
+    consistent: bool | None = None
+    etag: str | None = None
+
+
+def encode_response(response: GetOrderByIdResponseStruct | SearchOrdersResponseStruct) -> bytes:
+    """
+    Encodes a response Struct as JSON without its ETag, which is sent as a header, as the Pydantic DTOs exclude it.
+    """
+    # asdict is shallow, so only the top-level fields are copied.
+    content = msgspec.structs.asdict(response)
+    del content["etag"]
+    return msgspec.json.encode(content)
+
+
+def decode_order(order_data: dict[str, Any]) -> OrderRootStruct:
+    """
+    Converts an ES order document into an OrderRootStruct; raises msgspec.ValidationError like model_validate would.
+
+    The sink connector writes timestamp-millis fields as epoch milliseconds,
+    which msgspec takes for seconds and rejects. Such documents fail the first
+    conversion, get their integer timestamps parsed the way Pydantic parses
+    them (in place) and are converted again, so ISO documents keep the fast path.
+    Fields that Pydantic also reads under another name, such as the `from_` key
+    of audit details written before the `from` alias was restored, are renamed
+    in place first.
+    """
+    if _ORDER_ALTERNATE_KEYS:
+        _walk(order_data, _ORDER_ALTERNATE_KEYS, _rename_alternate)
+    try:
+        return msgspec.convert(order_data, OrderRootStruct, strict=False)
+    except msgspec.ValidationError:
+        _walk(order_data, _ORDER_TEMPORAL_FIELDS, _normalize_epoch)
+        return msgspec.convert(order_data, OrderRootStruct, strict=False)
@@ -0,0 +1,12 @@
+from elasticsearch.dsl import analyzer
+
+persian_analyzer = analyzer(
+    "persian_analyzer",
+    tokenizer="standard",
+    filter=[
+        "lowercase",
+        "decimal_digit",
+        "arabic_normalization",
+        "persian_normalization",
+    ],
+)
@@ -0,0 +1,27 @@
+"""Mapping profiles of the order collections, kept free of elasticsearch.dsl so query code can read them."""
+
+# How each collection of an order (``order.<collection>`` in indexed
+# documents) is mapped:
+#   "nested":   Nested, for fields queried with per-element semantics
+#   "object":   flattened Object, still indexed but without hidden Lucene documents
+#   "disabled": Object with enabled: false, kept in _source only
+MAPPING_PROFILES = {
+    "full": {
+        "appliedDiscounts": "nested",
+        "productOrderItems": "nested",
+        "serviceOrderItems": "nested",
+        "shipmentOrders": "nested",
+        "payment": "nested",
+        "invoices": "nested",
+        "auditTrail": "nested",
+    },
+    "slim": {
+        "appliedDiscounts": "disabled",
+        "productOrderItems": "object",
+        "serviceOrderItems": "object",
+        "shipmentOrders": "object",
+        "payment": "nested",
+        "invoices": "disabled",
+        "auditTrail": "disabled",
+    },
+}
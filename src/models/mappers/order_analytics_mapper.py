@@ -0,0 +1,166 @@
+from datetime import datetime, timezone
+from typing import Any
+
+import pyarrow as pa
+
+_TIMESTAMP = pa.timestamp("us", tz="UTC")
+
+ORDER_SCHEMA = pa.schema(
+    [
+        ("order_id", pa.string()),
+        ("version", pa.int64()),
+        ("status", pa.string()),
+        ("channel", pa.string()),
+        ("customer_type", pa.string()),
+        ("loyalty_tier", pa.string()),
+        ("created_at", _TIMESTAMP),
+        ("updated_at", _TIMESTAMP),
+        ("total_amount", pa.int64()),
+        ("discount_amount", pa.int64()),
+        ("payable_amount", pa.int64()),
+        ("currency", pa.string()),
+        ("payment_method", pa.string()),
+        ("payment_status", pa.string()),
+        ("item_count", pa.int32()),
+    ],
+)
+
+ITEM_SCHEMA = pa.schema(
+    [
+        ("order_id", pa.string()),
+        ("version", pa.int64()),
+        ("item_id", pa.string()),
+        ("item_kind", pa.string()),
+        ("product_id", pa.string()),
+        ("sku", pa.string()),
+        ("status", pa.string()),
+        ("type", pa.string()),
+        ("category", pa.string()),
+        ("quantity", pa.int32()),
+        ("unit_price", pa.int64()),
+        ("total_price", pa.int64()),
+        ("created_at", _TIMESTAMP),
+    ],
+)
+
+# One row per order item with the order columns repeated, so BI tools need no
+# joins. Orders without items export a single row with empty item columns.
+EXPORT_SCHEMA = pa.schema(
+    [field for field in ORDER_SCHEMA if field.name != "version"]
+    + [
+        pa.field(f"item_{field.name}", field.type)
+        for field in ITEM_SCHEMA
+        if field.name not in ("order_id", "version", "created_at")
+    ],
+)
+
+# The document fields the flattening reads, for _source filtering.
+SOURCE_FIELDS = [
+    "orderId",
+    "status",
+    "channel",
+    "createdAt",
+    "updatedAt",
+    "customerAccount.type",
+    "customerAccount.loyaltyTier",
+    "priceSummary",
+    "payment.method",
+    "payment.status",
+    "productOrderItems",
+    "serviceOrderItems",
+]
+
+PRODUCT_ITEM = "product"
+SERVICE_ITEM = "service"
+
+
+def _parse_datetime(value: Any) -> datetime | None:
+    if value is None or isinstance(value, datetime):
+        return value
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def created_month(order: dict[str, Any]) -> str:
+    created_at = _parse_datetime(order.get("createdAt"))
+    return created_at.strftime("%Y-%m") if created_at else "unknown"
+
+
+def to_order_row(order: dict[str, Any], version: int) -> dict[str, Any]:
+    """
+    Flattens an order document into one row of the analytics orders table.
+    """
+    customer_account = order.get("customerAccount") or {}
+    price_summary = order.get("priceSummary") or {}
+    payments = order.get("payment") or []
+    first_payment = payments[0] if payments else {}
+    return {
+        "order_id": order["orderId"],
+        "version": version,
+        "status": order.get("status"),
+        "channel": order.get("channel"),
+        "customer_type": customer_account.get("type"),
+        "loyalty_tier": customer_account.get("loyaltyTier"),
+        "created_at": _parse_datetime(order.get("createdAt")),
+        "updated_at": _parse_datetime(order.get("updatedAt")),
+        "total_amount": price_summary.get("totalAmount"),
+        "discount_amount": price_summary.get("discountAmount", 0),
+        "payable_amount": price_summary.get("payableAmount"),
+        "currency": price_summary.get("currency"),
+        "payment_method": first_payment.get("method"),
+        "payment_status": first_payment.get("status"),
+        "item_count": len(order.get("productOrderItems") or []) + len(order.get("serviceOrderItems") or []),
+    }
+
+
+def to_item_rows(order: dict[str, Any], version: int) -> list[dict[str, Any]]:
+    """
+    Flattens the product and service items of an order document into item-level rows.
+    """
+    created_at = _parse_datetime(order.get("createdAt"))
+    rows = []
+    for kind, items in (
+        (PRODUCT_ITEM, order.get("productOrderItems") or []),
+        (SERVICE_ITEM, order.get("serviceOrderItems") or []),
+    ):
+        for item in items:
+            rows.append(
+                {
+                    "order_id": order["orderId"],
+                    "version": version,
+                    "item_id": item.get("itemId"),
+                    "item_kind": kind,
+                    "product_id": item.get("productId"),
+                    "sku": item.get("sku"),
+                    "status": item.get("status"),
+                    "type": item.get("type"),
+                    "category": (item.get("attributes") or {}).get("category"),
+                    "quantity": item.get("quantity", 1),
+                    "unit_price": item.get("unitPrice"),
+                    "total_price": item.get("totalPrice"),
+                    "created_at": created_at,
+                },
+            )
+    return rows
+
+
+def to_export_rows(order: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Flattens an order document into item-level export rows.
+    """
+    order_row = to_order_row(order, version=0)
+    del order_row["version"]
+    item_rows = to_item_rows(order, version=0)
+    if not item_rows:
+        return [order_row]
+    return [
+        {
+            **order_row,
+            **{
+                f"item_{key}": value
+                for key, value in item.items()
+                if key not in ("order_id", "version", "created_at")
+            },
+        }
+        for item in item_rows
+    ]
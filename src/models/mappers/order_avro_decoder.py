@@ -0,0 +1,196 @@
+import io
+import json
+import logging
+import struct
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, cast
+
+from confluent_kafka.schema_registry import SchemaRegistryClient
+from confluent_kafka.schema_registry.error import SchemaRegistryError
+from fastavro import parse_schema, schemaless_reader
+from fastavro.read import SchemaResolutionError
+
+from src.models.mappers.order_search_keys import build_search_keys
+
+logger = logging.getLogger(__name__)
+
+ORDER_EVENTS_SCHEMA_PATH = Path(__file__).resolve().parents[3] / "schemas/avro/orders/order-events.avsc"
+# Shared with scripts/codegen/generate_order_models.py, so documents carry the
+# field names of the generated DTOs and `OrderIndex` (`from` is a Python keyword).
+ORDER_EVENTS_CODEGEN_PATH = ORDER_EVENTS_SCHEMA_PATH.with_suffix(".codegen.json")
+
+_Shaper = Callable[[Any], Any]
+
+# Raised by the decoder for a payload that can never be decoded.
+_MALFORMED_PAYLOAD_ERRORS = (
+    ValueError,
+    TypeError,
+    KeyError,
+    IndexError,
+    EOFError,
+    StopIteration,
+    struct.error,
+    SchemaResolutionError,
+)
+
+
+def is_undecodable(error: Exception) -> bool:
+    """
+    Tells a payload that can never be decoded from a failure worth retrying.
+
+    A writer schema the registry does not know counts as undecodable; other
+    registry and network errors do not, so consumers stop instead of
+    dead-lettering events that are fine.
+    """
+    if isinstance(error, SchemaRegistryError):
+        return error.http_status_code == 404
+    return isinstance(error, _MALFORMED_PAYLOAD_ERRORS)
+
+
+def _compile_shaper(schema: Any, named: dict[str, Any], renames: dict[str, str]) -> _Shaper | None:
+    """
+    Compiles a function that reshapes a decoded Avro value into the ES document shape.
+
+    Returns None when the value is already in document shape, so untouched
+    subtrees are passed through without being walked at decode time.
+    """
+    if isinstance(schema, str):
+        schema = named.get(schema, schema)
+    if isinstance(schema, list):
+        shapers = [s for s in (_compile_shaper(branch, named, renames) for branch in schema) if s]
+        if not shapers:
+            return None
+
+        def shape_union(value: Any) -> Any:
+            if isinstance(value, dict):
+                for shaper in shapers:
+                    value = shaper(value)
+            return value
+
+        return shape_union
+    if not isinstance(schema, dict):
+        return None
+
+    schema_type = schema.get("type")
+    if schema_type == "array":
+        item_shaper = _compile_shaper(schema["items"], named, renames)
+        if item_shaper is None:
+            return None
+        return lambda values: [item_shaper(v) for v in values]
+    if schema_type != "record":
+        return None
+
+    named[schema["name"]] = schema
+    if "namespace" in schema:
+        named[f"{schema['namespace']}.{schema['name']}"] = schema
+
+    field_shapers: list[tuple[str, str, _Shaper | None]] = []
+    for field in schema["fields"]:
+        name = field["name"]
+        target = renames.get(name, name)
+        shaper = _compile_shaper(field["type"], named, renames)
+        if shaper is not None or target != name:
+            field_shapers.append((name, target, shaper))
+    if not field_shapers:
+        return None
+
+    def shape_record(record: dict[str, Any]) -> dict[str, Any]:
+        for name, target, shaper in field_shapers:
+            if name not in record:
+                continue
+            value = record.pop(name) if target != name else record[name]
+            record[target] = shaper(value) if shaper is not None and value is not None else value
+        return record
+
+    return shape_record
+
+
+class OrderAvroDecoder:
+    """
+    Decodes Confluent-framed Avro order events straight into Elasticsearch documents.
+
+    The reader schema is parsed once and the writer schemas are cached by their
+    Schema Registry ID, so a batch decode never touches the registry after warm-up
+    and never builds intermediate Pydantic or DSL objects.
+    """
+
+    _MAGIC_BYTE = 0
+    _HEADER = struct.Struct(">bI")
+
+    def __init__(
+        self,
+        schema_registry_client: SchemaRegistryClient | None = None,
+        reader_schema_path: Path = ORDER_EVENTS_SCHEMA_PATH,
+    ):
+        self.schema_registry_client = schema_registry_client
+        with open(reader_schema_path) as f:
+            raw_schema = json.load(f)
+        with open(ORDER_EVENTS_CODEGEN_PATH) as f:
+            renames = json.load(f)["es_field_names"]
+        self._reader_schema = parse_schema(raw_schema)
+        self._shaper = _compile_shaper(raw_schema, {}, renames)
+        self._writer_schemas: dict[int, Any] = {}
+
+    def register_writer_schema(self, schema_id: int, schema: dict[str, Any] | str) -> None:
+        if isinstance(schema, str):
+            schema = json.loads(schema)
+        parsed = parse_schema(schema)
+        # Skip schema resolution entirely when the producer used the reader schema.
+        self._writer_schemas[schema_id] = None if parsed == self._reader_schema else parsed
+
+    def _writer_schema(self, schema_id: int) -> Any:
+        if schema_id not in self._writer_schemas:
+            if self.schema_registry_client is None:
+                raise ValueError(f"Unknown writer schema ID {schema_id} and no Schema Registry client configured")
+            schema_str = self.schema_registry_client.get_schema(schema_id).schema_str
+            if schema_str is None:
+                raise ValueError(f"Schema Registry returned no schema for ID {schema_id}")
+            self.register_writer_schema(schema_id, schema_str)
+        return self._writer_schemas[schema_id]
+
+    def decode(self, payload: bytes) -> dict[str, Any]:
+        magic, schema_id = self._HEADER.unpack_from(payload)
+        if magic != self._MAGIC_BYTE:
+            raise ValueError(f"Unknown magic byte {magic}, payload is not Confluent-framed Avro")
+
+        writer_schema = self._writer_schema(schema_id)
+        buffer = io.BytesIO(payload)
+        buffer.seek(self._HEADER.size)
+        # The order event schema is a record, so the reader always returns a dict.
+        if writer_schema is None:
+            record = cast(dict[str, Any], schemaless_reader(buffer, self._reader_schema, None))
+        else:
+            record = cast(dict[str, Any], schemaless_reader(buffer, writer_schema, self._reader_schema))
+        if self._shaper is not None:
+            record = self._shaper(record)
+        record["order"]["searchKeys"] = build_search_keys(record["order"])
+        return record
+
+    def decode_batch(
+        self,
+        payloads: Iterable[bytes | None],
+        on_error: Callable[[int, Exception], None] | None = None,
+    ) -> list[dict[str, Any] | None]:
+        """
+        Decodes a batch of payloads, yielding None for tombstones and undecodable messages.
+
+        Each undecodable payload is logged and passed to ``on_error`` with its
+        position in the batch, so the caller can dead-letter it. Any other
+        error, such as an unreachable Schema Registry, is raised.
+        """
+        documents: list[dict[str, Any] | None] = []
+        for position, payload in enumerate(payloads):
+            if payload is None:
+                documents.append(None)
+                continue
+            try:
+                documents.append(self.decode(payload))
+            except Exception as e:
+                if not is_undecodable(e):
+                    raise
+                logger.error(f"Failed to decode order event: {e}")
+                if on_error is not None:
+                    on_error(position, e)
+                documents.append(None)
+        return documents
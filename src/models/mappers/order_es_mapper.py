@@ -1,13 +1,96 @@
-from src.models.entities.order_index import OrderIndex
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
 from src.models.dtos.order.order_repository_interface_dtos import OrderDocumentEntity
 from src.models.dtos.order.order_repository_interface_dtos import (
     OrderDocumentEntity as POrderDocument,
 )
 
+if TYPE_CHECKING:
+    from src.models.entities.order_index import OrderIndex
+
+
+# The DSL document is imported on use: indexer workers only build bulk actions
+# and would otherwise load elasticsearch.dsl in every spawned process.
+def to_es(order_dto: POrderDocument) -> "OrderIndex":
+    from src.models.entities.order_index import OrderIndex
 
-def to_es(order_dto: POrderDocument) -> OrderIndex:
     return OrderIndex(**order_dto.model_dump())
 
 
-def from_es(hit: OrderIndex) -> POrderDocument:
+def from_es(hit: "OrderIndex") -> POrderDocument:
     return OrderDocumentEntity.model_validate(hit.to_dict())
+
+
+def to_bulk_action(index: str, document: dict[str, Any], version: int) -> dict[str, Any]:
+    """
+    Builds an idempotent bulk index action for an order document.
+
+    The Kafka offset is used as an external version: an order key always lands
+    on the same partition, so offsets only grow per order and a replayed or
+    out-of-order write is rejected by Elasticsearch with a version conflict
+    instead of overwriting a newer document.
+    """
+    return {
+        "_op_type": "index",
+        "_index": index,
+        "_id": document["order"]["orderId"],
+        "_version": version,
+        "_version_type": "external",
+        "_source": document,
+    }
+
+
+# Overwrites the stored order only if the incoming one was updated later. The
+# sink connector stores timestamp-millis as epoch milliseconds and the Python
+# indexer as ISO strings, so both are accepted.
+_NEWER_ORDER_WINS_SCRIPT = """
+def stored = ctx._source.order == null ? null : ctx._source.order.updatedAt;
+if (stored != null) {
+  long storedMillis = stored instanceof Number
+    ? ((Number) stored).longValue()
+    : ZonedDateTime.parse(stored.toString()).toInstant().toEpochMilli();
+  if (storedMillis >= params.updatedAt) {
+    ctx.op = 'noop';
+    return;
+  }
+}
+ctx._source.clear();
+ctx._source.putAll(params.document);
+// Updates skip ingest pipelines, so the ingest time is set here.
+ctx._source.indexedAt = ctx._now;
+"""
+
+
+def _epoch_millis(value: datetime | str | int) -> int:
+    """
+    Returns an updatedAt as epoch milliseconds; an ISO string without an offset is read as UTC.
+    """
+    if isinstance(value, int):
+        return value
+    timestamp = datetime.fromisoformat(value) if isinstance(value, str) else value
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return int(timestamp.timestamp() * 1000)
+
+
+def to_bulk_upsert_if_newer_action(index: str, document: dict[str, Any]) -> dict[str, Any]:
+    """
+    Builds a bulk scripted upsert that keeps whichever of the stored and incoming order has the later updatedAt.
+
+    Unlike to_bulk_action it needs no Kafka offset, so it is safe against
+    documents the sink connector wrote with internal versions. A stale write
+    comes back as a ``noop`` result instead of a version conflict.
+    """
+    return {
+        "_op_type": "update",
+        "_index": index,
+        "_id": document["order"]["orderId"],
+        "retry_on_conflict": 3,
+        "scripted_upsert": True,
+        "upsert": {},
+        "script": {
+            "source": _NEWER_ORDER_WINS_SCRIPT,
+            "params": {"updatedAt": _epoch_millis(document["order"]["updatedAt"]), "document": document},
+        },
+    }
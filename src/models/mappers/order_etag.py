@@ -0,0 +1,41 @@
+import hashlib
+from collections.abc import Iterable
+from typing import Any
+
+
+def document_etag(primary_term: int | None, seq_no: int | None) -> str | None:
+    """
+    Builds the ETag of an order document from its primary term and sequence number.
+
+    Every write to a document gets a new sequence number, and a new primary term
+    after a failover, so the pair changes whenever the stored order does.
+    """
+    if primary_term is None or seq_no is None:
+        return None
+    return f'"{primary_term}-{seq_no}"'
+
+
+def page_etag(total: int, hits: Iterable[dict[str, Any]]) -> str:
+    """
+    Builds the ETag of a search page from the total and the (ID, version) of its hits.
+
+    Versions are used instead of sequence numbers because the recent-orders
+    tier and the full index hold the same external version of an order, so a
+    page served by either tier gets the same ETag.
+    """
+    digest = hashlib.blake2b(str(total).encode(), digest_size=12)
+    for hit in hits:
+        digest.update(f"|{hit.get('_id')}:{hit.get('_version')}".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str | None) -> bool:
+    """
+    Evaluates an If-None-Match header against an ETag with the weak comparison GET uses.
+    """
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return etag in (candidate.removeprefix("W/") for candidate in candidates)
@@ -0,0 +1,69 @@
+import re
+from typing import Any
+
+from src.configs.config import settings
+
+# Persian and Arabic-Indic digits show up in mobile numbers and national IDs typed on fa keyboards.
+_DIGITS = str.maketrans("۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩", "01234567890123456789")
+_EXTENSION = re.compile(r"\s*(?:x|ext\.?|#)\s*\d+$", re.IGNORECASE)
+_NON_DIGITS = re.compile(r"\D")
+_NON_ALNUM = re.compile(r"[^0-9A-Z]")
+
+MOBILE_KEY = "mobile"
+EMAIL_KEY = "email"
+NATIONAL_ID_KEY = "nationalId"
+
+
+def normalize_mobile(value: str | None, country_code: str | None = None) -> str | None:
+    """
+    Normalizes a phone number to E.164, assuming the default country for national formats.
+
+    Ingest and query both go through this function, so numbers that are not
+    valid E.164 still collapse to the same key whichever way they were typed.
+    """
+    if not value:
+        return None
+    country_code = country_code or settings.ORDER_SEARCH_DEFAULT_COUNTRY_CODE
+    value = _EXTENSION.sub("", value.translate(_DIGITS).strip())
+    digits = _NON_DIGITS.sub("", value)
+    if not digits:
+        return None
+
+    if value.startswith("+"):
+        return f"+{digits}"
+    if digits.startswith("00"):
+        return f"+{digits[2:]}"
+    if digits.startswith(country_code) and len(digits) > 10:
+        return f"+{digits}"
+    return f"+{country_code}{digits.lstrip('0')}"
+
+
+def normalize_email(value: str | None) -> str | None:
+    if not value:
+        return None
+    return value.strip().lower() or None
+
+
+def normalize_national_id(value: str | None) -> str | None:
+    if not value:
+        return None
+    return _NON_ALNUM.sub("", value.translate(_DIGITS).upper()) or None
+
+
+def customer_key(kind: str, value: str) -> str:
+    return f"{kind}:{value}"
+
+
+def build_search_keys(order: dict[str, Any]) -> dict[str, Any]:
+    """
+    Computes the canonical lookup keys of an order document at ingest time.
+    """
+    party = order.get("party") or {}
+    contact_points = party.get("contactPoints") or {}
+    keys: dict[str, Any] = {
+        MOBILE_KEY: normalize_mobile(contact_points.get("mobile")),
+        EMAIL_KEY: normalize_email(contact_points.get("email")),
+        NATIONAL_ID_KEY: normalize_national_id(party.get("nationalId")),
+    }
+    keys["customerKeys"] = [customer_key(kind, value) for kind, value in keys.items() if value]
+    return keys
@@ -0,0 +1,400 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from src.configs.config import OrderAnalyticsConfig, settings
+from src.models.dtos.analytics.order_analytics_dto import (
+    ChannelBreakdownItem,
+    RevenueBucket,
+    StatusFunnelStage,
+)
+from src.models.dtos.analytics.order_analytics_repository_interface_dtos import (
+    ChannelBreakdownQueryDTO,
+    ChannelBreakdownResponseDTO,
+    RevenueQueryDTO,
+    RevenueResponseDTO,
+    StatusFunnelQueryDTO,
+    StatusFunnelResponseDTO,
+)
+from src.models.types.order_types import OrderStatusType
+
+if TYPE_CHECKING:
+    import duckdb
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+ORDERS_TABLE = "orders"
+ITEMS_TABLE = "items"
+PARTITION_KEY = "created_month"
+
+ORDER_EVENTS_SCHEMA_PATH = Path(__file__).resolve().parents[5] / "schemas/avro/orders/order-events.avsc"
+
+
+def _avro_enum_symbols(schema: Any, name: str) -> list[str] | None:
+    if isinstance(schema, dict):
+        if schema.get("type") == "enum" and schema.get("name") == name:
+            return schema["symbols"]
+        children = list(schema.values())
+    elif isinstance(schema, list):
+        children = schema
+    else:
+        return None
+    for child in children:
+        symbols = _avro_enum_symbols(child, name)
+        if symbols is not None:
+            return symbols
+    return None
+
+
+with open(ORDER_EVENTS_SCHEMA_PATH) as f:
+    _status_symbols = _avro_enum_symbols(json.load(f), "OrderStatus")
+if _status_symbols is None:
+    raise ValueError(f"{ORDER_EVENTS_SCHEMA_PATH} defines no OrderStatus enum")
+_ORDER_STATUSES = [OrderStatusType(symbol) for symbol in _status_symbols]
+
+# Orders that left the happy path; they never count towards revenue.
+FUNNEL_EXITS = [OrderStatusType.CANCELLED, OrderStatusType.FAILED]
+# The happy path of an order, in the order of the Avro OrderStatus symbols; an
+# order in a later stage has passed the earlier ones.
+FUNNEL_STAGES = [status for status in _ORDER_STATUSES if status not in FUNNEL_EXITS]
+
+
+class OrderAnalyticsDuckDBAdapter:
+    """
+    Columnar store for the analytical path, kept apart from the operational ES cluster.
+
+    Order events are flattened into an orders table and an item-level table and
+    appended as Parquet files partitioned by order creation month. Every event
+    is a new row version keyed by its Kafka offset; queries keep the latest
+    version per order, so status transitions never double count. Queries run
+    on an embedded, in-memory DuckDB that scans the Parquet files directly, so
+    the loader and any number of API workers can share the same files.
+
+    DuckDB and PyArrow are imported on first use: API workers that never
+    serve analytics do not pay for them at boot, and PyArrow is only loaded
+    by the loader's write path.
+    """
+
+    def __init__(self, config: OrderAnalyticsConfig | None = None):
+        self.config = config or settings.ORDER_ANALYTICS
+        self.data_path = Path(self.config.DATA_PATH)
+        self._connection: "duckdb.DuckDBPyConnection | None" = None
+        self._connection_lock = threading.Lock()
+
+    # Write path, used by the analytics loader.
+
+    def write_batch(self, documents: list[tuple[dict[str, Any], int]]) -> int:
+        """
+        Appends a batch of (order document, version) pairs as one Parquet file per table and month.
+        """
+        import pyarrow as pa
+
+        from src.models.mappers.order_analytics_mapper import (
+            ITEM_SCHEMA,
+            ORDER_SCHEMA,
+            created_month,
+            to_item_rows,
+            to_order_row,
+        )
+
+        orders_by_month: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        items_by_month: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for order, version in documents:
+            month = created_month(order)
+            orders_by_month[month].append(to_order_row(order, version))
+            items_by_month[month].extend(to_item_rows(order, version))
+
+        for month, rows in orders_by_month.items():
+            self._write_file(ORDERS_TABLE, month, pa.Table.from_pylist(rows, schema=ORDER_SCHEMA))
+        for month, rows in items_by_month.items():
+            if rows:
+                self._write_file(ITEMS_TABLE, month, pa.Table.from_pylist(rows, schema=ITEM_SCHEMA))
+        return sum(len(rows) for rows in orders_by_month.values())
+
+    def _partition_dir(self, table: str, month: str) -> Path:
+        return self.data_path / table / f"{PARTITION_KEY}={month}"
+
+    def _new_file_path(self, table: str, month: str) -> Path:
+        directory = self._partition_dir(table, month)
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory / f"part-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet"
+
+    def _write_file(self, table: str, month: str, data: "pa.Table") -> None:
+        import pyarrow.parquet as pq
+
+        path = self._new_file_path(table, month)
+        # Readers glob *.parquet, so a half-written file is never visible.
+        temp_path = path.with_suffix(".tmp")
+        pq.write_table(data, temp_path, compression="zstd")
+        os.replace(temp_path, path)
+
+    def compact(self, month: str) -> None:
+        """
+        Rewrites the files of a month into one file per table holding only the latest order versions.
+        """
+        order_files = sorted(self._partition_dir(ORDERS_TABLE, month).glob("*.parquet"))
+        item_files = sorted(self._partition_dir(ITEMS_TABLE, month).glob("*.parquet"))
+        if len(order_files) <= 1 and len(item_files) <= 1:
+            return
+
+        connection = self._connect()
+        try:
+            connection.execute(
+                f"""
+                CREATE TEMP TABLE latest_orders AS
+                SELECT * FROM read_parquet({self._file_list(order_files)}, union_by_name = true)
+                QUALIFY row_number() OVER (PARTITION BY order_id ORDER BY version DESC) = 1
+                """,
+            )
+            self._copy(connection, "SELECT * FROM latest_orders", ORDERS_TABLE, month)
+            if item_files:
+                self._copy(
+                    connection,
+                    f"""
+                    SELECT i.* FROM read_parquet({self._file_list(item_files)}, union_by_name = true) AS i
+                    SEMI JOIN latest_orders AS o ON i.order_id = o.order_id AND i.version = o.version
+                    """,
+                    ITEMS_TABLE,
+                    month,
+                )
+        finally:
+            connection.close()
+
+        for path in order_files + item_files:
+            path.unlink(missing_ok=True)
+        logger.info(f"Compacted analytics month {month}: {len(order_files)} order and {len(item_files)} item files.")
+
+    def _copy(self, connection: "duckdb.DuckDBPyConnection", sql: str, table: str, month: str) -> None:
+        path = self._new_file_path(table, month)
+        temp_path = path.with_suffix(".tmp")
+        connection.execute(f"COPY ({sql}) TO '{temp_path.as_posix()}' (FORMAT parquet, COMPRESSION zstd)")
+        os.replace(temp_path, path)
+
+    def months(self) -> list[str]:
+        directory = self.data_path / ORDERS_TABLE
+        if not directory.exists():
+            return []
+        return sorted(path.name.split("=", 1)[1] for path in directory.iterdir() if path.name.startswith(PARTITION_KEY))
+
+    @staticmethod
+    def _file_list(paths: list[Path]) -> str:
+        return "[" + ", ".join(f"'{path.as_posix()}'" for path in paths) + "]"
+
+    # Read path, used by the analytics API.
+
+    def _connect(self) -> "duckdb.DuckDBPyConnection":
+        """
+        Opens an in-memory DuckDB that buckets and filters timestamps in UTC.
+
+        TimeZone belongs to the ICU extension, which cannot be autoloaded from
+        the connect config, so it is set once connected. It is set globally:
+        the cursors queries run on start from the global settings, not from
+        this session's. Without ICU, DuckDB already does timestamp arithmetic
+        in UTC.
+        """
+        import duckdb
+
+        connection = duckdb.connect(
+            config={"threads": self.config.DUCKDB_THREADS, "memory_limit": self.config.DUCKDB_MEMORY_LIMIT},
+        )
+        try:
+            connection.execute("SET GLOBAL TimeZone = 'UTC'")
+        except duckdb.Error as e:
+            logger.info(f"DuckDB keeps its UTC default, ICU is unavailable: {e}")
+        return connection
+
+    def _get_connection(self) -> "duckdb.DuckDBPyConnection":
+        if self._connection is None:
+            with self._connection_lock:
+                if self._connection is None:
+                    self._connection = self._connect()
+        return self._connection
+
+    def _has_files(self, table: str) -> bool:
+        return any((self.data_path / table).glob(f"{PARTITION_KEY}=*/*.parquet"))
+
+    def _scan(self, table: str) -> str:
+        glob = (self.data_path / table / f"{PARTITION_KEY}=*" / "*.parquet").as_posix()
+        return (
+            f"read_parquet('{glob}', hive_partitioning = true, "
+            f"hive_types = {{'{PARTITION_KEY}': VARCHAR}}, union_by_name = true)"
+        )
+
+    @staticmethod
+    def _created_filter(from_date: date | None, to_date: date | None, alias: str = "") -> tuple[str, list[Any]]:
+        """
+        Builds the creation-date filter. The month condition lets DuckDB skip whole partitions.
+        """
+        prefix = f"{alias}." if alias else ""
+        clauses, params = ["TRUE"], []
+        if from_date:
+            clauses.append(f"{prefix}{PARTITION_KEY} >= ? AND {prefix}created_at >= ?")
+            params.extend([from_date.strftime("%Y-%m"), from_date])
+        if to_date:
+            clauses.append(f"{prefix}{PARTITION_KEY} <= ? AND {prefix}created_at < ?")
+            params.extend([to_date.strftime("%Y-%m"), to_date + timedelta(days=1)])
+        return " AND ".join(clauses), params
+
+    def _latest_orders(self, from_date: date | None, to_date: date | None) -> tuple[str, list[Any]]:
+        # Creation time never changes between versions, so filtering before
+        # picking the latest version is safe and prunes files early.
+        where, params = self._created_filter(from_date, to_date)
+        sql = f"""
+            SELECT * FROM {self._scan(ORDERS_TABLE)}
+            WHERE {where}
+            QUALIFY row_number() OVER (PARTITION BY order_id ORDER BY version DESC) = 1
+        """
+        return sql, params
+
+    def _fetch(self, sql: str, params: list[Any]) -> list[dict[str, Any]]:
+        import duckdb
+
+        cursor = self._get_connection().cursor()
+        try:
+            try:
+                result = cursor.execute(sql, params)
+            except duckdb.IOException:
+                # A compaction replaced the files between globbing and reading.
+                result = cursor.execute(sql, params)
+            columns = [column[0] for column in result.description]
+            return [dict(zip(columns, row)) for row in result.fetchall()]
+        finally:
+            cursor.close()
+
+    async def _query(self, sql: str, params: list[Any]) -> list[dict[str, Any]]:
+        return await asyncio.to_thread(self._fetch, sql, params)
+
+    async def revenue(self, input_dto: RevenueQueryDTO) -> RevenueResponseDTO:
+        """
+        Sums order amounts per creation-time bucket, excluding cancelled and failed orders.
+        """
+        if not self._has_files(ORDERS_TABLE):
+            return RevenueResponseDTO(interval=input_dto.interval, buckets=[])
+
+        latest_sql, latest_params = self._latest_orders(input_dto.from_date, input_dto.to_date)
+        filters, params = ["status NOT IN (?, ?)"], [*latest_params, input_dto.interval.value, *FUNNEL_EXITS]
+        if input_dto.channel:
+            filters.append("channel = ?")
+            params.append(input_dto.channel)
+        if input_dto.currency:
+            filters.append("currency = ?")
+            params.append(input_dto.currency)
+
+        rows = await self._query(
+            f"""
+            WITH latest AS ({latest_sql})
+            SELECT
+                date_trunc(?, created_at::TIMESTAMP) AS bucket,
+                count(*) AS orders,
+                coalesce(sum(total_amount), 0) AS total_amount,
+                coalesce(sum(discount_amount), 0) AS discount_amount,
+                coalesce(sum(payable_amount), 0) AS payable_amount
+            FROM latest
+            WHERE {" AND ".join(filters)}
+            GROUP BY bucket
+            ORDER BY bucket
+            """,
+            params,
+        )
+        return RevenueResponseDTO(
+            interval=input_dto.interval,
+            buckets=[RevenueBucket.model_validate(row) for row in rows],
+        )
+
+    async def status_funnel(self, input_dto: StatusFunnelQueryDTO) -> StatusFunnelResponseDTO:
+        """
+        Counts orders by current status and how many reached each stage of the happy path.
+        """
+        counts: dict[str, int] = {}
+        if self._has_files(ORDERS_TABLE):
+            latest_sql, params = self._latest_orders(input_dto.from_date, input_dto.to_date)
+            where = "TRUE"
+            if input_dto.channel:
+                where = "channel = ?"
+                params.append(input_dto.channel)
+            rows = await self._query(
+                f"""
+                WITH latest AS ({latest_sql})
+                SELECT status, count(*) AS orders FROM latest WHERE {where} GROUP BY status
+                """,
+                params,
+            )
+            counts = {row["status"]: row["orders"] for row in rows}
+
+        total_orders = sum(counts.values())
+        stages = []
+        reached = sum(counts.get(status, 0) for status in FUNNEL_STAGES)
+        for status in FUNNEL_STAGES:
+            orders = counts.get(status, 0)
+            stages.append(
+                StatusFunnelStage(
+                    status=status,
+                    orders=orders,
+                    reached=reached,
+                    conversion=round(reached / total_orders, 4) if total_orders else 0.0,
+                ),
+            )
+            reached -= orders
+        for status in FUNNEL_EXITS:
+            orders = counts.get(status, 0)
+            stages.append(
+                StatusFunnelStage(
+                    status=status,
+                    orders=orders,
+                    reached=orders,
+                    conversion=round(orders / total_orders, 4) if total_orders else 0.0,
+                ),
+            )
+        return StatusFunnelResponseDTO(total_orders=total_orders, stages=stages)
+
+    async def channel_breakdown(self, input_dto: ChannelBreakdownQueryDTO) -> ChannelBreakdownResponseDTO:
+        """
+        Breaks orders, item quantities and revenue down by sales channel, excluding cancelled and failed orders.
+        """
+        if not self._has_files(ORDERS_TABLE):
+            return ChannelBreakdownResponseDTO(channels=[])
+
+        latest_sql, params = self._latest_orders(input_dto.from_date, input_dto.to_date)
+        if self._has_files(ITEMS_TABLE):
+            items_where, items_params = self._created_filter(input_dto.from_date, input_dto.to_date, alias="i")
+            item_totals_sql = f"""
+                SELECT i.order_id, sum(i.quantity) AS quantity
+                FROM {self._scan(ITEMS_TABLE)} AS i
+                JOIN latest AS l ON i.order_id = l.order_id AND i.version = l.version
+                WHERE {items_where}
+                GROUP BY i.order_id
+            """
+            params.extend(items_params)
+        else:
+            item_totals_sql = "SELECT NULL::VARCHAR AS order_id, NULL::BIGINT AS quantity WHERE FALSE"
+        params.extend(FUNNEL_EXITS)
+
+        rows = await self._query(
+            f"""
+            WITH latest AS ({latest_sql}), item_totals AS ({item_totals_sql})
+            SELECT
+                coalesce(l.channel, 'UNKNOWN') AS channel,
+                count(*) AS orders,
+                coalesce(sum(t.quantity), 0) AS items,
+                coalesce(sum(l.payable_amount), 0) AS payable_amount,
+                coalesce(avg(l.payable_amount), 0) AS average_order_value
+            FROM latest AS l
+            LEFT JOIN item_totals AS t ON l.order_id = t.order_id
+            WHERE l.status NOT IN (?, ?)
+            GROUP BY 1
+            ORDER BY payable_amount DESC
+            """,
+            params,
+        )
+        return ChannelBreakdownResponseDTO(
+            channels=[ChannelBreakdownItem.model_validate(row) for row in rows],
+        )
@@ -0,0 +1,246 @@
+import asyncio
+import sqlite3
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from src.configs.config import OrderAnalyticsConfig, settings
+from src.models.dtos.analytics.order_analytics_dto import RollupBucket
+from src.models.dtos.analytics.order_analytics_repository_interface_dtos import (
+    RollupQueryDTO,
+    RollupResponseDTO,
+)
+from src.models.types.analytics_types import AnalyticsIntervalType
+
+BUCKET_SECONDS = 3600
+UNKNOWN = "UNKNOWN"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS order_state (
+    order_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    currency TEXT NOT NULL,
+    total_amount INTEGER NOT NULL,
+    discount_amount INTEGER NOT NULL,
+    payable_amount INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS order_rollup (
+    bucket INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    currency TEXT NOT NULL,
+    orders INTEGER NOT NULL,
+    total_amount INTEGER NOT NULL,
+    discount_amount INTEGER NOT NULL,
+    payable_amount INTEGER NOT NULL,
+    PRIMARY KEY (bucket, status, channel, currency)
+) WITHOUT ROWID;
+"""
+
+_UPSERT_ROLLUP = """
+INSERT INTO order_rollup VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (bucket, status, channel, currency) DO UPDATE SET
+    orders = orders + excluded.orders,
+    total_amount = total_amount + excluded.total_amount,
+    discount_amount = discount_amount + excluded.discount_amount,
+    payable_amount = payable_amount + excluded.payable_amount
+"""
+
+_UPSERT_STATE = "INSERT OR REPLACE INTO order_state VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+# Bucket start expressions in Unix seconds; weeks start on Monday (1970-01-05).
+_INTERVAL_EXPRESSIONS = {
+    AnalyticsIntervalType.HOUR: "bucket",
+    AnalyticsIntervalType.DAY: "bucket - bucket % 86400",
+    AnalyticsIntervalType.WEEK: "bucket - (bucket - 345600) % 604800",
+    AnalyticsIntervalType.MONTH: "CAST(strftime('%s', bucket, 'unixepoch', 'start of month') AS INTEGER)",
+}
+
+_IN_CHUNK_SIZE = 500
+
+
+class _Contribution(NamedTuple):
+    version: int
+    bucket: int
+    status: str
+    channel: str
+    currency: str
+    total_amount: int
+    discount_amount: int
+    payable_amount: int
+
+    @property
+    def key(self) -> tuple[int, str, str, str]:
+        return self.bucket, self.status, self.channel, self.currency
+
+
+def _contribution(order: dict[str, Any], version: int) -> _Contribution | None:
+    created_at = order.get("createdAt")
+    if not created_at:
+        return None
+    created_at = datetime.fromisoformat(created_at)
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    timestamp = int(created_at.timestamp())
+    price_summary = order.get("priceSummary") or {}
+    return _Contribution(
+        version=version,
+        bucket=timestamp - timestamp % BUCKET_SECONDS,
+        status=order.get("status") or UNKNOWN,
+        channel=order.get("channel") or UNKNOWN,
+        currency=price_summary.get("currency") or UNKNOWN,
+        total_amount=price_summary.get("totalAmount") or 0,
+        discount_amount=price_summary.get("discountAmount") or 0,
+        payable_amount=price_summary.get("payableAmount") or 0,
+    )
+
+
+class OrderRollupSQLiteAdapter:
+    """
+    Hourly order rollups maintained incrementally on ingest.
+
+    The last contribution of every order is kept next to the rollup rows. When
+    a newer event of an order arrives, its previous contribution is subtracted
+    and the new one added, so status and amount changes move an order between
+    rollup rows instead of counting it twice. Events at or below the stored
+    version are ignored, which makes replays and redeliveries harmless.
+    Dashboards read the rollup rows only, so a query costs O(buckets).
+    """
+
+    def __init__(self, config: OrderAnalyticsConfig | None = None):
+        self.config = config or settings.ORDER_ANALYTICS
+        self.database_path = Path(self.config.ROLLUP_DATABASE_PATH)
+        self._connection: sqlite3.Connection | None = None
+
+    # Write path, used by the analytics loader.
+
+    def _writer(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.database_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.database_path)
+            # WAL lets the API read while the loader writes.
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+        return self._connection
+
+    def _load_states(self, connection: sqlite3.Connection, order_ids: list[str]) -> dict[str, _Contribution]:
+        states = {}
+        for start in range(0, len(order_ids), _IN_CHUNK_SIZE):
+            chunk = order_ids[start : start + _IN_CHUNK_SIZE]
+            rows = connection.execute(
+                f"SELECT * FROM order_state WHERE order_id IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            for order_id, *values in rows:
+                states[order_id] = _Contribution(*values)
+        return states
+
+    def apply_batch(self, documents: list[tuple[dict[str, Any], int]]) -> int:
+        """
+        Applies a batch of (order document, version) pairs in one transaction; returns the orders changed.
+        """
+        connection = self._writer()
+        states = self._load_states(connection, list({order["orderId"] for order, _ in documents}))
+
+        deltas: dict[tuple[int, str, str, str], list[int]] = defaultdict(lambda: [0, 0, 0, 0])
+        changed: dict[str, _Contribution] = {}
+        for order, version in documents:
+            order_id = order["orderId"]
+            previous = states.get(order_id)
+            if previous is not None and previous.version >= version:
+                continue
+            current = _contribution(order, version)
+            if current is None:
+                continue
+            for contribution, sign in ((previous, -1), (current, 1)):
+                if contribution is None:
+                    continue
+                delta = deltas[contribution.key]
+                delta[0] += sign
+                delta[1] += sign * contribution.total_amount
+                delta[2] += sign * contribution.discount_amount
+                delta[3] += sign * contribution.payable_amount
+            states[order_id] = changed[order_id] = current
+
+        with connection:
+            connection.executemany(
+                _UPSERT_ROLLUP,
+                [(*key, *delta) for key, delta in deltas.items() if any(delta)],
+            )
+            connection.executemany(
+                _UPSERT_STATE,
+                [(order_id, *contribution) for order_id, contribution in changed.items()],
+            )
+            # Rows emptied by status transitions are dropped to keep the table compact.
+            connection.executemany(
+                "DELETE FROM order_rollup WHERE bucket = ? AND status = ? AND channel = ? AND currency = ? AND orders = 0",
+                [key for key, delta in deltas.items() if delta[0] < 0],
+            )
+        return len(changed)
+
+    # Read path, used by the analytics API.
+
+    def _fetch(self, sql: str, params: list[Any]) -> list[tuple]:
+        if not self.database_path.exists():
+            return []
+        connection = sqlite3.connect(f"file:{self.database_path}?mode=ro", uri=True)
+        try:
+            return connection.execute(sql, params).fetchall()
+        except sqlite3.OperationalError:
+            # The loader has not created the tables yet.
+            return []
+        finally:
+            connection.close()
+
+    async def rollups(self, input_dto: RollupQueryDTO) -> RollupResponseDTO:
+        clauses: list[str] = ["1 = 1"]
+        params: list[Any] = []
+        if input_dto.from_time:
+            # Include the bucket the start falls into.
+            clauses.append("bucket >= ?")
+            from_timestamp = int(input_dto.from_time.timestamp())
+            params.append(from_timestamp - from_timestamp % BUCKET_SECONDS)
+        if input_dto.to_time:
+            clauses.append("bucket < ?")
+            params.append(int(input_dto.to_time.timestamp()))
+        if input_dto.status:
+            clauses.append("status = ?")
+            params.append(input_dto.status)
+        if input_dto.channel:
+            clauses.append("channel = ?")
+            params.append(input_dto.channel)
+
+        rows = await asyncio.to_thread(
+            self._fetch,
+            f"""
+            SELECT {_INTERVAL_EXPRESSIONS[input_dto.interval]} AS period, status, channel, currency,
+                sum(orders), sum(total_amount), sum(discount_amount), sum(payable_amount)
+            FROM order_rollup
+            WHERE {" AND ".join(clauses)}
+            GROUP BY period, status, channel, currency
+            ORDER BY period, status, channel, currency
+            """,
+            params,
+        )
+        return RollupResponseDTO(
+            interval=input_dto.interval,
+            buckets=[
+                RollupBucket(
+                    bucket=datetime.fromtimestamp(period, tz=timezone.utc),
+                    status=status,
+                    channel=channel,
+                    currency=currency,
+                    orders=orders,
+                    total_amount=total_amount,
+                    discount_amount=discount_amount,
+                    payable_amount=payable_amount,
+                )
+                for period, status, channel, currency, orders, total_amount, discount_amount, payable_amount in rows
+            ],
+        )
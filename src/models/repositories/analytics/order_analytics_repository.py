@@ -0,0 +1,50 @@
+from src.models.repositories.analytics.adapters.order_analytics_duckdb_adapter import (
+    OrderAnalyticsDuckDBAdapter,
+)
+from src.models.repositories.analytics.adapters.order_rollup_sqlite_adapter import (
+    OrderRollupSQLiteAdapter,
+)
+from src.models.dtos.analytics.order_analytics_repository_interface_dtos import (
+    ChannelBreakdownQueryDTO,
+    ChannelBreakdownResponseDTO,
+    RevenueQueryDTO,
+    RevenueResponseDTO,
+    RollupQueryDTO,
+    RollupResponseDTO,
+    StatusFunnelQueryDTO,
+    StatusFunnelResponseDTO,
+)
+
+
+class OrderAnalyticsRepository:
+    def __init__(
+        self,
+        analytics_adapter: OrderAnalyticsDuckDBAdapter,
+        rollup_adapter: OrderRollupSQLiteAdapter,
+    ):
+        self.analytics_adapter = analytics_adapter
+        self.rollup_adapter = rollup_adapter
+
+    async def revenue(
+        self,
+        input_dto: RevenueQueryDTO,
+    ) -> RevenueResponseDTO:
+        return await self.analytics_adapter.revenue(input_dto)
+
+    async def status_funnel(
+        self,
+        input_dto: StatusFunnelQueryDTO,
+    ) -> StatusFunnelResponseDTO:
+        return await self.analytics_adapter.status_funnel(input_dto)
+
+    async def channel_breakdown(
+        self,
+        input_dto: ChannelBreakdownQueryDTO,
+    ) -> ChannelBreakdownResponseDTO:
+        return await self.analytics_adapter.channel_breakdown(input_dto)
+
+    async def rollups(
+        self,
+        input_dto: RollupQueryDTO,
+    ) -> RollupResponseDTO:
+        return await self.rollup_adapter.rollups(input_dto)
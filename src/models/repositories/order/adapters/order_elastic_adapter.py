@@ -1,18 +1,48 @@
+import asyncio
+import json
 import logging
 import base64
-from datetime import datetime, timedelta
+import time
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
-from elasticsearch import NotFoundError  # Import specific exception
+from elasticsearch import BadRequestError, NotFoundError  # Import specific exception
 from archipy.adapters.elasticsearch.adapters import AsyncElasticsearchAdapter
 
 from src.models.dtos.order.order_repository_interface_dtos import (
+    ExportOrdersQueryDTO,
     GetOrderByIdQueryDTO,
     GetOrderByIdResponseDTO,
+    GetOrderFacetsQueryDTO,
+    GetOrderFacetsResponseDTO,
+    GetOrderVersionResponseDTO,
     SearchOrdersQueryDTO,
     SearchOrdersResponseDTO,
 )
 from src.models.dtos.order.order_dto import OrderRoot
+from src.models.dtos.order.order_facet_dtos import DateFacetBucket, FacetBucket
+from src.models.dtos.order.order_structs import (
+    GetOrderByIdResponseStruct,
+    OrderRootStruct,
+    SearchOrdersResponseStruct,
+    decode_order,
+)
+from src.models.entities.order_mapping_profiles import MAPPING_PROFILES
+from src.models.mappers.order_etag import document_etag, page_etag
+from src.models.mappers.order_search_keys import (
+    EMAIL_KEY,
+    MOBILE_KEY,
+    NATIONAL_ID_KEY,
+    customer_key,
+    normalize_email,
+    normalize_mobile,
+    normalize_national_id,
+)
+from src.configs.config import settings
+from src.configs.metrics import ORDER_EXPORT_DOCUMENTS, ORDER_SEARCH_TIER_REQUESTS
+from src.models.types.base_dtos import SortType
+from src.models.types.order_types import ReadConsistencyType, SortOrderByType
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +52,29 @@ def encrypt_value(value: str) -> str:
     return base64.b64encode(value.encode('utf-8')).decode('utf-8')
 
 
+def encrypt_order_document(order: dict[str, Any]) -> dict[str, Any]:
+    """Encrypts the same sensitive fields as search, on a raw (possibly projected) order document."""
+    party = order.get("party") or {}
+    for field in ("fullName", "nationalId", "birthDate"):
+        if party.get(field):
+            party[field] = encrypt_value(str(party[field]))
+    contact_points = party.get("contactPoints") or {}
+    if contact_points.get("mobile"):
+        contact_points["mobile"] = encrypt_value(contact_points["mobile"])
+
+    for shipment in order.get("shipmentOrders") or []:
+        address = shipment.get("address") or {}
+        for field in ("postalCode", "city"):
+            if address.get(field):
+                address[field] = encrypt_value(address[field])
+
+    for product_item in order.get("productOrderItems") or []:
+        attributes = product_item.get("attributes") or {}
+        if attributes.get("mac_id"):
+            attributes["mac_id"] = encrypt_value(attributes["mac_id"])
+    return order
+
+
 class OrderElasticAdapter:
     """
     Adapter for interacting with the order index in Elasticsearch.
@@ -31,34 +84,67 @@ class OrderElasticAdapter:
     _INDEX_NAME = "orders-v1-2025-08"
     _ORDER_ID_FIELD = "order.orderId"
     _STATUS_FIELD = "order.status"
+    _STATUS_KEYWORD_FIELD = "order.status.keyword"
     _NATIONAL_ID_FIELD = "order.party.nationalId.keyword"
     _MOBILE_FIELD = "order.party.contactPoints.mobile.keyword"
     _EMAIL_FIELD = "order.party.contactPoints.email.keyword"
     _CREATED_AT_FIELD = "order.createdAt"
+    _CHANNEL_FIELD = "order.channel.keyword"
+    _PAYMENT_PATH = "order.payment"
+    _PAYMENT_METHOD_FIELD = "order.payment.method"
+    _CUSTOMER_KEYS_FIELD = "order.searchKeys.customerKeys"
+    _WAIT_INITIAL_DELAY_SECONDS = 0.1
+    _WAIT_MAX_DELAY_SECONDS = 1.0
+    _EXPORT_PIT_KEEP_ALIVE = "1m"
+    # A rollover moves the write index; until the cache expires, new orders
+    # fall back to the eventual read.
+    _WRITE_INDEX_CACHE_SECONDS = 30.0
 
     def __init__(
         self,
         elastic_client: AsyncElasticsearchAdapter,
         index_name: str | None = None,
+        use_canonical_keys: bool | None = None,
+        write_alias: str | None = None,
     ):
         self.elastic_client = elastic_client
         self.index_name = index_name or self._INDEX_NAME
+        self.write_alias = write_alias or settings.ORDER_INDEXER.WRITE_ALIAS
+        self._write_index: str | None = None
+        self._write_index_expires_at = 0.0
+        self.use_canonical_keys = (
+            settings.ORDER_SEARCH_CANONICAL_KEYS if use_canonical_keys is None else use_canonical_keys
+        )
+        self.recent_tier = settings.ORDER_RECENT_TIER
+        self.use_structs = settings.ORDER_READ_MODEL == "msgspec"
+
+    def _decode_order(self, order_data: dict[str, Any]) -> OrderRoot | OrderRootStruct:
+        if self.use_structs:
+            return decode_order(order_data)
+        return OrderRoot.model_validate(order_data)
 
     async def get_order_by_id(
         self,
         input_dto: GetOrderByIdQueryDTO,
-    ) -> GetOrderByIdResponseDTO | None:
+    ) -> GetOrderByIdResponseDTO | GetOrderByIdResponseStruct | None:
         """
         Fetches a single order document by its ID from Elasticsearch.
 
+        With strong consistency the write index is read with a real-time GET,
+        which sees writes that are not refreshed yet.
+
         Returns:
             The order DTO if found, otherwise None.
         """
         try:
-            response = await self.elastic_client.get(
-                index=self.index_name,
-                id=input_dto.order_id,
-            )
+            response = None
+            if input_dto.consistency == ReadConsistencyType.STRONG:
+                response = await self._realtime_get(input_dto.order_id)
+            if response is None:
+                response = await self.elastic_client.get(
+                    index=self.index_name,
+                    id=input_dto.order_id,
+                )
             source = response.get("_source", {})
             order_data = source.get("order", {})
             if not order_data:
@@ -67,8 +153,23 @@ class OrderElasticAdapter:
                 )
                 return None
 
-            order = OrderRoot.model_validate(order_data)
-            return GetOrderByIdResponseDTO(order=order)
+            order = self._decode_order(order_data)
+            etag = document_etag(response.get("_primary_term"), response.get("_seq_no"))
+            if self.use_structs:
+                return GetOrderByIdResponseStruct(
+                    order=order,
+                    version=response.get("_version"),
+                    seq_no=response.get("_seq_no"),
+                    primary_term=response.get("_primary_term"),
+                    etag=etag,
+                )
+            return GetOrderByIdResponseDTO(
+                order=order,
+                version=response.get("_version"),
+                seq_no=response.get("_seq_no"),
+                primary_term=response.get("_primary_term"),
+                etag=etag,
+            )
         except NotFoundError:
             logger.info(f"Order with ID '{input_dto.order_id}' not found.")
             return None
@@ -76,23 +177,130 @@ class OrderElasticAdapter:
             logger.error(f"Error fetching order by ID '{input_dto.order_id}': {e}")
             raise
 
+    async def get_order_version(
+        self,
+        input_dto: GetOrderByIdQueryDTO,
+    ) -> GetOrderVersionResponseDTO | None:
+        """
+        Reads the version metadata of an order without fetching its _source.
+
+        Returns:
+            The version DTO if the order exists, otherwise None.
+        """
+        try:
+            response = None
+            if input_dto.consistency == ReadConsistencyType.STRONG:
+                response = await self._realtime_get(input_dto.order_id, source=False)
+            if response is None:
+                response = await self.elastic_client.client.get(
+                    index=self.index_name,
+                    id=input_dto.order_id,
+                    source=False,
+                )
+        except NotFoundError:
+            return None
+        return GetOrderVersionResponseDTO(
+            order_id=input_dto.order_id,
+            version=response.get("_version"),
+            seq_no=response.get("_seq_no"),
+            primary_term=response.get("_primary_term"),
+            etag=document_etag(response.get("_primary_term"), response.get("_seq_no")),
+        )
+
+    async def _resolve_write_index(self) -> str | None:
+        """
+        Returns the concrete index behind the write alias; a single-document GET rejects multi-index aliases.
+        """
+        if self._write_index is not None and time.monotonic() < self._write_index_expires_at:
+            return self._write_index
+
+        try:
+            response = await self.elastic_client.client.indices.get_alias(name=self.write_alias)
+        except NotFoundError:
+            # Not an alias, so already a concrete index.
+            write_index = self.write_alias
+        else:
+            write_index = next(
+                (
+                    index
+                    for index, entry in response.items()
+                    if entry.get("aliases", {}).get(self.write_alias, {}).get("is_write_index")
+                ),
+                next(iter(response)) if len(response) == 1 else None,
+            )
+            if write_index is None:
+                logger.warning(f"Alias '{self.write_alias}' has no write index, real-time reads are disabled")
+                return None
+        self._write_index = write_index
+        self._write_index_expires_at = time.monotonic() + self._WRITE_INDEX_CACHE_SECONDS
+        return write_index
+
+    async def _realtime_get(self, order_id: str, source: bool = True) -> dict[str, Any] | None:
+        write_index = await self._resolve_write_index()
+        if write_index is None:
+            return None
+        try:
+            return await self.elastic_client.client.get(
+                index=write_index,
+                id=order_id,
+                realtime=True,
+                source=source,
+            )
+        except NotFoundError:
+            # Older orders live outside the current write index.
+            return None
+        except BadRequestError as e:
+            logger.warning(f"Real-time read from '{write_index}' failed, falling back to the eventual read: {e}")
+            self._write_index = None
+            return None
+
+    async def _wait_until_searchable(self, input_dto: SearchOrdersQueryDTO) -> bool:
+        """
+        Waits, with backoff and a bounded timeout, until the awaited order is
+        visible to search at the requested version or sequence number.
+        """
+        deadline = time.monotonic() + input_dto.wait_timeout_ms / 1000
+        delay = self._WAIT_INITIAL_DELAY_SECONDS
+        while True:
+            response = await self.elastic_client.client.search(
+                index=self.index_name,
+                query={"ids": {"values": [input_dto.wait_for_order_id]}},
+                source=False,
+                version=True,
+                seq_no_primary_term=True,
+                size=1,
+            )
+            for hit in response.get("hits", {}).get("hits", []):
+                if (
+                    input_dto.wait_for_version is None or hit.get("_version", -1) >= input_dto.wait_for_version
+                ) and (input_dto.wait_for_seq_no is None or hit.get("_seq_no", -1) >= input_dto.wait_for_seq_no):
+                    return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, self._WAIT_MAX_DELAY_SECONDS)
+
     async def search_orders(
         self,
         input_dto: SearchOrdersQueryDTO,
-    ) -> SearchOrdersResponseDTO:
-        query = self._build_search_query(input_dto)
+    ) -> SearchOrdersResponseDTO | SearchOrdersResponseStruct:
+        consistent = None
+        if input_dto.wait_for_order_id:
+            consistent = await self._wait_until_searchable(input_dto)
 
-        response = await self.elastic_client.search(index=self.index_name, query=query)
-        total_hits = (await self.elastic_client.client.count(index=self.index_name)).get("count", 0)
+        query = self._build_search_query(input_dto)
+        response, total_hits = await self._search_tiered(input_dto, query)
 
         hits_data = response.get("hits", {})
-        items: list[OrderRoot] = []
+        items: list[OrderRoot | OrderRootStruct] = []
         for hit in hits_data.get("hits", []):
             source = hit.get("_source", {})
             order_data = source.get("order", {})
             if order_data:
                 try:
-                    items.append(OrderRoot.model_validate(order_data))
+                    items.append(self._decode_order(order_data))
                 except Exception as e:
                     doc_id = hit.get("_id")
                     logger.error(
@@ -126,38 +334,296 @@ class OrderElasticAdapter:
                         product_item.attributes.mac_id = encrypt_value(product_item.attributes.mac_id)
 
         total_pages = (total_hits + input_dto.size - 1) // input_dto.size
+        etag = page_etag(total_hits, hits_data.get("hits", []))
+        if self.use_structs:
+            return SearchOrdersResponseStruct(
+                total=total_hits,
+                page=input_dto.page,
+                size=input_dto.size,
+                total_pages=total_pages,
+                items=items,
+                consistent=consistent,
+                etag=etag,
+            )
         return SearchOrdersResponseDTO(
             total=total_hits,
             page=input_dto.page,
             size=input_dto.size,
             total_pages=total_pages,
             items=items,
+            consistent=consistent,
+            etag=etag,
         )
 
-    def _build_search_query(self, input_dto: SearchOrdersQueryDTO) -> dict[str, Any]:
-        must_clauses = []
+    async def get_search_page_etag(self, input_dto: SearchOrdersQueryDTO) -> str:
+        """
+        Computes the ETag of a search page by running its query without _source.
+
+        The probe goes through the same tier routing as search_orders, so the
+        ETag comes from the index and total the page itself would be served
+        from. It returns only IDs and versions, so an unchanged page costs no
+        document payloads.
+        """
+        query = {**self._build_search_query(input_dto), "_source": False}
+        response, total_hits = await self._search_tiered(input_dto, query)
+        return page_etag(total_hits, response.get("hits", {}).get("hits", []))
+
+    async def export_orders(self, input_dto: ExportOrdersQueryDTO) -> AsyncIterator[bytes]:
+        """
+        Streams every matching order as NDJSON, one chunk per page.
+
+        Pages are read from a point in time with search_after, so the result
+        is a consistent snapshot, no page re-runs the query from the start and
+        nothing is counted. The next page is only fetched once the client has
+        consumed the previous chunk, which keeps memory constant.
+        """
+        query = {"bool": {"filter": self._build_filter_clauses(input_dto) + self._created_range_clauses(input_dto)}}
+        source: list[str] | bool = True
+        if input_dto.fields:
+            source = [f"order.{field.strip()}" for field in input_dto.fields.split(",") if field.strip()]
+
+        client = self.elastic_client.client
+        pit_id = (await client.open_point_in_time(index=self.index_name, keep_alive=self._EXPORT_PIT_KEEP_ALIVE))["id"]
+        search_after = None
+        try:
+            while True:
+                request: dict[str, Any] = {
+                    "pit": {"id": pit_id, "keep_alive": self._EXPORT_PIT_KEEP_ALIVE},
+                    "query": query,
+                    "sort": [{self._CREATED_AT_FIELD: {"order": "desc"}}, {"_shard_doc": "asc"}],
+                    "size": input_dto.batch_size,
+                    "source": source,
+                    "track_total_hits": False,
+                }
+                if search_after is not None:
+                    request["search_after"] = search_after
+                response = await client.search(**request)
+                pit_id = response.get("pit_id", pit_id)
+                hits = response.get("hits", {}).get("hits", [])
+                if not hits:
+                    return
+
+                lines = []
+                for hit in hits:
+                    order = hit.get("_source", {}).get("order")
+                    if not order:
+                        continue
+                    if input_dto.encrypted:
+                        order = encrypt_order_document(order)
+                    lines.append(json.dumps(order, ensure_ascii=False, separators=(",", ":")))
+                if lines:
+                    ORDER_EXPORT_DOCUMENTS.inc(len(lines))
+                    yield ("\n".join(lines) + "\n").encode("utf-8")
+                search_after = hits[-1]["sort"]
+        finally:
+            try:
+                await client.close_point_in_time(id=pit_id)
+            except Exception as e:
+                # The PIT expires on its own after the keep-alive.
+                logger.warning(f"Failed to close export point in time: {e}")
+
+    def _created_range_clauses(self, input_dto: ExportOrdersQueryDTO) -> list[dict[str, Any]]:
+        created_range = {}
+        if input_dto.from_date:
+            created_range["gte"] = input_dto.from_date
+        if input_dto.to_date:
+            created_range["lt"] = input_dto.to_date
+        return [{"range": {self._CREATED_AT_FIELD: created_range}}] if created_range else []
+
+    def _recent_tier_route(self, input_dto: SearchOrdersQueryDTO) -> str | None:
+        """
+        Decides whether a search can be answered from the recent-orders index.
+
+        "recent_only": the date filter lies inside the recent window, so the
+        recent index holds every match. "recent_first": an unbounded search
+        sorted newest first; every recent order is newer than any order outside
+        the window, so a page the recent index fills completely is exact.
+
+        Dates are compared in UTC, as the date filter and the tier retention are.
+        """
+        if not self.recent_tier.IS_ENABLED:
+            return None
+
+        if input_dto.order_date:
+            try:
+                order_date = date.fromisoformat(input_dto.order_date.split("T")[0])
+            except ValueError:
+                return None
+            window_start = (datetime.now(timezone.utc) - timedelta(days=self.recent_tier.RETENTION_DAYS - 1)).date()
+            return "recent_only" if order_date >= window_start else None
+
+        if input_dto.sort_by == SortOrderByType.CREATED_AT and input_dto.sort_order == SortType.DESC:
+            return "recent_first"
+        return None
+
+    async def _count(self, index: str, query: dict[str, Any]) -> int:
+        response = await self.elastic_client.client.count(index=index, query=query["query"])
+        return response.get("count", 0)
+
+    async def _search_tiered(
+        self,
+        input_dto: SearchOrdersQueryDTO,
+        query: dict[str, Any],
+    ) -> tuple[dict[str, Any], int]:
+        """
+        Runs a search on the recent index where its route allows and returns the response and the total.
+
+        A "recent_first" page still counts the full alias: the total covers
+        orders of every tier, and the recent index cannot answer it. The count
+        runs alongside the recent search instead of after it, and is reused if
+        the page falls back to the full alias. The recent search only tracks
+        hits up to the end of the page, which is all the exactness check needs.
+        """
+        route = self._recent_tier_route(input_dto)
+        if route == "recent_only":
+            response = await self.elastic_client.search(
+                index=self.recent_tier.INDEX_NAME,
+                query={**query, "track_total_hits": True},
+            )
+            ORDER_SEARCH_TIER_REQUESTS.labels(tier="recent", route=route).inc()
+            return response, response.get("hits", {}).get("total", {}).get("value", 0)
 
-        filter_map = {
+        if route == "recent_first":
+            page_end = query["from"] + query["size"]
+            response, total = await asyncio.gather(
+                self.elastic_client.search(
+                    index=self.recent_tier.INDEX_NAME,
+                    query={**query, "track_total_hits": page_end},
+                ),
+                self._count(self.index_name, query),
+            )
+            if response.get("hits", {}).get("total", {}).get("value", 0) >= page_end:
+                ORDER_SEARCH_TIER_REQUESTS.labels(tier="recent", route=route).inc()
+                return response, total
+            ORDER_SEARCH_TIER_REQUESTS.labels(tier="full", route="fallback").inc()
+            return await self.elastic_client.search(index=self.index_name, query=query), total
+
+        ORDER_SEARCH_TIER_REQUESTS.labels(tier="full", route="full").inc()
+        response = await self.elastic_client.search(index=self.index_name, query=query)
+        return response, await self._count(self.index_name, query)
+
+    def _identity_clauses(
+        self,
+        input_dto: SearchOrdersQueryDTO | GetOrderFacetsQueryDTO | ExportOrdersQueryDTO,
+    ) -> list[dict[str, Any]]:
+        if not self.use_canonical_keys:
+            filter_map = {
+                input_dto.national_id: {
+                    "term": {self._NATIONAL_ID_FIELD: input_dto.national_id},
+                },
+                input_dto.mobile: {"term": {self._MOBILE_FIELD: input_dto.mobile}},
+                input_dto.email: {"term": {self._EMAIL_FIELD: input_dto.email}},
+            }
+            return [clause for value, clause in filter_map.items() if value]
+
+        # Each identity is a single exact term on the ingest-computed key array.
+        keys = {
+            NATIONAL_ID_KEY: normalize_national_id(input_dto.national_id),
+            MOBILE_KEY: normalize_mobile(input_dto.mobile),
+            EMAIL_KEY: normalize_email(input_dto.email),
+        }
+        return [
+            {"term": {self._CUSTOMER_KEYS_FIELD: customer_key(kind, value)}}
+            for kind, value in keys.items()
+            if value
+        ]
+
+    async def get_order_facets(
+        self,
+        input_dto: GetOrderFacetsQueryDTO,
+    ) -> GetOrderFacetsResponseDTO:
+        """
+        Counts the matching orders by status, channel, payment method and creation date.
+
+        The request has size 0 and absolute date bounds, so ES serves repeats
+        from the shard request cache until the next refresh changes a shard.
+        """
+        terms_size = input_dto.facet_size
+        response = await self.elastic_client.client.search(
+            index=self.index_name,
+            size=0,
+            track_total_hits=True,
+            request_cache=True,
+            query={"bool": {"filter": self._build_filter_clauses(input_dto)}},
+            aggs={
+                "status": {"terms": {"field": self._STATUS_KEYWORD_FIELD, "size": terms_size}},
+                "channel": {"terms": {"field": self._CHANNEL_FIELD, "size": terms_size}},
+                **self._payment_method_aggs(terms_size),
+                "created_at": {
+                    "date_histogram": {
+                        "field": self._CREATED_AT_FIELD,
+                        "calendar_interval": input_dto.interval.value,
+                        "min_doc_count": 1,
+                    },
+                },
+            },
+        )
+
+        aggregations = response.get("aggregations", {})
+        # Nested under "payment" for a nested mapping, top-level "payment_method" otherwise.
+        payment_method = aggregations.get("payment", {}).get("method") or aggregations.get("payment_method", {})
+
+        def term_buckets(aggregation: dict[str, Any]) -> list[FacetBucket]:
+            return [
+                FacetBucket(key=str(bucket["key"]), count=bucket["doc_count"])
+                for bucket in aggregation.get("buckets", [])
+            ]
+
+        return GetOrderFacetsResponseDTO(
+            total=response.get("hits", {}).get("total", {}).get("value", 0),
+            status=term_buckets(aggregations.get("status", {})),
+            channel=term_buckets(aggregations.get("channel", {})),
+            payment_method=[
+                FacetBucket(key=str(bucket["key"]), count=bucket.get("orders", bucket)["doc_count"])
+                for bucket in payment_method.get("buckets", [])
+            ],
+            created_at=[
+                DateFacetBucket(key=bucket["key_as_string"], count=bucket["doc_count"])
+                for bucket in aggregations.get("created_at", {}).get("buckets", [])
+            ],
+        )
+
+    def _payment_method_aggs(self, terms_size: int) -> dict[str, Any]:
+        """
+        Aggregates payment methods the way the mapping profile maps ``order.payment``.
+
+        Indices created before the profile mapped ``order.payment`` map it
+        dynamically, with no nested type; reindex them before enabling a nested profile.
+        """
+        mode = MAPPING_PROFILES[settings.ORDER_INDEX_MAPPING_PROFILE]["payment"]
+        terms = {"terms": {"field": self._PAYMENT_METHOD_FIELD, "size": terms_size}}
+        if mode == "nested":
+            # Count orders, not payment entries.
+            method = {**terms, "aggs": {"orders": {"reverse_nested": {}}}}
+            return {"payment": {"nested": {"path": self._PAYMENT_PATH}, "aggs": {"method": method}}}
+        if mode == "object":
+            return {"payment_method": terms}
+        # Disabled collections are not indexed, so there is nothing to aggregate.
+        return {}
+
+    def _build_filter_clauses(
+        self,
+        input_dto: SearchOrdersQueryDTO | GetOrderFacetsQueryDTO | ExportOrdersQueryDTO,
+    ) -> list[dict[str, Any]]:
+        # Filter context skips scoring and lets ES cache the clauses per segment.
+        filter_clauses = self._identity_clauses(input_dto)
+
+        filter_map: dict[Any, dict[str, Any]] = {
             input_dto.order_id: {"term": {self._ORDER_ID_FIELD: input_dto.order_id}},
             input_dto.order_status: {
                 "term": {self._STATUS_FIELD: input_dto.order_status},
             },
-            input_dto.national_id: {
-                "term": {self._NATIONAL_ID_FIELD: input_dto.national_id},
-            },
-            input_dto.mobile: {"term": {self._MOBILE_FIELD: input_dto.mobile}},
-            input_dto.email: {"term": {self._EMAIL_FIELD: input_dto.email}},
         }
 
         for value, clause in filter_map.items():
             if value:
-                must_clauses.append(clause)
+                filter_clauses.append(clause)
 
         if input_dto.order_date:
             try:
                 start_date = datetime.fromisoformat(input_dto.order_date.split("T")[0])
                 end_date = start_date + timedelta(days=1)
-                must_clauses.append(
+                filter_clauses.append(
                     {
                         "range": {
                             self._CREATED_AT_FIELD: {
@@ -171,13 +637,17 @@ class OrderElasticAdapter:
                 logger.warning(
                     f"Invalid date format provided: {input_dto.order_date}. Ignoring date filter.",
                 )
+        return filter_clauses
 
+    def _build_search_query(self, input_dto: SearchOrdersQueryDTO) -> dict[str, Any]:
         from_ = (input_dto.page - 1) * input_dto.size
 
         query = {
             "from": from_,
             "size": input_dto.size,
-            "query": {"bool": {"must": must_clauses}},
+            "query": {"bool": {"filter": self._build_filter_clauses(input_dto)}},
+            # Hit versions feed the page ETag.
+            "version": True,
         }
 
         if input_dto.sort_by:
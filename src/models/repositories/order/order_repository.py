@@ -1,12 +1,19 @@
+from collections.abc import AsyncIterator
+
 from src.models.repositories.order.adapters.order_elastic_adapter import (
     OrderElasticAdapter,
 )
 from src.models.dtos.order.order_repository_interface_dtos import (
+    ExportOrdersQueryDTO,
     GetOrderByIdQueryDTO,
+    GetOrderFacetsQueryDTO,
+    GetOrderFacetsResponseDTO,
     GetOrderByIdResponseDTO,
+    GetOrderVersionResponseDTO,
     SearchOrdersQueryDTO,
     SearchOrdersResponseDTO,
 )
+from src.models.dtos.order.order_structs import GetOrderByIdResponseStruct, SearchOrdersResponseStruct
 
 
 class OrderRepository:
@@ -16,11 +23,35 @@ class OrderRepository:
     async def get_order_by_id(
         self,
         input_dto: GetOrderByIdQueryDTO,
-    ) -> GetOrderByIdResponseDTO:
+    ) -> GetOrderByIdResponseDTO | GetOrderByIdResponseStruct | None:
         return await self.elastic_adapter.get_order_by_id(input_dto)
 
+    async def get_order_version(
+        self,
+        input_dto: GetOrderByIdQueryDTO,
+    ) -> GetOrderVersionResponseDTO | None:
+        return await self.elastic_adapter.get_order_version(input_dto)
+
     async def search_orders(
         self,
         input_dto: SearchOrdersQueryDTO,
-    ) -> SearchOrdersResponseDTO:
+    ) -> SearchOrdersResponseDTO | SearchOrdersResponseStruct:
         return await self.elastic_adapter.search_orders(input_dto)
+
+    async def get_search_page_etag(
+        self,
+        input_dto: SearchOrdersQueryDTO,
+    ) -> str:
+        return await self.elastic_adapter.get_search_page_etag(input_dto)
+
+    async def get_order_facets(
+        self,
+        input_dto: GetOrderFacetsQueryDTO,
+    ) -> GetOrderFacetsResponseDTO:
+        return await self.elastic_adapter.get_order_facets(input_dto)
+
+    def export_orders(
+        self,
+        input_dto: ExportOrdersQueryDTO,
+    ) -> AsyncIterator[bytes]:
+        return self.elastic_adapter.export_orders(input_dto)
@@ -0,0 +1,8 @@
+from enum import StrEnum
+
+
+class AnalyticsIntervalType(StrEnum):
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
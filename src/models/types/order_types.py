@@ -11,6 +11,8 @@ class OrderStatusType(StrEnum):
     COMPLETED = "COMPLETED"
     SHIPPED = "SHIPPED"
     PROCESSING = "PROCESSING"
+    PENDING = "PENDING"
+    FAILED = "FAILED"
 
 
 class ItemStatusType(StrEnum):
@@ -22,12 +24,15 @@ class ItemStatusType(StrEnum):
     PENDING = "PENDING"
     SHIPPED = "SHIPPED"
     PROCESSING = "PROCESSING"
+    PURCHASED = "PURCHASED"
+    FAILED = "FAILED"
 
 
 class PaymentStatusType(StrEnum):
     SUCCESSFUL = "SUCCESSFUL"
     FAILED = "FAILED"
     PENDING = "PENDING"
+    REFUNDED = "REFUNDED"
 
 
 class PaymentMethodType(StrEnum):
@@ -43,6 +48,7 @@ class GenderType(StrEnum):
     MALE = "MALE"
     FEMALE = "FEMALE"
     UNKNOWN = "UNKNOWN"
+    OTHER = "OTHER"
 
 
 class CustomerType(StrEnum):
@@ -54,6 +60,8 @@ class ProvisioningStatusType(StrEnum):
     ACTIVE = "ACTIVE"
     INACTIVE = "INACTIVE"
     PENDING = "PENDING"
+    SUSPENDED = "SUSPENDED"
+    DEACTIVATED = "DEACTIVATED"
 
 
 class ProvisioningTypeType(StrEnum):
@@ -66,12 +74,15 @@ class ContactMethodType(StrEnum):
     SMS = "SMS"
     EMAIL = "EMAIL"
     CALL = "CALL"
+    PHONE = "PHONE"
 
 
 class OrderItemType(StrEnum):
     PHYSICAL = "PHYSICAL"
     DIGITAL_SERVICE = "DIGITAL_SERVICE"
     DIGITAL = "DIGITAL"
+    INSTALLATION = "INSTALLATION"
+    MAINTENANCE = "MAINTENANCE"
 
 
 class SortOrderByType(StrEnum):
@@ -82,3 +93,8 @@ class SortOrderByType(StrEnum):
     NATIONAL_ID = "nationalId"
     MOBILE = "mobile"
     EMAIL = "email"
+
+
+class ReadConsistencyType(StrEnum):
+    EVENTUAL = "eventual"
+    STRONG = "strong"
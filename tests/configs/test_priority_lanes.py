@@ -0,0 +1,40 @@
+import pytest
+
+from src.configs.config import PriorityLanesConfig
+from src.configs.priority_lanes import BULK_LANE, INTERACTIVE_LANE, classify_request
+
+
+def scope(path: str, query: str = "", headers: dict[str, str] | None = None) -> dict:
+    return {
+        "type": "http",
+        "path": path,
+        "query_string": query.encode(),
+        "headers": [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()],
+    }
+
+
+@pytest.mark.parametrize(
+    ("path", "query", "lane"),
+    [
+        ("/api/v1/orders/orders/ORD-1", "", INTERACTIVE_LANE),
+        ("/api/v1/orders/orders", "page=2&size=20", INTERACTIVE_LANE),
+        ("/api/v1/orders/orders/export", "", BULK_LANE),
+        ("/api/v1/orders/orders/facets", "status=SHIPPED", BULK_LANE),
+        ("/api/v1/analytics/revenue", "", BULK_LANE),
+        ("/api/v1/orders/orders", "page=20", BULK_LANE),
+        ("/api/v1/orders/orders", "size=100", BULK_LANE),
+        ("/api/v1/orders/orders", "page=abc&size=", INTERACTIVE_LANE),
+    ],
+)
+def test_requests_are_classified_by_path_and_page(path, query, lane):
+    assert classify_request(scope(path, query), PriorityLanesConfig()) == lane
+
+
+def test_known_batch_clients_run_in_the_bulk_lane():
+    config = PriorityLanesConfig(BULK_CLIENT_IDS=["nightly-sync"])
+
+    def lane(client_id: str) -> str:
+        return classify_request(scope("/api/v1/orders/orders/ORD-1", headers={"X-Client-Id": client_id}), config)
+
+    assert lane("nightly-sync") == BULK_LANE
+    assert lane("checkout") == INTERACTIVE_LANE
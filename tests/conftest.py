@@ -0,0 +1,95 @@
+from typing import Any
+
+import pytest
+
+
+class FakeMessage:
+    """
+    A consumed Kafka message with the accessors of confluent_kafka.Message.
+    """
+
+    def __init__(
+        self,
+        value: bytes | None,
+        offset: int,
+        partition: int = 0,
+        topic: str = "order.events.v1",
+        key: bytes | None = None,
+        headers: list[tuple[str, bytes]] | None = None,
+        error: Any = None,
+    ):
+        self._value = value
+        self._offset = offset
+        self._partition = partition
+        self._topic = topic
+        self._key = key
+        self._headers = headers
+        self._error = error
+
+    def value(self) -> bytes | None:
+        return self._value
+
+    def offset(self) -> int:
+        return self._offset
+
+    def partition(self) -> int:
+        return self._partition
+
+    def topic(self) -> str:
+        return self._topic
+
+    def key(self) -> bytes | None:
+        return self._key
+
+    def headers(self) -> list[tuple[str, bytes]] | None:
+        return self._headers
+
+    def error(self) -> Any:
+        return self._error
+
+
+class FakeProducer:
+    """
+    Records produced messages and acknowledges all of them on flush.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        self.produced: list[dict[str, Any]] = []
+
+    def produce(self, topic: str, on_delivery: Any = None, **kwargs: Any) -> None:
+        self.produced.append({"topic": topic, **kwargs})
+        if on_delivery is not None:
+            on_delivery(None, None)
+
+    def flush(self, timeout: float | None = None) -> int:
+        return 0
+
+
+@pytest.fixture
+def make_message():
+    return FakeMessage
+
+
+@pytest.fixture
+def fake_producer():
+    return FakeProducer()
+
+
+@pytest.fixture
+def order_document():
+    """
+    Builds a decoded order event in the indexed ``{"order": ...}`` shape.
+    """
+
+    def build(order_id: str = "ORD-1", **fields: Any) -> dict[str, Any]:
+        order = {
+            "orderId": order_id,
+            "status": "CONFIRMED",
+            "channel": "ONLINE_WEB",
+            "createdAt": "2025-08-01T10:00:00+00:00",
+            "updatedAt": "2025-08-01T10:00:00+00:00",
+            **fields,
+        }
+        return {"order": order}
+
+    return build
@@ -0,0 +1,79 @@
+from typing import Any
+
+import pytest
+from confluent_kafka.schema_registry.error import SchemaRegistryError
+
+from src.configs.config import OrderAnalyticsConfig, OrderIndexerConfig
+from src.consumers.order import order_analytics_loader, order_dead_letters
+from src.consumers.order.order_analytics_loader import OrderAnalyticsLoader
+
+
+class FakeStore:
+    def __init__(self, *args: Any):
+        self.rows: list[tuple[dict[str, Any], int]] = []
+
+    def write_batch(self, rows: list[tuple[dict[str, Any], int]]) -> None:
+        self.rows.extend(rows)
+
+    def apply_batch(self, rows: list[tuple[dict[str, Any], int]]) -> None:
+        self.rows.extend(rows)
+
+
+class FakeConsumer:
+    def __init__(self, *args: Any):
+        self.commits = 0
+
+    def commit(self, asynchronous: bool = True) -> None:
+        self.commits += 1
+
+
+class FakeDecoder:
+    def __init__(self, documents: dict[bytes, dict[str, Any]], error: Exception | None = None):
+        self.documents = documents
+        self.error = error
+
+    def decode_batch(self, payloads, on_error=None):
+        documents = []
+        for position, payload in enumerate(payloads):
+            if self.error is not None:
+                raise self.error
+            if payload in self.documents:
+                documents.append(self.documents[payload])
+            else:
+                on_error(position, ValueError("Unknown magic byte 1"))
+                documents.append(None)
+        return documents
+
+
+@pytest.fixture
+def loader(monkeypatch, fake_producer):
+    monkeypatch.setattr(order_analytics_loader, "OrderAnalyticsDuckDBAdapter", FakeStore)
+    monkeypatch.setattr(order_analytics_loader, "OrderRollupSQLiteAdapter", FakeStore)
+    monkeypatch.setattr(order_analytics_loader, "Consumer", FakeConsumer)
+    monkeypatch.setattr(order_analytics_loader, "SchemaRegistryClient", lambda config: None)
+    monkeypatch.setattr(order_dead_letters, "Producer", lambda config: fake_producer)
+    return OrderAnalyticsLoader(OrderAnalyticsConfig(), OrderIndexerConfig())
+
+
+def test_undecodable_events_are_dead_lettered_before_the_commit(loader, make_message, order_document):
+    loader.decoder = FakeDecoder({b"a": order_document("ORD-1")})
+
+    loader._process_batch([make_message(b"\x01garbage", offset=4), make_message(b"a", offset=5)])
+
+    assert loader.store.rows == [(order_document("ORD-1")["order"], 5)]
+    [letter] = loader.dead_letters.producer.produced
+    headers = dict(letter["headers"])
+    assert letter["topic"] == "dlq-analytics-orders"
+    assert headers["__connect.errors.connector.name"] == loader.config.GROUP_ID
+    assert headers["__connect.errors.offset"] == "4"
+    assert loader.consumer.commits == 1
+
+
+def test_registry_outages_stop_the_loader_without_committing(loader, make_message):
+    loader.decoder = FakeDecoder({}, error=SchemaRegistryError(503, 50301, "unavailable"))
+
+    with pytest.raises(SchemaRegistryError):
+        loader._process_batch([make_message(b"a", offset=5)])
+
+    assert loader.dead_letters.producer.produced == []
+    assert loader.consumer.commits == 0
@@ -0,0 +1,123 @@
+from typing import Any
+
+import pytest
+
+from src.configs.config import OrderIndexerConfig
+from src.consumers.order import order_dead_letters, order_indexer
+from src.consumers.order.order_indexer import OrderIndexerWorker
+
+
+class FakeDecoder:
+    def __init__(self, documents: dict[bytes, dict[str, Any]]):
+        self.documents = documents
+
+    def decode(self, payload: bytes) -> dict[str, Any]:
+        if payload not in self.documents:
+            raise ValueError("Unknown magic byte 1, payload is not Confluent-framed Avro")
+        return self.documents[payload]
+
+
+class FakeBulk:
+    """
+    Answers each bulk call with the next list of failed items, recording the attempted order IDs.
+    """
+
+    def __init__(self, *responses: list[dict[str, Any]]):
+        self.responses = list(responses)
+        self.calls: list[list[str]] = []
+
+    def __call__(self, client: Any, actions: Any, **kwargs: Any) -> tuple[int, list[dict[str, Any]]]:
+        actions = list(actions)
+        self.calls.append([action["_id"] for action in actions])
+        errors = self.responses.pop(0) if self.responses else []
+        return len(actions) - len(errors), errors
+
+
+def failed_item(order_id: str, status: int, index: str = "orders-v1-2025-08-000001") -> dict[str, Any]:
+    return {"index": {"_index": index, "_id": order_id, "status": status, "error": {"type": "test"}}}
+
+
+@pytest.fixture
+def worker(monkeypatch, fake_producer):
+    monkeypatch.setattr(order_indexer, "Consumer", lambda config: None)
+    monkeypatch.setattr(order_dead_letters, "Producer", lambda config: fake_producer)
+    monkeypatch.setattr(order_indexer, "SchemaRegistryClient", lambda config: None)
+    monkeypatch.setattr(order_indexer.time, "sleep", lambda seconds: None)
+    config = OrderIndexerConfig(BULK_MAX_RETRIES=2, BULK_RETRY_BACKOFF_SECONDS=0)
+    return OrderIndexerWorker(0, config, "http://localhost:9200")
+
+
+def test_transient_failures_are_retried_before_offsets_are_recorded(worker, monkeypatch, make_message, order_document):
+    worker.decoder = FakeDecoder({b"a": order_document("ORD-1"), b"b": order_document("ORD-2")})
+    fake_bulk = FakeBulk([failed_item("ORD-2", 429)], [])
+    monkeypatch.setattr(order_indexer, "bulk", fake_bulk)
+
+    worker._process_batch([make_message(b"a", offset=10), make_message(b"b", offset=11)])
+
+    assert fake_bulk.calls == [["ORD-1", "ORD-2"], ["ORD-2"]]
+    assert worker._pending_offsets == {("order.events.v1", 0): 12}
+    assert worker.dead_letters.producer.produced == []
+
+
+def test_persistent_transient_failures_leave_offsets_uncommitted(worker, monkeypatch, make_message, order_document):
+    worker.decoder = FakeDecoder({b"a": order_document("ORD-1")})
+    monkeypatch.setattr(order_indexer, "bulk", FakeBulk(*[[failed_item("ORD-1", 503)]] * 3))
+
+    with pytest.raises(RuntimeError):
+        worker._process_batch([make_message(b"a", offset=10)])
+
+    assert worker._pending_offsets == {}
+
+
+def test_rejected_documents_are_dead_lettered_with_connect_headers(worker, monkeypatch, make_message, order_document):
+    worker.decoder = FakeDecoder({b"a": order_document("ORD-1")})
+    monkeypatch.setattr(order_indexer, "bulk", FakeBulk([failed_item("ORD-1", 400)]))
+
+    worker._process_batch([make_message(b"a", offset=7, partition=3)])
+
+    [letter] = worker.dead_letters.producer.produced
+    headers = dict(letter["headers"])
+    assert letter["topic"] == worker.config.DLQ_TOPIC
+    assert letter["value"] == b"a"
+    assert headers["__connect.errors.connector.name"] == worker.config.GROUP_ID
+    assert headers["__connect.errors.stage"] == "TASK_PUT"
+    assert headers["__connect.errors.exception.class.name"] == "ElasticsearchStatus400"
+    assert headers["__connect.errors.offset"] == "7"
+    assert worker._pending_offsets == {("order.events.v1", 3): 8}
+
+
+def test_version_conflicts_are_neither_retried_nor_dead_lettered(worker, monkeypatch, make_message, order_document):
+    worker.decoder = FakeDecoder({b"a": order_document("ORD-1")})
+    fake_bulk = FakeBulk([failed_item("ORD-1", 409)])
+    monkeypatch.setattr(order_indexer, "bulk", fake_bulk)
+
+    worker._process_batch([make_message(b"a", offset=5)])
+
+    assert len(fake_bulk.calls) == 1
+    assert worker.dead_letters.producer.produced == []
+    assert worker._pending_offsets == {("order.events.v1", 0): 6}
+
+
+def test_undecodable_events_are_dead_lettered_and_tombstones_skipped(worker, monkeypatch, make_message, order_document):
+    worker.decoder = FakeDecoder({b"a": order_document("ORD-1")})
+    fake_bulk = FakeBulk()
+    monkeypatch.setattr(order_indexer, "bulk", fake_bulk)
+
+    worker._process_batch(
+        [make_message(b"\x01garbage", offset=1), make_message(None, offset=2), make_message(b"a", offset=3)],
+    )
+
+    [letter] = worker.dead_letters.producer.produced
+    assert dict(letter["headers"])["__connect.errors.stage"] == "VALUE_CONVERTER"
+    assert fake_bulk.calls == [["ORD-1"]]
+    assert worker._pending_offsets == {("order.events.v1", 0): 4}
+
+
+def test_only_the_latest_event_of_an_order_in_a_batch_is_indexed(worker, monkeypatch, make_message, order_document):
+    worker.decoder = FakeDecoder({b"old": order_document("ORD-1"), b"new": order_document("ORD-1", status="SHIPPED")})
+    fake_bulk = FakeBulk()
+    monkeypatch.setattr(order_indexer, "bulk", fake_bulk)
+
+    worker._process_batch([make_message(b"old", offset=1), make_message(b"new", offset=2)])
+
+    assert fake_bulk.calls == [["ORD-1"]]
@@ -0,0 +1,49 @@
+import asyncio
+
+from src.configs.config import PriorityLanesConfig
+from src.configs.priority_lanes import BULK_LANE, INTERACTIVE_LANE, current_lane
+from src.middlewares.priority_lane_middleware import PriorityLaneMiddleware
+
+
+def test_bulk_requests_beyond_the_limit_are_rejected_without_blocking_interactive_ones():
+    config = PriorityLanesConfig(BULK_MAX_CONCURRENCY=1, BULK_QUEUE_TIMEOUT_SECONDS=0.05)
+    release = asyncio.Event()
+    lanes: list[str] = []
+
+    async def app(scope, receive, send):
+        lanes.append(current_lane.get())
+        if current_lane.get() == BULK_LANE:
+            await release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = PriorityLaneMiddleware(app, config)
+
+    async def request(path: str) -> list[dict]:
+        scope = {"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": []}
+        messages: list[dict] = []
+
+        async def receive():
+            return {"type": "http.request"}
+
+        async def send(message):
+            messages.append(message)
+
+        await middleware(scope, receive, send)
+        return messages
+
+    async def scenario():
+        first_export = asyncio.create_task(request("/api/v1/orders/orders/export"))
+        await asyncio.sleep(0)
+        second_export = await request("/api/v1/orders/orders/export")
+        lookup = await request("/api/v1/orders/orders/ORD-1")
+        release.set()
+        return await first_export, second_export, lookup
+
+    first_export, second_export, lookup = asyncio.run(scenario())
+
+    assert first_export[0]["status"] == 200
+    assert second_export[0]["status"] == 503
+    assert (b"retry-after", b"1") in second_export[0]["headers"]
+    assert lookup[0]["status"] == 200
+    assert lanes == [BULK_LANE, INTERACTIVE_LANE]
@@ -0,0 +1,101 @@
+import asyncio
+import zlib
+from typing import Any
+
+import pytest
+import zstandard
+
+from src.configs.config import ResponseCompressionConfig
+from src.middlewares.response_compression_middleware import ResponseCompressionMiddleware
+
+LARGE_BODY = b'{"items": [' + b",".join(b'{"orderId": "ORD-%d"}' % i for i in range(200)) + b"]}"
+
+
+def make_app(status: int = 200, chunks: tuple[bytes, ...] = (LARGE_BODY,), headers: dict[str, str] | None = None):
+    response_headers = {"content-type": "application/json", **(headers or {})}
+    if len(chunks) == 1:
+        response_headers["content-length"] = str(len(chunks[0]))
+
+    async def app(scope, receive, send):
+        raw = [(name.encode(), value.encode()) for name, value in response_headers.items()]
+        await send({"type": "http.response.start", "status": status, "headers": raw})
+        for index, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": index < len(chunks) - 1})
+
+    return app
+
+
+def call(app, accept_encoding: str, method: str = "GET") -> tuple[dict[str, str], list[bytes]]:
+    middleware = ResponseCompressionMiddleware(app, ResponseCompressionConfig())
+    scope = {"type": "http", "method": method, "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    messages: list[dict[str, Any]] = []
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(middleware(scope, receive, send))
+    headers = {name.decode(): value.decode() for name, value in messages[0]["headers"]}
+    return headers, [message["body"] for message in messages[1:]]
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "encoding"),
+    [
+        ("gzip, br, zstd", "zstd"),
+        ("gzip;q=1.0, br;q=0.8", "gzip"),
+        ("zstd;q=0, gzip", "gzip"),
+        ("*", "zstd"),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_the_client_preference_wins_and_ties_go_to_the_server_order(accept_encoding, encoding):
+    assert ResponseCompressionMiddleware(None, ResponseCompressionConfig()).negotiate(accept_encoding) == encoding
+
+
+def test_complete_responses_are_compressed_and_their_etag_weakened():
+    headers, [body] = call(make_app(headers={"etag": '"abc"'}), "zstd")
+
+    assert headers["content-encoding"] == "zstd"
+    assert headers["vary"] == "Accept-Encoding"
+    assert headers["etag"] == 'W/"abc"'
+    assert headers["content-length"] == str(len(body))
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(body) == LARGE_BODY
+
+
+def test_weak_etags_are_kept_as_they_are():
+    headers, _ = call(make_app(headers={"etag": 'W/"abc"'}), "gzip")
+
+    assert headers["etag"] == 'W/"abc"'
+
+
+def test_small_responses_are_sent_as_is_but_vary_on_accept_encoding():
+    headers, [body] = call(make_app(chunks=(b'{"ok": true}',), headers={"etag": '"abc"'}), "gzip")
+
+    assert "content-encoding" not in headers
+    assert headers["vary"] == "Accept-Encoding"
+    assert headers["etag"] == '"abc"'
+    assert body == b'{"ok": true}'
+
+
+def test_not_modified_responses_are_never_compressed():
+    headers, _ = call(make_app(status=304, chunks=(b"",), headers={"etag": '"abc"'}), "gzip")
+
+    assert "content-encoding" not in headers
+    assert headers["etag"] == '"abc"'
+
+
+def test_streamed_chunks_can_each_be_decompressed_on_arrival():
+    chunks = (b'{"orderId": "ORD-1"}\n', b'{"orderId": "ORD-2"}\n', b"")
+    headers, bodies = call(make_app(chunks=chunks, headers={"content-type": "application/x-ndjson"}), "gzip")
+
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    assert decompressor.decompress(bodies[0]) == chunks[0]
+    assert decompressor.decompress(bodies[1]) == chunks[1]
+    decompressor.decompress(bodies[2])
+    assert decompressor.eof
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+from bench_order_decoder import SCHEMA_ID, encode_messages
+from confluent_kafka.schema_registry.error import SchemaRegistryError
+from fastavro import parse_schema
+
+from src.models.mappers.order_avro_decoder import ORDER_EVENTS_SCHEMA_PATH, OrderAvroDecoder
+
+
+class FailingRegistry:
+    def __init__(self, status: int):
+        self.status = status
+
+    def get_schema(self, schema_id: int):
+        raise SchemaRegistryError(self.status, self.status * 100, "registry error")
+
+
+@pytest.fixture
+def raw_schema():
+    with open(ORDER_EVENTS_SCHEMA_PATH) as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def payloads(raw_schema):
+    return encode_messages(parse_schema(raw_schema), 2)
+
+
+def test_decode_batch_reports_undecodable_payloads_by_position(raw_schema, payloads):
+    decoder = OrderAvroDecoder()
+    decoder.register_writer_schema(SCHEMA_ID, raw_schema)
+    errors = []
+
+    documents = decoder.decode_batch(
+        [payloads[0], b"\x01\x00\x00\x00\x01garbage", None, payloads[1]],
+        on_error=lambda position, error: errors.append((position, type(error))),
+    )
+
+    assert [document is not None for document in documents] == [True, False, False, True]
+    assert documents[0]["order"]["orderId"] == "ORD-0000000000"
+    assert errors == [(1, ValueError)]
+
+
+def test_decode_batch_treats_a_schema_unknown_to_the_registry_as_undecodable(payloads):
+    decoder = OrderAvroDecoder(FailingRegistry(404))
+    errors = []
+
+    documents = decoder.decode_batch(payloads[:1], on_error=lambda position, error: errors.append(position))
+
+    assert documents == [None]
+    assert errors == [0]
+
+
+def test_decode_batch_raises_registry_outages(payloads):
+    decoder = OrderAvroDecoder(FailingRegistry(503))
+
+    with pytest.raises(SchemaRegistryError):
+        decoder.decode_batch(payloads[:1], on_error=lambda position, error: None)
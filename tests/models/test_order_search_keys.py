@@ -0,0 +1,55 @@
+import pytest
+
+from src.models.mappers.order_search_keys import (
+    build_search_keys,
+    normalize_email,
+    normalize_mobile,
+    normalize_national_id,
+)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "09121234567",
+        "9121234567",
+        "+98 912 123 4567",
+        "0098-912-123-4567",
+        "989121234567",
+        "۰۹۱۲۱۲۳۴۵۶۷",
+        "(0912) 123 4567 ext. 12",
+    ],
+)
+def test_mobile_numbers_typed_any_way_collapse_to_e164(value):
+    assert normalize_mobile(value, country_code="98") == "+989121234567"
+
+
+@pytest.mark.parametrize("value", [None, "", "  ", "n/a"])
+def test_mobile_numbers_without_digits_have_no_key(value):
+    assert normalize_mobile(value, country_code="98") is None
+
+
+def test_emails_are_trimmed_and_lowercased():
+    assert normalize_email("  Jane.Doe@Example.COM ") == "jane.doe@example.com"
+    assert normalize_email("   ") is None
+
+
+def test_national_ids_keep_only_uppercase_letters_and_latin_digits():
+    assert normalize_national_id("۰۰۱-۲۳۴۵۶۷-۸") == "0012345678"
+    assert normalize_national_id("ab 12-34") == "AB1234"
+    assert normalize_national_id("--") is None
+
+
+def test_search_keys_list_only_the_customer_keys_present():
+    order = {
+        "party": {
+            "nationalId": "001-234567-8",
+            "contactPoints": {"mobile": "+98 912 123 4567", "email": None},
+        },
+    }
+
+    keys = build_search_keys(order)
+
+    assert keys["email"] is None
+    assert keys["customerKeys"] == ["mobile:+989121234567", "nationalId:0012345678"]
+    assert build_search_keys({})["customerKeys"] == []
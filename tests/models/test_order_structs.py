@@ -0,0 +1,103 @@
+import copy
+import json
+from datetime import date, datetime
+
+import msgspec
+import pytest
+
+from bench_read_models import build_connector_order, build_es_order
+from src.models.dtos.order.order_domain_interface_dtos import SearchOrdersOutputDTO
+from src.models.dtos.order.order_dto import OrderRoot
+from src.models.dtos.order.order_structs import SearchOrdersResponseStruct, decode_order, encode_response
+
+
+def pydantic_json(document: dict) -> dict:
+    return json.loads(OrderRoot.model_validate(document).model_dump_json(by_alias=True))
+
+
+def struct_json(document: dict) -> dict:
+    return json.loads(msgspec.json.encode(decode_order(copy.deepcopy(document))))
+
+
+def normalize(value):
+    """
+    Parses ISO datetimes, since the two encoders may print fractional seconds differently.
+    """
+    if isinstance(value, dict):
+        return {key: normalize(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [normalize(item) for item in value]
+    if isinstance(value, str) and len(value) >= 20 and value[10:11] == "T":
+        return datetime.fromisoformat(value)
+    return value
+
+
+def without_read_defaults(document: dict) -> dict:
+    """
+    An order indexed before the fields with a read default were required.
+    """
+    del document["channel"]
+    del document["party"]["gender"]
+    del document["priceSummary"]["currency"]
+    for item in document["productOrderItems"]:
+        del item["type"], item["quantity"]
+        for key in ("brand", "model", "category"):
+            del item["attributes"][key]
+    for item in document["serviceOrderItems"]:
+        del item["attributes"]["planType"]
+    return document
+
+
+@pytest.mark.parametrize(
+    "document",
+    [build_es_order(1), build_connector_order(2), without_read_defaults(build_es_order(3))],
+    ids=["indexer", "connector", "read-defaults"],
+)
+def test_structs_decode_and_encode_like_the_pydantic_models(document):
+    model = OrderRoot.model_validate(document)
+
+    assert msgspec.to_builtins(decode_order(copy.deepcopy(document)), builtin_types=(datetime, date)) == model.model_dump(
+        by_alias=True,
+    )
+    assert normalize(struct_json(document)) == normalize(pydantic_json(document))
+
+
+def test_indexer_from_underscore_keys_are_encoded_under_the_avro_name():
+    encoded = struct_json(build_es_order(1))
+
+    assert encoded["auditTrail"][0]["details"] == {"field": "status", "from": "CONFIRMED", "to": "PROCESSING"}
+
+
+def test_read_defaults_are_filled_in():
+    order = decode_order(without_read_defaults(build_es_order(1)))
+
+    assert order.priceSummary.currency == "TRY"
+    assert order.party.gender == "UNKNOWN"
+    assert [(item.type, item.quantity, item.attributes.brand) for item in order.productOrderItems] == [
+        ("PHYSICAL", 1, "Unknown"),
+    ] * 2
+
+
+def test_response_structs_encode_like_the_output_dtos_without_the_etag():
+    documents = [build_es_order(index) for index in range(3)]
+    page = SearchOrdersOutputDTO(
+        total=3,
+        page=1,
+        size=3,
+        total_pages=1,
+        items=[OrderRoot.model_validate(document) for document in documents],
+        etag='"abc"',
+    )
+    struct = SearchOrdersResponseStruct(
+        total=3,
+        page=1,
+        size=3,
+        total_pages=1,
+        items=[decode_order(copy.deepcopy(document)) for document in documents],
+        etag='"abc"',
+    )
+
+    encoded = json.loads(encode_response(struct))
+
+    assert "etag" not in encoded
+    assert normalize(encoded) == normalize(json.loads(page.model_dump_json(by_alias=True)))
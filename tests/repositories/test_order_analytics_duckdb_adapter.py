@@ -0,0 +1,53 @@
+import asyncio
+import time
+from datetime import date, datetime
+
+import pytest
+
+from src.configs.config import OrderAnalyticsConfig
+from src.models.dtos.analytics.order_analytics_repository_interface_dtos import RevenueQueryDTO
+from src.models.repositories.analytics.adapters.order_analytics_duckdb_adapter import OrderAnalyticsDuckDBAdapter
+
+
+@pytest.fixture
+def adapter(tmp_path, monkeypatch):
+    # A server east of UTC; buckets and date filters must still follow UTC days.
+    monkeypatch.setenv("TZ", "Asia/Tehran")
+    time.tzset()
+    yield OrderAnalyticsDuckDBAdapter(OrderAnalyticsConfig(DATA_PATH=str(tmp_path)))
+    monkeypatch.undo()
+    time.tzset()
+
+
+def priced(order_document, order_id: str, created_at: str, amount: int, **fields):
+    price_summary = {"totalAmount": amount, "discountAmount": 0, "payableAmount": amount, "currency": "IRR"}
+    return order_document(order_id, createdAt=created_at, priceSummary=price_summary, **fields)["order"]
+
+
+def test_revenue_is_bucketed_by_utc_day_on_the_latest_order_version(adapter, order_document):
+    adapter.write_batch(
+        [
+            (priced(order_document, "ORD-1", "2025-08-01T23:30:00Z", 100), 1),
+            (priced(order_document, "ORD-1", "2025-08-01T23:30:00Z", 150), 2),
+            (priced(order_document, "ORD-2", "2025-08-02T00:30:00Z", 70), 3),
+            (priced(order_document, "ORD-3", "2025-08-02T01:00:00Z", 999, status="CANCELLED"), 4),
+        ],
+    )
+
+    response = asyncio.run(adapter.revenue(RevenueQueryDTO(from_date=date(2025, 8, 1), to_date=date(2025, 8, 2))))
+
+    assert [(bucket.bucket, bucket.orders, bucket.payable_amount) for bucket in response.buckets] == [
+        (datetime(2025, 8, 1), 1, 150),
+        (datetime(2025, 8, 2), 1, 70),
+    ]
+
+
+def test_compaction_keeps_only_the_latest_order_versions(adapter, order_document):
+    adapter.write_batch([(priced(order_document, "ORD-1", "2025-08-01T10:00:00Z", 100), 1)])
+    adapter.write_batch([(priced(order_document, "ORD-1", "2025-08-01T10:00:00Z", 150), 2)])
+
+    adapter.compact("2025-08")
+
+    [order_file] = (adapter.data_path / "orders" / "created_month=2025-08").glob("*.parquet")
+    rows = adapter._connect().execute(f"SELECT order_id, version FROM '{order_file.as_posix()}'").fetchall()
+    assert rows == [("ORD-1", 2)]
@@ -0,0 +1,98 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from src.configs.config import OrderRecentTierConfig
+from src.models.dtos.order.order_repository_interface_dtos import SearchOrdersQueryDTO
+from src.models.repositories.order.adapters.order_elastic_adapter import OrderElasticAdapter
+from src.models.types.base_dtos import SortType
+
+
+class FakeElasticClient:
+    """
+    Answers searches with a fixed total per index and counts with a fixed count, recording every call.
+    """
+
+    def __init__(self, totals: dict[str, int], count: int = 0):
+        self.totals = totals
+        self.count_value = count
+        self.searches: list[tuple[str, dict[str, Any]]] = []
+        self.counts: list[str] = []
+        self.client = self
+
+    async def search(self, index: str, query: dict[str, Any]) -> dict[str, Any]:
+        self.searches.append((index, query))
+        return {"hits": {"total": {"value": self.totals.get(index, 0)}, "hits": []}}
+
+    async def count(self, index: str, query: dict[str, Any]) -> dict[str, Any]:
+        self.counts.append(index)
+        return {"count": self.count_value}
+
+
+@pytest.fixture
+def make_adapter():
+    def build(client: FakeElasticClient) -> OrderElasticAdapter:
+        adapter = OrderElasticAdapter(client, index_name="orders-read", use_canonical_keys=True)
+        adapter.recent_tier = OrderRecentTierConfig(IS_ENABLED=True, INDEX_NAME="orders-recent", RETENTION_DAYS=30)
+        return adapter
+
+    return build
+
+
+def utc_day(days_ago: int) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days_ago)).date().isoformat()
+
+
+def test_date_filters_inside_the_utc_window_are_answered_by_the_recent_index(make_adapter):
+    adapter = make_adapter(FakeElasticClient({}))
+
+    assert adapter._recent_tier_route(SearchOrdersQueryDTO(order_date=utc_day(0))) == "recent_only"
+    assert adapter._recent_tier_route(SearchOrdersQueryDTO(order_date=utc_day(29))) == "recent_only"
+    assert adapter._recent_tier_route(SearchOrdersQueryDTO(order_date=utc_day(30))) is None
+    assert adapter._recent_tier_route(SearchOrdersQueryDTO(order_date="not-a-date")) is None
+
+
+def test_unbounded_searches_go_recent_first_only_when_sorted_newest_first(make_adapter):
+    adapter = make_adapter(FakeElasticClient({}))
+
+    assert adapter._recent_tier_route(SearchOrdersQueryDTO()) == "recent_first"
+    assert adapter._recent_tier_route(SearchOrdersQueryDTO(sort_order=SortType.ASC)) is None
+
+
+def test_a_page_the_recent_index_fills_is_served_from_it_with_the_full_count(make_adapter):
+    client = FakeElasticClient({"orders-recent": 20}, count=5000)
+    adapter = make_adapter(client)
+    input_dto = SearchOrdersQueryDTO(page=2, size=10)
+
+    _, total = asyncio.run(adapter._search_tiered(input_dto, adapter._build_search_query(input_dto)))
+
+    assert total == 5000
+    assert [(index, query["track_total_hits"]) for index, query in client.searches] == [("orders-recent", 20)]
+    assert client.counts == ["orders-read"]
+
+
+def test_a_page_past_the_recent_index_falls_back_without_counting_twice(make_adapter):
+    client = FakeElasticClient({"orders-recent": 15}, count=5000)
+    adapter = make_adapter(client)
+    input_dto = SearchOrdersQueryDTO(page=2, size=10)
+
+    _, total = asyncio.run(adapter._search_tiered(input_dto, adapter._build_search_query(input_dto)))
+
+    assert total == 5000
+    assert [index for index, _ in client.searches] == ["orders-recent", "orders-read"]
+    assert client.counts == ["orders-read"]
+
+
+def test_the_page_etag_probe_is_routed_like_the_search(make_adapter):
+    client = FakeElasticClient({"orders-recent": 3, "orders-read": 50})
+    adapter = make_adapter(client)
+    input_dto = SearchOrdersQueryDTO(order_date=utc_day(1))
+
+    etag = asyncio.run(adapter.get_search_page_etag(input_dto))
+    page = asyncio.run(adapter.search_orders(input_dto))
+
+    assert [index for index, _ in client.searches] == ["orders-recent", "orders-recent"]
+    assert client.searches[0][1]["_source"] is False
+    assert etag == page.etag
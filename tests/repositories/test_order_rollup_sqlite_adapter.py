@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from src.configs.config import OrderAnalyticsConfig
+from src.models.dtos.analytics.order_analytics_repository_interface_dtos import RollupQueryDTO
+from src.models.repositories.analytics.adapters.order_rollup_sqlite_adapter import OrderRollupSQLiteAdapter
+from src.models.types.analytics_types import AnalyticsIntervalType
+
+
+@pytest.fixture
+def adapter(tmp_path):
+    return OrderRollupSQLiteAdapter(OrderAnalyticsConfig(ROLLUP_DATABASE_PATH=str(tmp_path / "rollups.sqlite3")))
+
+
+@pytest.fixture
+def order(order_document):
+    def build(order_id: str = "ORD-1", amount: int = 100, **fields):
+        price_summary = {"totalAmount": amount, "discountAmount": 0, "payableAmount": amount, "currency": "IRR"}
+        return order_document(order_id, priceSummary=price_summary, **fields)["order"]
+
+    return build
+
+
+def rollup_rows(adapter: OrderRollupSQLiteAdapter, **query) -> list[tuple[str, int, int]]:
+    response = asyncio.run(adapter.rollups(RollupQueryDTO(**query)))
+    return [(bucket.status, bucket.orders, bucket.payable_amount) for bucket in response.buckets]
+
+
+def test_a_status_change_moves_the_order_between_rollup_rows(adapter, order):
+    adapter.apply_batch([(order(status="CONFIRMED"), 1)])
+    adapter.apply_batch([(order(status="SHIPPED", amount=120), 2)])
+
+    assert rollup_rows(adapter) == [("SHIPPED", 1, 120)]
+
+
+def test_changes_within_one_batch_are_netted(adapter, order):
+    changed = adapter.apply_batch(
+        [(order(status="CONFIRMED"), 1), (order(status="SHIPPED"), 2), (order("ORD-2", status="SHIPPED"), 3)],
+    )
+
+    assert changed == 2
+    assert rollup_rows(adapter) == [("SHIPPED", 2, 200)]
+
+
+def test_stale_and_redelivered_versions_are_ignored(adapter, order):
+    adapter.apply_batch([(order(status="SHIPPED", amount=120), 5)])
+
+    changed = adapter.apply_batch([(order(status="CONFIRMED"), 4), (order(status="SHIPPED", amount=120), 5)])
+
+    assert changed == 0
+    assert rollup_rows(adapter) == [("SHIPPED", 1, 120)]
+
+
+def test_hourly_rows_are_summed_per_requested_interval(adapter, order):
+    adapter.apply_batch(
+        [
+            (order("ORD-1", createdAt="2025-08-01T10:15:00Z"), 1),
+            (order("ORD-2", createdAt="2025-08-01T18:45:00Z"), 2),
+            (order("ORD-3", createdAt="2025-08-02T00:05:00Z"), 3),
+        ],
+    )
+
+    assert rollup_rows(adapter) == [("CONFIRMED", 1, 100)] * 3
+    assert rollup_rows(adapter, interval=AnalyticsIntervalType.DAY) == [("CONFIRMED", 2, 200), ("CONFIRMED", 1, 100)]
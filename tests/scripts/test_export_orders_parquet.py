@@ -0,0 +1,77 @@
+from pathlib import Path
+
+import duckdb
+import pyarrow.parquet as pq
+
+from export_orders_parquet import PartitionedParquetWriter, discard_run, publish_files
+from src.models.mappers.order_analytics_mapper import to_export_rows
+
+
+def make_writer(output: Path, run_id: str = "run1", max_open_files: int = 8) -> PartitionedParquetWriter:
+    return PartitionedParquetWriter(output, f"part-{run_id}-000", 100, 1000, max_open_files)
+
+
+def export(writer: PartitionedParquetWriter, order: dict) -> None:
+    writer.write(("2025-08", order["status"]), to_export_rows(order))
+
+
+def published(output: Path) -> list[Path]:
+    return sorted(output.glob("created_month=*/status=*/*.parquet"))
+
+
+def test_files_are_only_visible_once_published(tmp_path, order_document):
+    writer = make_writer(tmp_path)
+    export(writer, order_document("ORD-1")["order"])
+    export(writer, order_document("ORD-2", status="SHIPPED")["order"])
+
+    files = writer.close()
+
+    assert published(tmp_path) == []
+    publish_files(files)
+    assert [path.parent.name for path in published(tmp_path)] == ["status=CONFIRMED", "status=SHIPPED"]
+    assert sum(pq.read_metadata(path).num_rows for path in published(tmp_path)) == 2
+    assert list(tmp_path.rglob("*.tmp")) == []
+
+
+def test_abort_deletes_every_file_of_the_writer(tmp_path, order_document):
+    writer = make_writer(tmp_path, max_open_files=1)
+    export(writer, order_document("ORD-1")["order"])
+    export(writer, order_document("ORD-2", status="SHIPPED")["order"])
+    # With one open file, the second partition closes the first one's file.
+    writer._flush(("2025-08", "CONFIRMED"))
+    writer._flush(("2025-08", "SHIPPED"))
+    assert len(writer.files) == 1
+
+    writer.abort()
+
+    assert writer.files == []
+    assert list(tmp_path.rglob("*.tmp")) == []
+
+
+def test_discard_run_keeps_the_files_of_other_runs(tmp_path, order_document):
+    for run_id in ("run1", "run2"):
+        writer = make_writer(tmp_path, run_id)
+        export(writer, order_document("ORD-1")["order"])
+        writer.close()
+
+    discard_run(tmp_path, "run2")
+
+    assert [path.name for path in tmp_path.rglob("*.tmp")] == ["part-run1-000-00001.tmp"]
+
+
+def test_readers_keep_the_latest_rows_of_orders_exported_by_several_runs(tmp_path, order_document):
+    for run_id, order in (
+        ("run1", order_document("ORD-1", updatedAt="2025-08-01T10:00:00Z")["order"]),
+        ("run2", order_document("ORD-1", status="SHIPPED", updatedAt="2025-08-02T10:00:00Z")["order"]),
+    ):
+        writer = make_writer(tmp_path, run_id)
+        export(writer, order)
+        publish_files(writer.close())
+
+    rows = duckdb.sql(
+        f"""
+        SELECT order_id, status FROM read_parquet('{tmp_path.as_posix()}/*/*/*.parquet', hive_partitioning = true)
+        QUALIFY updated_at = max(updated_at) OVER (PARTITION BY order_id)
+        """,
+    ).fetchall()
+    assert rows == [("ORD-1", "SHIPPED")]
@@ -0,0 +1,62 @@
+from collections import Counter
+from typing import Any
+
+from replay_orders import index_month, read_actions
+
+
+class FakeConsumer:
+    def __init__(self, messages: list[Any]):
+        self.messages = messages
+        self.paused: list[Any] = []
+
+    def consume(self, num_messages: int, timeout: float) -> list[Any]:
+        batch, self.messages = self.messages[:num_messages], self.messages[num_messages:]
+        return batch
+
+    def pause(self, partitions: list[Any]) -> None:
+        self.paused.extend(partitions)
+
+
+class FakeDecoder:
+    def __init__(self, documents: dict[bytes, dict[str, Any]]):
+        self.documents = documents
+
+    def decode_batch(self, payloads):
+        return [self.documents.get(payload) if payload is not None else None for payload in payloads]
+
+
+def test_index_month_is_read_from_monthly_index_names():
+    assert index_month("orders-v1-2025-08-000001") == "2025-08"
+    assert index_month("orders-v1-2025-08") == "2025-08"
+    assert index_month("orders-v1") is None
+
+
+def test_only_orders_created_in_the_target_month_are_replayed(make_message, order_document):
+    decoder = FakeDecoder(
+        {
+            b"aug": order_document("ORD-1", createdAt="2025-08-31T23:00:00Z"),
+            b"sep": order_document("ORD-2", createdAt="2025-09-01T01:00:00Z"),
+            b"naive": order_document("ORD-3", createdAt="2025-08-15T12:00:00"),
+        },
+    )
+    consumer = FakeConsumer(
+        [make_message(b"aug", offset=0), make_message(b"sep", offset=1), make_message(b"naive", offset=2)],
+    )
+    other_months: Counter = Counter()
+
+    actions = list(
+        read_actions(consumer, decoder, "orders-v1-2025-08-000001", {0: 3}, {0}, 10, "2025-08", other_months),
+    )
+
+    assert [action["_id"] for action in actions] == ["ORD-1", "ORD-3"]
+    assert {action["_index"] for action in actions} == {"orders-v1-2025-08-000001"}
+    assert other_months == {"2025-09": 1}
+
+
+def test_every_month_is_replayed_without_a_target_month(make_message, order_document):
+    decoder = FakeDecoder({b"sep": order_document("ORD-2", createdAt="2025-09-01T01:00:00Z")})
+    consumer = FakeConsumer([make_message(b"sep", offset=0), make_message(None, offset=1)])
+
+    actions = list(read_actions(consumer, decoder, "orders-v1", {0: 2}, {0}, 10))
+
+    assert [action["_id"] for action in actions] == ["ORD-2"]
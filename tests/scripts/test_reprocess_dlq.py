@@ -0,0 +1,98 @@
+from argparse import Namespace
+from typing import Any
+
+import pytest
+
+import reprocess_dlq
+from reprocess_dlq import MALFORMED, MAPPING, TRANSIENT, DeadLetter, DlqReprocessor, classify
+from src.configs.config import settings
+
+
+class FakeStreamingBulk:
+    """
+    Answers each bulk call with one result per action, taking the status of each order from the next response.
+    """
+
+    def __init__(self, *responses: dict[str, int]):
+        self.responses = list(responses)
+        self.calls: list[list[dict[str, Any]]] = []
+
+    def __call__(self, client: Any, actions: Any, **kwargs: Any):
+        actions = list(actions)
+        self.calls.append(actions)
+        statuses = self.responses.pop(0) if self.responses else {}
+        for action in actions:
+            status = statuses.get(action["_id"], 200)
+            item = {"_id": action["_id"], "status": status, "result": "updated"}
+            if status >= 400:
+                item["error"] = {"type": "test"}
+            yield status < 400, {action["_op_type"]: item}
+
+
+@pytest.fixture
+def reprocessor(monkeypatch):
+    monkeypatch.setattr(reprocess_dlq, "Elasticsearch", lambda hosts: None)
+    monkeypatch.setattr(reprocess_dlq, "SchemaRegistryClient", lambda config: None)
+    monkeypatch.setattr(reprocess_dlq, "Consumer", lambda config: None)
+    monkeypatch.setattr(reprocess_dlq.time, "sleep", lambda seconds: None)
+    args = Namespace(index="orders-write", dry_run=False, max_attempts=3, backoff_seconds=0)
+    return DlqReprocessor(args)
+
+
+def dead_letter(make_message, document: dict[str, Any], connector: str = "elasticsearch-sink-orders") -> DeadLetter:
+    headers = {"__connect.errors.connector.name": connector, "__connect.errors.offset": "42"}
+    return DeadLetter(make_message(b"value", offset=0), headers, TRANSIENT, "timeout", document)
+
+
+@pytest.mark.parametrize(
+    ("headers", "category"),
+    [
+        ({"__connect.errors.stage": "VALUE_CONVERTER"}, MALFORMED),
+        ({"__connect.errors.exception.class.name": "org.apache.kafka.common.errors.SerializationException"}, MALFORMED),
+        ({"__connect.errors.exception.message": "Unknown magic byte 1"}, MALFORMED),
+        ({"__connect.errors.exception.message": "strict_dynamic_mapping_exception: [extra]"}, MAPPING),
+        ({"__connect.errors.exception.message": "es_rejected_execution_exception"}, TRANSIENT),
+        ({}, TRANSIENT),
+    ],
+)
+def test_dead_letters_are_classified_by_their_connect_headers(headers, category):
+    assert classify(headers)[0] == category
+
+
+def test_sink_connector_events_are_upserted_by_iso_updated_at(reprocessor, monkeypatch, make_message, order_document):
+    fake_bulk = FakeStreamingBulk()
+    monkeypatch.setattr(reprocess_dlq, "streaming_bulk", fake_bulk)
+    letter = dead_letter(make_message, order_document("ORD-1", updatedAt="2025-08-01T10:00:00"))
+
+    assert reprocessor._retry([letter]) == []
+
+    [[action]] = fake_bulk.calls
+    assert action["_op_type"] == "update"
+    assert action["script"]["params"]["updatedAt"] == 1754042400000
+    assert reprocessor.counts["recovered"] == 1
+
+
+def test_python_indexer_events_keep_their_offset_version(reprocessor, monkeypatch, make_message, order_document):
+    fake_bulk = FakeStreamingBulk()
+    monkeypatch.setattr(reprocess_dlq, "streaming_bulk", fake_bulk)
+    letter = dead_letter(make_message, order_document("ORD-1"), connector=settings.ORDER_INDEXER.GROUP_ID)
+
+    reprocessor._retry([letter])
+
+    [[action]] = fake_bulk.calls
+    assert action["_op_type"] == "index"
+    assert action["_version"] == 42
+
+
+def test_transient_failures_are_retried_and_rejections_returned(reprocessor, monkeypatch, make_message, order_document):
+    fake_bulk = FakeStreamingBulk({"ORD-1": 429, "ORD-2": 400, "ORD-3": 409}, {})
+    monkeypatch.setattr(reprocess_dlq, "streaming_bulk", fake_bulk)
+    letters = [dead_letter(make_message, order_document(order_id)) for order_id in ("ORD-1", "ORD-2", "ORD-3")]
+
+    [rejected] = reprocessor._retry(letters)
+
+    assert rejected.document["order"]["orderId"] == "ORD-2"
+    assert rejected.category == MAPPING
+    assert [[action["_id"] for action in call] for call in fake_bulk.calls] == [["ORD-1", "ORD-2", "ORD-3"], ["ORD-1"]]
+    assert reprocessor.counts["stale"] == 1
+    assert reprocessor.counts["recovered"] == 1